@@ -0,0 +1,7 @@
+"""Offline benchmarks for the HTTP API.
+
+Every backend is replaced by a local stand-in (see `benchmarks.fakes`), so
+the suite needs no Docker daemon, databases or network. Run from backend/:
+
+    uv run --group bench python -m benchmarks.run --compare benchmarks/baseline.json
+"""
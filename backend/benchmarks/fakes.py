@@ -0,0 +1,486 @@
+"""Local stand-ins for every backend, sized by a `Dataset`.
+
+Nothing here touches the network except the moto S3 server, which listens
+on localhost. Each fake implements just the calls the services make.
+"""
+
+import asyncio
+import os
+import re
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import bson
+import fakeredis
+import mongomock
+import psycopg
+from psycopg import sql
+
+
+@dataclass
+class Dataset:
+    """How much of everything the stand-ins hold."""
+
+    containers: int = 20
+    pg_databases: int = 20
+    pg_tables: int = 50
+    mongo_databases: int = 10
+    mongo_collections: int = 20
+    mongo_documents: int = 20
+    buckets: int = 10
+    objects: int = 100
+    qdrant_collections: int = 20
+    redis_keys: int = 1000
+    log_lines: int = 5000
+    # Simulated round trip added to every Postgres and MongoDB call
+    latency_ms: float = 0.0
+
+    @property
+    def latency(self) -> float:
+        return self.latency_ms / 1000
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_s3_server() -> Any:
+    """Start a moto S3 server on localhost and point the MinIO config at it.
+
+    Must run before `config` is imported.
+    """
+    from moto.server import ThreadedMotoServer
+
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    os.environ["MINIO_ENDPOINT"] = f"http://127.0.0.1:{port}"
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    return server
+
+
+def fill_s3(s3: Any, dataset: Dataset) -> None:
+    """Create the dataset's buckets and objects."""
+    for b in range(dataset.buckets):
+        bucket = f"bucket-{b:04d}"
+        s3.create_bucket(Bucket=bucket)
+        for o in range(dataset.objects):
+            s3.put_object(
+                Bucket=bucket, Key=f"prefix-{o % 10}/object-{o:06d}", Body=b"x" * 64
+            )
+
+
+# Docker
+
+
+class _IdleEventStream:
+    """A Docker events stream that yields nothing until closed."""
+
+    def __init__(self) -> None:
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait()
+        return iter(())
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class _FakeDockerAPI:
+    def __init__(self, count: int, log_lines: int) -> None:
+        self._log_lines = log_lines
+        self._rows = [
+            {
+                "Id": f"{i:012x}" + "0" * 52,
+                "Names": [f"/infra-service-{i:04d}"],
+                "ImageID": f"sha256:{i % 5:064x}",
+                "State": "running",
+                "Status": "Up 2 hours (healthy)",
+            }
+            for i in range(count)
+        ]
+
+    def containers(self, all: bool = False, filters: Optional[Dict] = None) -> List:
+        filters = filters or {}
+        rows = self._rows
+        if "id" in filters:
+            rows = [r for r in rows if r["Id"].startswith(filters["id"])]
+        if "name" in filters:
+            rows = [r for r in rows if filters["name"] in r["Names"][0]]
+        return [dict(r) for r in rows]
+
+    def inspect_image(self, image_id: str) -> Dict[str, Any]:
+        return {"RepoTags": [f"infra/image-{image_id[-4:]}:latest"]}
+
+    def events(self, filters: Optional[Dict] = None, decode: bool = False):
+        return _IdleEventStream()
+
+    def logs(
+        self,
+        container: str,
+        stream: bool = False,
+        follow: bool = False,
+        tail: Any = "all",
+        timestamps: bool = False,
+        **kwargs,
+    ):
+        """A Postgres-like log: `log_lines` of history, then a line every 0.1s."""
+        count = self._log_lines if tail == "all" else min(tail, self._log_lines)
+        i = self._log_lines - count
+        while i < self._log_lines or follow:
+            level = "ERROR" if i % 50 == 0 else "LOG"
+            line = f"{level}:  statement: SELECT {i} FROM pg_stat_activity\n"
+            if timestamps:
+                line = f"2024-01-01T00:00:{i % 60:02d}.000000000Z {line}"
+            yield line.encode()
+            i += 1
+            if follow and i >= self._log_lines:
+                time.sleep(0.1)
+
+    def stats(self, container: str, stream: bool = True, decode: bool = False):
+        """One synthetic sample a second with steadily growing counters."""
+        tick = 0
+        while True:
+            tick += 1
+            yield {
+                "read": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "cpu_stats": {
+                    "cpu_usage": {"total_usage": tick * 50_000_000},
+                    "system_cpu_usage": tick * 4_000_000_000,
+                    "online_cpus": 4,
+                },
+                "memory_stats": {
+                    "usage": 64 * 2**20,
+                    "limit": 2 * 2**30,
+                    "stats": {"inactive_file": 16 * 2**20},
+                },
+                "networks": {
+                    "eth0": {"rx_bytes": tick * 2048, "tx_bytes": tick * 1024}
+                },
+                "blkio_stats": {
+                    "io_service_bytes_recursive": [
+                        {"op": "read", "value": tick * 4096},
+                        {"op": "write", "value": tick * 8192},
+                    ]
+                },
+                "pids_stats": {"current": 12},
+            }
+            time.sleep(1)
+
+
+class FakeDockerClient:
+    """Docker client with `count` running infra containers."""
+
+    def __init__(self, count: int, log_lines: int) -> None:
+        self.api = _FakeDockerAPI(count, log_lines)
+
+
+# Redis
+
+
+class FakeRedis(fakeredis.FakeAsyncRedis):
+    """fakeredis with the INFO fields the dashboard reads."""
+
+    async def info(self, section: Optional[str] = None, *args, **kwargs):
+        keys = await self.dbsize()
+        if section == "keyspace":
+            return {"db0": {"keys": keys, "expires": 0, "avg_ttl": 0}} if keys else {}
+        return {
+            "redis_version": "7.4.0",
+            "uptime_in_days": 1,
+            "used_memory": keys * 100,
+            "used_memory_human": f"{keys * 100 / 1024:.2f}K",
+            "connected_clients": 1,
+        }
+
+
+async def fill_redis(server: fakeredis.FakeServer, dataset: Dataset) -> None:
+    r = FakeRedis(server=server)
+    async with r.pipeline(transaction=False) as pipe:
+        for i in range(dataset.redis_keys):
+            pipe.set(f"app-{i % 10}:key:{i}", "v" * 32)
+        await pipe.execute()
+
+
+# PostgreSQL
+
+
+class FakePostgres:
+    """Answers the catalog queries of `PostgresService` from memory."""
+
+    def __init__(self, dataset: Dataset) -> None:
+        from services import postgres_service as pg
+
+        self._pg = pg
+        self._latency = dataset.latency
+        names = ["main_db"] + [f"db_{i:04d}" for i in range(dataset.pg_databases)]
+        self.databases: Dict[str, List[str]] = {
+            name: [f"table_{t:05d}" for t in range(dataset.pg_tables)] for name in names
+        }
+
+    @asynccontextmanager
+    async def connection(self, dbname: str = "main_db") -> AsyncIterator[Any]:
+        yield _FakePgConnection(self, dbname)
+
+    async def run(self, dbname: str, query: str, params: Any) -> List[tuple]:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        pg = self._pg
+        if query == pg.DATABASES_QUERY:
+            total = len(self.databases)
+            return [
+                (name, True, 8_000_000, "7813 kB", 1, total)
+                for name in sorted(self.databases)
+            ]
+        if query == pg.EXISTING_DATABASES_QUERY:
+            (names,) = params
+            return [(name,) for name in names if name in self.databases]
+        if query == pg.DATABASE_QUERY:
+            (name,) = params
+            if name not in self.databases:
+                return []
+            return [(True, 8_000_000, "7813 kB", 1)]
+        tables = self.databases[dbname]
+        if query == pg.TABLE_COUNT_QUERY:
+            return [(len(tables),)]
+        if query == pg.TABLES_PAGE_QUERY:
+            after, limit = params
+            page = [t for t in tables if t > after][:limit]
+            return [(t, "r", 1000, 65536, "64 kB") for t in page]
+        raise NotImplementedError(f"FakePostgres has no answer for: {query[:60]}")
+
+    async def create(self, statement: sql.Composable) -> None:
+        """CREATE DATABASE, copying the template's tables when cloning."""
+        match = re.match(
+            r'CREATE DATABASE "([^"]+)"(?: TEMPLATE "([^"]+)")?',
+            statement.as_string(None),
+        )
+        name, template = match.groups()
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        if name in self.databases:
+            raise psycopg.errors.DuplicateDatabase(f'database "{name}" exists')
+        self.databases[name] = list(self.databases[template]) if template else []
+
+
+class _FakePgConnection:
+    def __init__(self, server: FakePostgres, dbname: str) -> None:
+        self._server = server
+        self._dbname = dbname
+        self.info = SimpleNamespace(server_version=160000)
+
+    async def execute(self, statement: sql.Composable) -> None:
+        await self._server.create(statement)
+
+    def cursor(self) -> "_FakePgCursor":
+        return _FakePgCursor(self._server, self._dbname)
+
+
+class _FakePgCursor:
+    def __init__(self, server: FakePostgres, dbname: str) -> None:
+        self._server = server
+        self._dbname = dbname
+        self._rows: List[tuple] = []
+
+    async def __aenter__(self) -> "_FakePgCursor":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, query: Any, params: Any = None) -> None:
+        self._rows = await self._server.run(self._dbname, query, params)
+
+    async def fetchall(self) -> List[tuple]:
+        return self._rows
+
+    async def fetchone(self) -> Optional[tuple]:
+        return self._rows[0] if self._rows else None
+
+
+# MongoDB
+
+
+class AsyncMongomock:
+    """The slice of AsyncMongoClient used by `MongoDBService`, over mongomock.
+
+    Collection stats are computed once and kept, since mongomock is far
+    slower at them than the metadata lookups a real server does.
+    """
+
+    def __init__(self, dataset: Dataset) -> None:
+        self._client = mongomock.MongoClient()
+        self._latency = dataset.latency
+        self._stats: Dict[tuple, Dict[str, int]] = {}
+        self.admin = _MongoDatabase(self, self._client["admin"])
+        for d in range(dataset.mongo_databases):
+            db = self._client[f"tenant_{d:04d}"]
+            for c in range(dataset.mongo_collections):
+                db[f"collection_{c:04d}"].insert_many(
+                    [
+                        {"n": n, "payload": "x" * 64}
+                        for n in range(dataset.mongo_documents)
+                    ]
+                )
+
+    async def list_database_names(self) -> List[str]:
+        await self.sleep()
+        return self._client.list_database_names()
+
+    def __getitem__(self, name: str) -> "_MongoDatabase":
+        return _MongoDatabase(self, self._client[name])
+
+    async def drop_database(self, name: str) -> None:
+        await self.sleep()
+        self._client.drop_database(name)
+        self._stats = {k: v for k, v in self._stats.items() if k[0] != name}
+
+    async def sleep(self) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+    def storage_stats(self, collection: Any) -> Dict[str, int]:
+        key = (collection.database.name, collection.name)
+        if key not in self._stats:
+            size = sum(len(bson.encode(doc)) for doc in collection.find())
+            self._stats[key] = {
+                "count": collection.count_documents({}),
+                "size": size,
+                "storageSize": size,
+                "totalIndexSize": 4096,
+                "nindexes": 1,
+            }
+        return self._stats[key]
+
+
+class _MongoDatabase:
+    def __init__(self, client: AsyncMongomock, db: Any) -> None:
+        self._client = client
+        self._db = db
+        self.name = db.name
+
+    async def command(self, name: str, *args, **kwargs) -> Dict[str, Any]:
+        await self._client.sleep()
+        if name == "ping":
+            return {"ok": 1.0}
+        if name == "dbStats":
+            stats = [
+                self._client.storage_stats(self._db[c])
+                for c in self._db.list_collection_names()
+            ]
+            return {
+                "collections": len(stats),
+                "objects": sum(s["count"] for s in stats),
+                "dataSize": sum(s["size"] for s in stats),
+                "storageSize": sum(s["storageSize"] for s in stats),
+                "indexSize": sum(s["totalIndexSize"] for s in stats),
+            }
+        raise NotImplementedError(f"AsyncMongomock has no command {name}")
+
+    async def list_collection_names(self, filter: Optional[Dict] = None) -> List[str]:
+        await self._client.sleep()
+        return self._db.list_collection_names()
+
+    def __getitem__(self, name: str) -> "_MongoCollection":
+        return _MongoCollection(self._client, self._db[name])
+
+
+class _MongoCollection:
+    def __init__(self, client: AsyncMongomock, collection: Any) -> None:
+        self._client = client
+        self._collection = collection
+
+    async def aggregate(self, pipeline: List[Dict[str, Any]]) -> "_AsyncCursor":
+        await self._client.sleep()
+        if pipeline and "$collStats" in pipeline[0]:
+            stats = self._client.storage_stats(self._collection)
+            return _AsyncCursor([{"storageStats": stats}])
+        return _AsyncCursor(list(self._collection.aggregate(pipeline)))
+
+
+class _AsyncCursor:
+    def __init__(self, docs: List[Dict[str, Any]]) -> None:
+        self._docs = docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._docs:
+            yield doc
+
+
+# Qdrant
+
+
+async def make_qdrant(dataset: Dataset) -> Any:
+    """An in-process Qdrant (local mode) with the dataset's collections."""
+    from qdrant_client import AsyncQdrantClient, models
+
+    client = AsyncQdrantClient(location=":memory:")
+    for c in range(dataset.qdrant_collections):
+        name = f"collection_{c:04d}"
+        await client.create_collection(
+            name,
+            vectors_config=models.VectorParams(size=8, distance=models.Distance.COSINE),
+        )
+        await client.upsert(
+            name,
+            [models.PointStruct(id=p, vector=[float(p % 7)] * 8) for p in range(1, 11)],
+        )
+    return client
+
+
+async def install(dataset: Dataset) -> Dict[str, Any]:
+    """Swap every backend client for its stand-in and fill the datasets.
+
+    Returns the fakes so scenarios can pick real names from them.
+    """
+    from routers import health
+    from services.clients import clients
+    from services.container_logs import LogStreams
+    from services.container_stats import ContainerStats
+    from services.containers import ContainerIndex
+
+    redis_server = fakeredis.FakeServer()
+    await fill_redis(redis_server, dataset)
+    postgres = FakePostgres(dataset)
+    mongo = AsyncMongomock(dataset)
+    qdrant = await make_qdrant(dataset)
+
+    @asynccontextmanager
+    async def postgres_connection(dbname: str = "main_db"):
+        async with postgres.connection(dbname) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def redis_db(db: int):
+        yield FakeRedis(server=redis_server, db=db)
+
+    async def postgres_pool(dbname: str) -> None:
+        return None
+
+    clients.redis = lambda: FakeRedis(server=redis_server, decode_responses=True)
+    clients.redis_db = redis_db
+    clients.postgres = postgres_connection
+    clients._postgres_pool = postgres_pool
+    clients.mongo = lambda: mongo
+    clients.qdrant = lambda: qdrant
+    fill_s3(clients.s3(), dataset)
+
+    docker = FakeDockerClient(dataset.containers, dataset.log_lines)
+    health.docker_client = docker
+    health.container_index = ContainerIndex(docker, reconcile_interval=3600)
+    health.container_stats = ContainerStats(docker, health.container_index)
+    # Benchmark concurrency may exceed LOG_STREAM_MAX; measure streams, not 503s
+    health.log_streams = LogStreams(max_streams=1000)
+
+    return {"postgres": postgres, "mongo": mongo, "qdrant": qdrant}
@@ -0,0 +1,374 @@
+"""Drive the ASGI app against local stand-ins and report latency and throughput.
+
+Usage (from backend/):
+
+    python -m benchmarks.run [--containers N ...] [--output results.json]
+    python -m benchmarks.run --compare benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from benchmarks.fakes import Dataset, install, start_s3_server
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[rank]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    ms = [s * 1000 for s in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "max_ms": round(ms[-1], 3) if ms else 0.0,
+        "mean_ms": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+async def load(
+    call: Callable[[], Awaitable[bool]], requests: int, concurrency: int
+) -> Dict[str, Any]:
+    """Run `call` `requests` times from `concurrency` workers.
+
+    `call` returns whether the request succeeded.
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                ok = await call()
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def http_scenarios(client: Any, names: Dict[str, str]) -> Dict[str, Callable]:
+    """GET scenarios through the full middleware stack."""
+
+    def get(path: str, **headers: str) -> Callable[[], Awaitable[bool]]:
+        async def call() -> bool:
+            response = await client.get(path, headers=headers)
+            return response.status_code < 400
+
+        return call
+
+    etags: Dict[str, str] = {}
+
+    def conditional(path: str) -> Callable[[], Awaitable[bool]]:
+        async def call() -> bool:
+            response = await client.get(
+                path, headers={"If-None-Match": etags.get(path, "")}
+            )
+            if "etag" in response.headers:
+                etags[path] = response.headers["etag"]
+            return response.status_code < 400
+
+        return call
+
+    pg_db = names["postgres"]
+    container = names["container"]
+    mongo_db = names["mongodb"]
+    return {
+        "GET /health": get("/health"),
+        "GET /services": get("/services"),
+        "GET /services/stats": get("/services/stats"),
+        "GET /services/overview": get("/services/overview"),
+        "GET /services/overview?depth=full": get("/services/overview?depth=full"),
+        "GET /services/overview (br)": get(
+            "/services/overview?depth=full", **{"Accept-Encoding": "br"}
+        ),
+        "GET /services/overview (304)": conditional("/services/overview"),
+        "GET /services/redis": get("/services/redis"),
+        "GET /services/postgres": get("/services/postgres"),
+        "GET /services/minio": get("/services/minio"),
+        "GET /services/qdrant": get("/services/qdrant"),
+        "GET /services/mongodb": get("/services/mongodb"),
+        "GET /services/postgres/databases/{db}": get(
+            f"/services/postgres/databases/{pg_db}"
+        ),
+        "GET /services/mongodb/databases/{db}/collections": get(
+            f"/services/mongodb/databases/{mongo_db}/collections"
+        ),
+        "GET /services/{name}/logs (filtered)": get(
+            f"/services/{container}/logs?follow=false&tail=all&pattern=ERROR"
+        ),
+        "GET /services/{name}/logs (ndjson)": get(
+            f"/services/{container}/logs?follow=false&tail=1000&format=ndjson"
+        ),
+    }
+
+
+def provisioning_scenarios(
+    client: Any, template: str, postgres: Any
+) -> Dict[str, Callable]:
+    """Batch database creation; each run creates a fresh set of names.
+
+    The created databases are removed from the fake catalog after each run
+    so the dataset stays as declared.
+    """
+    runs = 0
+
+    def create(count: int, **options: Any) -> Callable[[], Awaitable[bool]]:
+        async def call() -> bool:
+            nonlocal runs
+            runs += 1
+            names = [f"bench_{runs:04d}_{i:03d}" for i in range(count)]
+            response = await client.post(
+                "/services/postgres/databases", json={"names": names, **options}
+            )
+            for name in names:
+                postgres.databases.pop(name, None)
+            return response.json().get("status") == "success"
+
+        return call
+
+    return {
+        "POST /services/postgres/databases (50)": create(50),
+        "POST /services/postgres/databases (50 from template)": create(
+            50, template=template
+        ),
+    }
+
+
+def collector_scenarios() -> Dict[str, Callable]:
+    """Full collector runs, bypassing the snapshot cache."""
+    from services.registry import registry
+
+    def run(collect: Callable[[], Awaitable[Dict]]) -> Callable[[], Awaitable[bool]]:
+        async def call() -> bool:
+            return (await collect())["status"] == "connected"
+
+        return call
+
+    return {f"collect {name}": run(registry.collector(name)) for name in registry.names}
+
+
+async def benchmark(
+    args: argparse.Namespace, dataset: Dataset, app: Any
+) -> Dict[str, Any]:
+    import httpx
+    from services.snapshots import snapshots
+
+    fakes = await install(dataset)
+    results: Dict[str, Any] = {}
+    async with app.router.lifespan_context(app):
+        # Measure warm snapshots, not the first collection
+        await asyncio.gather(*(snapshots.refresh(name) for name in snapshots.names))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            names = {
+                "postgres": sorted(fakes["postgres"].databases)[-1],
+                "mongodb": (await fakes["mongo"].list_database_names())[0],
+                "container": "infra-service-0000",
+                "template": sorted(fakes["postgres"].databases)[0],
+            }
+            # (name, call, requests, concurrency, warmup requests)
+            scenarios = [
+                (name, call, args.requests, args.concurrency, args.warmup)
+                for name, call in http_scenarios(client, names).items()
+            ] + [
+                (name, call, args.collect_runs, 1, 1)
+                for name, call in {
+                    **collector_scenarios(),
+                    # Last, so their snapshot refreshes don't affect the others
+                    **provisioning_scenarios(
+                        client, names["template"], fakes["postgres"]
+                    ),
+                }.items()
+            ]
+            for name, call, requests, concurrency, warmup in scenarios:
+                if args.only and not any(word in name for word in args.only):
+                    continue
+                await load(call, warmup, concurrency)
+                results[name] = await load(call, requests, concurrency)
+                print_row(name, results[name])
+
+    await fakes["qdrant"].close()
+    return results
+
+
+def print_row(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:<52} p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+        f"p99 {result['p99_ms']:>8.2f} ms  {result['throughput_rps']:>8.1f} rps"
+        f"  errors {result['errors']}"
+    )
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+    min_delta_ms: float = 0.0,
+) -> List[str]:
+    """Print the change per scenario; return the scenarios that regressed.
+
+    A scenario regresses when its p95 grows, or its throughput drops, by
+    more than `tolerance` (a fraction) relative to the baseline. The p95
+    (or, for throughput, the mean latency) must also have grown by at
+    least `min_delta_ms`, so jitter on millisecond scenarios isn't flagged.
+    """
+    regressions = []
+    print(f"\n{'scenario':<52} {'p50':>8} {'p95':>8} {'p99':>8} {'rps':>8}")
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<52} (not in baseline)")
+            continue
+
+        def change(key: str) -> float:
+            return (result[key] - before[key]) / before[key] if before[key] else 0.0
+
+        deltas = [change(k) for k in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")]
+        regressed = (
+            deltas[1] > tolerance
+            and result["p95_ms"] - before["p95_ms"] >= min_delta_ms
+        ) or (
+            deltas[3] < -tolerance
+            and result["mean_ms"] - before["mean_ms"] >= min_delta_ms
+        )
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{name:<52} " + " ".join(f"{d:>+8.1%}" for d in deltas) + marker)
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sizes = parser.add_argument_group("dataset")
+    defaults = Dataset()
+    for field in fields(Dataset):
+        sizes.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=field.type,
+            default=getattr(defaults, field.name),
+            help=f"default: {getattr(defaults, field.name)}",
+        )
+    parser.add_argument("--requests", type=int, default=500, help="per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="per scenario")
+    parser.add_argument(
+        "--collect-runs", type=int, default=10, help="runs per collector scenario"
+    )
+    parser.add_argument(
+        "--only", nargs="*", help="run only scenarios containing one of these words"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed p95/throughput change before failing (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=2.0,
+        help="ignore latency growth smaller than this (default: 2.0)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    dataset = Dataset(**{f.name: getattr(args, f.name) for f in fields(Dataset)})
+
+    logging.basicConfig(level=logging.WARNING)
+    server = start_s3_server()
+    try:
+        # Importing the app sets up logging at INFO; keep the report readable
+        from main import app
+
+        logging.getLogger().setLevel(logging.WARNING)
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        scenarios = asyncio.run(benchmark(args, dataset, app))
+    finally:
+        server.stop()
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": asdict(dataset),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "collect_runs": args.collect_runs,
+        },
+        "scenarios": scenarios,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["meta"]["dataset"] != result["meta"]["dataset"]:
+            print("warning: baseline was recorded with a different dataset")
+        if baseline["meta"]["python"] != result["meta"]["python"]:
+            print(
+                f"warning: baseline was recorded with Python "
+                f"{baseline['meta']['python']}, this run uses {platform.python_version()}"
+            )
+        regressions = compare(result, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(
+                f"\n{len(regressions)} scenario(s) regressed beyond "
+                f"{args.tolerance:.0%}: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
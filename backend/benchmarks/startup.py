@@ -0,0 +1,273 @@
+"""Measure API cold start: import time, startup, first request and memory.
+
+Each run is a fresh interpreter, so module caches don't hide import costs.
+Memory is sampled at the first request, after an idle period (no service
+read yet, so no driver should be loaded) and after a first overview that
+reads every service. No backend needs to be running; collections that
+fail still load drivers.
+
+Usage (from backend/):
+
+    python -m benchmarks.startup [--repeats N] [--output startup.json]
+    python -m benchmarks.startup --compare benchmarks/startup_baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Driver packages whose import dominates cold start
+DRIVERS = (
+    "boto3",
+    "docker",
+    "grpc",
+    "psycopg",
+    "pymongo",
+    "qdrant_client",
+    "redis",
+)
+
+# Scenario name -> environment overrides
+SCENARIOS: Dict[str, Dict[str, str]] = {
+    "all services": {},
+    "postgres,redis": {"ENABLED_SERVICES": "postgres,redis"},
+}
+
+# Timings and memory compared against the baseline; lower is better
+METRICS = (
+    "import_ms",
+    "startup_ms",
+    "first_request_ms",
+    "ready_ms",
+    "ready_rss_mb",
+    "idle_rss_mb",
+    "used_rss_mb",
+)
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def loaded_drivers() -> List[str]:
+    return [name for name in DRIVERS if name in sys.modules]
+
+
+async def measure_child(idle: float, settle: float) -> Dict[str, Any]:
+    """Import the app, start it and serve requests, timing each step."""
+    start = time.perf_counter()
+    from main import app
+
+    imported = time.perf_counter()
+    import httpx
+    from services.snapshots import snapshots
+
+    result: Dict[str, Any] = {"import_ms": (imported - start) * 1000}
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+            before = time.perf_counter()
+            response = await c.get("/health")
+            response.raise_for_status()
+            served = time.perf_counter()
+            result.update(
+                startup_ms=(started - imported) * 1000,
+                first_request_ms=(served - before) * 1000,
+                ready_ms=(served - start) * 1000,
+                ready_rss_mb=rss_mb(),
+                ready_drivers=loaded_drivers(),
+            )
+
+            # Services are collected on first read; nothing should load idle
+            await asyncio.sleep(idle)
+            result.update(idle_rss_mb=rss_mb(), idle_drivers=loaded_drivers())
+
+            # The first overview reads every service (or times out)
+            response = await c.get("/services/overview", params={"timeout": settle})
+            response.raise_for_status()
+            result.update(
+                used_rss_mb=rss_mb(),
+                used_drivers=loaded_drivers(),
+                services=snapshots.names,
+            )
+    return result
+
+
+def child(idle: float, settle: float) -> int:
+    import logging
+
+    # The app logs at INFO; stdout carries only the result
+    logging.disable(logging.CRITICAL)
+    result = asyncio.run(measure_child(idle, settle))
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+    # Skip interpreter teardown; driver threads may linger
+    os._exit(0)
+
+
+def run_once(env: Dict[str, str], idle: float, settle: float) -> Dict[str, Any]:
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.startup",
+            "--child",
+            f"--idle={idle}",
+            f"--settle={settle}",
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        cwd=Path(__file__).resolve().parent.parent,
+        timeout=idle + settle + 120,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Startup run failed:\n{process.stderr[-2000:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Medians of the measured values; loaded drivers from the last run."""
+    summary: Dict[str, Any] = {
+        metric: round(statistics.median(run[metric] for run in runs), 1)
+        for metric in METRICS
+    }
+    for key in ("ready_drivers", "idle_drivers", "used_drivers", "services"):
+        summary[key] = runs[-1][key]
+    return summary
+
+
+def print_row(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:<16} import {result['import_ms']:>7.0f}  "
+        f"startup {result['startup_ms']:>6.0f}  "
+        f"first request {result['first_request_ms']:>5.0f}  "
+        f"ready {result['ready_ms']:>7.0f} ms  "
+        f"rss {result['ready_rss_mb']:>6.1f} / {result['idle_rss_mb']:>6.1f} / "
+        f"{result['used_rss_mb']:>6.1f} MB"
+    )
+    for stage in ("idle", "used"):
+        drivers = ", ".join(result[f"{stage}_drivers"]) or "-"
+        print(f"{'':<16} drivers {stage}: {drivers}")
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Print the change per scenario; return the scenarios that regressed.
+
+    A scenario regresses when its ready time or any RSS figure grows by
+    more than `tolerance` (a fraction) relative to the baseline.
+    """
+    regressions = []
+    print(f"\n{'scenario':<16} " + " ".join(f"{m:>16}" for m in METRICS))
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<16} (not in baseline)")
+            continue
+
+        def change(key: str) -> float:
+            return (result[key] - before[key]) / before[key] if before[key] else 0.0
+
+        deltas = {metric: change(metric) for metric in METRICS}
+        regressed = any(
+            deltas[m] > tolerance
+            for m in ("ready_ms", "ready_rss_mb", "idle_rss_mb", "used_rss_mb")
+        )
+        marker = "  REGRESSION" if regressed else ""
+        print(
+            f"{name:<16} " + " ".join(f"{deltas[m]:>+16.1%}" for m in METRICS) + marker
+        )
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5, help="runs per scenario")
+    parser.add_argument(
+        "--idle",
+        type=float,
+        default=5.0,
+        help="seconds to stay idle after startup (default: 5)",
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=15.0,
+        help="overview deadline for the first collections (default: 15)",
+    )
+    parser.add_argument(
+        "--only", nargs="*", help="run only scenarios containing one of these words"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed ready time/RSS growth before failing (default: 0.25)",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.child:
+        return child(args.idle, args.settle)
+
+    from benchmarks.run import git_revision
+
+    scenarios: Dict[str, Any] = {}
+    for name, env in SCENARIOS.items():
+        if args.only and not any(word in name for word in args.only):
+            continue
+        runs = [run_once(env, args.idle, args.settle) for _ in range(args.repeats)]
+        scenarios[name] = summarize(runs)
+        print_row(name, scenarios[name])
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+        },
+        "scenarios": scenarios,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print(
+                f"\n{len(regressions)} scenario(s) regressed beyond "
+                f"{args.tolerance:.0%}: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,34 @@ def get_env_int(key: str, default: int) -> int:
         return default
 
 
+def get_env_float(key: str, default: float) -> float:
+    """Helper to get an environment variable as a float."""
+    val = os.getenv(key)
+    if val is None:
+        return default
+    try:
+        return float(val)
+    except ValueError:
+        return default
+
+
+def get_env_bool(key: str, default: bool) -> bool:
+    """Helper to get an environment variable as a boolean."""
+    val = os.getenv(key)
+    if val is None:
+        return default
+    return val.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Services to manage (comma-separated); drivers of the others are never loaded
+ENABLED_SERVICES = [
+    name.strip()
+    for name in os.getenv(
+        "ENABLED_SERVICES", "redis,postgres,minio,qdrant,mongodb"
+    ).split(",")
+    if name.strip()
+]
+
 # PostgreSQL Configuration
 POSTGRES_HOST = os.getenv("POSTGRES_HOST", "127.0.0.1")
 POSTGRES_PORT = get_env_int("POSTGRES_PORT", 54321)
@@ -26,11 +54,47 @@ POSTGRES_USER = os.getenv("POSTGRES_USER", "admin")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "password")
 POSTGRES_DEFAULT_DB = os.getenv("POSTGRES_DEFAULT_DB", "main_db")
 POSTGRES_PROTECTED_DBS = {"postgres", "template0", "template1"}
+POSTGRES_POOL_MIN_SIZE = get_env_int("POSTGRES_POOL_MIN_SIZE", 1)
+POSTGRES_POOL_MAX_SIZE = get_env_int("POSTGRES_POOL_MAX_SIZE", 5)
+# Pools for the non-default databases start empty and drain when idle
+POSTGRES_DB_POOL_MAX_SIZE = get_env_int("POSTGRES_DB_POOL_MAX_SIZE", 2)
+POSTGRES_POOL_MAX_IDLE = get_env_float("POSTGRES_POOL_MAX_IDLE", 300.0)
+POSTGRES_POOL_TIMEOUT = get_env_float("POSTGRES_POOL_TIMEOUT", 5.0)
+# Seconds to establish a connection (libpq rounds up to whole seconds, min 2)
+POSTGRES_CONNECT_TIMEOUT = get_env_int("POSTGRES_CONNECT_TIMEOUT", 3)
+# Per-database catalog collection: parallelism and per-database time limit
+POSTGRES_CATALOG_CONCURRENCY = get_env_int("POSTGRES_CATALOG_CONCURRENCY", 8)
+POSTGRES_CATALOG_TIMEOUT = get_env_float("POSTGRES_CATALOG_TIMEOUT", 5.0)
+# Tables per page on the database drill-down endpoint
+POSTGRES_TABLES_PAGE_SIZE = get_env_int("POSTGRES_TABLES_PAGE_SIZE", 100)
+# Databases created at once by a batch request, and the most per request
+POSTGRES_PROVISION_CONCURRENCY = get_env_int("POSTGRES_PROVISION_CONCURRENCY", 4)
+POSTGRES_PROVISION_MAX_BATCH = get_env_int("POSTGRES_PROVISION_MAX_BATCH", 100)
+# Workload insights: entries per list, and seconds a result is reused
+POSTGRES_INSIGHTS_TOP = get_env_int("POSTGRES_INSIGHTS_TOP", 10)
+POSTGRES_INSIGHTS_TTL = get_env_float("POSTGRES_INSIGHTS_TTL", 10.0)
+# Smaller tables are never flagged as missing an index
+POSTGRES_INSIGHTS_MIN_ROWS = get_env_int("POSTGRES_INSIGHTS_MIN_ROWS", 10000)
+# Dead tuple share above which a table is reported as bloated
+POSTGRES_INSIGHTS_BLOAT_RATIO = get_env_float("POSTGRES_INSIGHTS_BLOAT_RATIO", 0.2)
 
 # Redis Configuration
 REDIS_HOST = os.getenv("REDIS_HOST", "127.0.0.1")
 REDIS_PORT = get_env_int("REDIS_PORT", 63791)
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "password")
+REDIS_MAX_CONNECTIONS = get_env_int("REDIS_MAX_CONNECTIONS", 10)
+REDIS_POOL_TIMEOUT = get_env_float("REDIS_POOL_TIMEOUT", 5.0)
+REDIS_CONNECT_TIMEOUT = get_env_float("REDIS_CONNECT_TIMEOUT", 2.0)
+REDIS_READ_TIMEOUT = get_env_float("REDIS_READ_TIMEOUT", 5.0)
+# Retries after a failed connection or command (redis-py defaults to 3)
+REDIS_RETRIES = get_env_int("REDIS_RETRIES", 1)
+# Keyspace analyzer: default time (seconds) and key budgets per analysis
+REDIS_KEYSPACE_BUDGET = get_env_float("REDIS_KEYSPACE_BUDGET", 2.0)
+REDIS_KEYSPACE_MAX_KEYS = get_env_int("REDIS_KEYSPACE_MAX_KEYS", 50000)
+# Keys per SCAN/pipeline round trip and the pause between round trips
+REDIS_KEYSPACE_BATCH_SIZE = get_env_int("REDIS_KEYSPACE_BATCH_SIZE", 250)
+REDIS_KEYSPACE_PAUSE = get_env_float("REDIS_KEYSPACE_PAUSE", 0.005)
+REDIS_KEYSPACE_TOP_PREFIXES = get_env_int("REDIS_KEYSPACE_TOP_PREFIXES", 50)
 
 # MinIO Configuration
 MINIO_ENDPOINT = os.getenv(
@@ -41,12 +105,35 @@ MINIO_CONSOLE_URL = os.getenv(
 )
 MINIO_ACCESS_KEY = os.getenv("MINIO_ROOT_USER", "admin")
 MINIO_SECRET_KEY = os.getenv("MINIO_ROOT_PASSWORD", "password123")
+MINIO_MAX_POOL_CONNECTIONS = get_env_int("MINIO_MAX_POOL_CONNECTIONS", 10)
+MINIO_WORKERS = get_env_int("MINIO_WORKERS", 8)
+MINIO_CONNECT_TIMEOUT = get_env_float("MINIO_CONNECT_TIMEOUT", 2.0)
+MINIO_READ_TIMEOUT = get_env_float("MINIO_READ_TIMEOUT", 10.0)
+# Total attempts per S3 call, including the first (botocore defaults to 5)
+MINIO_MAX_ATTEMPTS = get_env_int("MINIO_MAX_ATTEMPTS", 2)
+# Bucket usage scans: seconds per snapshot run, parallel listings, page size
+MINIO_USAGE_SCAN_BUDGET = get_env_float("MINIO_USAGE_SCAN_BUDGET", 5.0)
+MINIO_USAGE_CONCURRENCY = get_env_int("MINIO_USAGE_CONCURRENCY", 4)
+MINIO_USAGE_PAGE_SIZE = get_env_int("MINIO_USAGE_PAGE_SIZE", 1000)
+# Above this many top-level prefixes a bucket is scanned without splitting
+MINIO_USAGE_MAX_PREFIXES = get_env_int("MINIO_USAGE_MAX_PREFIXES", 256)
+# Bucket purges: concurrent delete_objects batches, keys per batch, retries
+MINIO_PURGE_CONCURRENCY = get_env_int("MINIO_PURGE_CONCURRENCY", 4)
+MINIO_PURGE_BATCH_SIZE = get_env_int("MINIO_PURGE_BATCH_SIZE", 1000)
+MINIO_PURGE_RETRIES = get_env_int("MINIO_PURGE_RETRIES", 3)
 
 # Qdrant Configuration
 QDRANT_HOST = os.getenv("QDRANT_HOST", "127.0.0.1")
 QDRANT_REST_PORT = get_env_int("QDRANT_REST_PORT", 6333)
 QDRANT_GRPC_PORT = get_env_int("QDRANT_GRPC_PORT", 6334)
 QDRANT_API_KEY = os.getenv("QDRANT_API_KEY", "password")
+# Talk to Qdrant over gRPC on QDRANT_GRPC_PORT instead of REST
+QDRANT_PREFER_GRPC = get_env_bool("QDRANT_PREFER_GRPC", False)
+# Seconds per Qdrant request (connect and read)
+QDRANT_TIMEOUT = get_env_int("QDRANT_TIMEOUT", 5)
+# Concurrent get_collection calls per snapshot, and each call's deadline
+QDRANT_COLLECTION_CONCURRENCY = get_env_int("QDRANT_COLLECTION_CONCURRENCY", 16)
+QDRANT_COLLECTION_TIMEOUT = get_env_float("QDRANT_COLLECTION_TIMEOUT", 5.0)
 QDRANT_DASHBOARD_URL = os.getenv(
     "QDRANT_DASHBOARD_URL", f"http://127.0.0.1:{QDRANT_REST_PORT}/dashboard"
 )
@@ -58,3 +145,92 @@ MONGODB_USER = os.getenv("MONGO_INITDB_ROOT_USERNAME", "admin")
 MONGODB_PASSWORD = os.getenv("MONGO_INITDB_ROOT_PASSWORD", "password")
 MONGODB_AUTH_SOURCE = os.getenv("MONGODB_AUTH_SOURCE", "admin")
 MONGODB_PROTECTED_DBS = {"admin", "config", "local"}
+MONGODB_MAX_POOL_SIZE = get_env_int("MONGODB_MAX_POOL_SIZE", 10)
+MONGODB_SERVER_SELECTION_TIMEOUT = get_env_float(
+    "MONGODB_SERVER_SELECTION_TIMEOUT", 2.0
+)
+MONGODB_CONNECT_TIMEOUT = get_env_float("MONGODB_CONNECT_TIMEOUT", 2.0)
+MONGODB_SOCKET_TIMEOUT = get_env_float("MONGODB_SOCKET_TIMEOUT", 10.0)
+# Concurrent dbStats/$collStats commands per snapshot
+MONGODB_STATS_CONCURRENCY = get_env_int("MONGODB_STATS_CONCURRENCY", 8)
+# Seconds per-collection stats are reused between snapshots
+MONGODB_STATS_TTL = get_env_float("MONGODB_STATS_TTL", 300.0)
+# Collections listed per database in the snapshot and per page
+MONGODB_COLLECTIONS_PAGE_SIZE = get_env_int("MONGODB_COLLECTIONS_PAGE_SIZE", 100)
+
+# Docker Configuration
+DOCKER_WORKERS = get_env_int("DOCKER_WORKERS", 4)
+# Seconds between full container index reconciliations (events keep it current)
+CONTAINER_RECONCILE_INTERVAL = get_env_float("CONTAINER_RECONCILE_INTERVAL", 60.0)
+# Seconds between checks for containers to start or stop following stats for
+CONTAINER_STATS_RECONCILE_INTERVAL = get_env_float(
+    "CONTAINER_STATS_RECONCILE_INTERVAL", 5.0
+)
+# Recent stats samples kept per container (Docker sends about one a second)
+CONTAINER_STATS_HISTORY = get_env_int("CONTAINER_STATS_HISTORY", 300)
+# Concurrent container log streams (each holds a thread and a Docker socket)
+LOG_STREAM_MAX = get_env_int("LOG_STREAM_MAX", 10)
+# Rendered chunks buffered per log stream before the reader waits on the client
+LOG_STREAM_BUFFER = get_env_int("LOG_STREAM_BUFFER", 64)
+# Largest response write when buffered chunks are joined
+LOG_CHUNK_BYTES = get_env_int("LOG_CHUNK_BYTES", 65536)
+# Longer log lines are split at this many bytes
+LOG_MAX_LINE_BYTES = get_env_int("LOG_MAX_LINE_BYTES", 16384)
+# Lines sent from the end of the log when `tail` isn't given
+LOG_DEFAULT_TAIL = get_env_int("LOG_DEFAULT_TAIL", 100)
+
+# Snapshot Collector Configuration (seconds between background refreshes)
+SNAPSHOT_INTERVALS = {
+    "redis": get_env_float("SNAPSHOT_INTERVAL_REDIS", 15.0),
+    "postgres": get_env_float("SNAPSHOT_INTERVAL_POSTGRES", 60.0),
+    "minio": get_env_float("SNAPSHOT_INTERVAL_MINIO", 60.0),
+    "qdrant": get_env_float("SNAPSHOT_INTERVAL_QDRANT", 30.0),
+    "mongodb": get_env_float("SNAPSHOT_INTERVAL_MONGODB", 60.0),
+}
+# How long a mutation waits for the affected snapshot to be recollected
+SNAPSHOT_MUTATION_WAIT = get_env_float("SNAPSHOT_MUTATION_WAIT", 5.0)
+# Default per-service deadline for the aggregate /services/overview endpoint
+SERVICES_OVERVIEW_TIMEOUT = get_env_float("SERVICES_OVERVIEW_TIMEOUT", 3.0)
+
+# HTTP Response Compression (bytes below the threshold are sent as is)
+COMPRESSION_MIN_SIZE = get_env_int("COMPRESSION_MIN_SIZE", 1024)
+COMPRESSION_GZIP_LEVEL = get_env_int("COMPRESSION_GZIP_LEVEL", 6)
+COMPRESSION_BROTLI_QUALITY = get_env_int("COMPRESSION_BROTLI_QUALITY", 4)
+
+# Live Updates Configuration
+EVENTS_HEARTBEAT_INTERVAL = get_env_float("EVENTS_HEARTBEAT_INTERVAL", 15.0)
+EVENTS_MAX_SUBSCRIBERS = get_env_int("EVENTS_MAX_SUBSCRIBERS", 100)
+
+# Metrics History Configuration: (bucket seconds, points kept) per tier
+HISTORY_TIERS = [
+    (60, get_env_int("HISTORY_1M_POINTS", 720)),  # 12 hours at 1 minute
+    (300, get_env_int("HISTORY_5M_POINTS", 2016)),  # 7 days at 5 minutes
+    (3600, get_env_int("HISTORY_1H_POINTS", 1344)),  # 8 weeks at 1 hour
+]
+HISTORY_MAX_SERIES = get_env_int("HISTORY_MAX_SERIES", 500)
+
+# Job Runner Configuration
+JOB_WORKERS = get_env_int("JOB_WORKERS", 4)
+# Jobs allowed to run at once against the same backend
+JOB_BACKEND_CONCURRENCY = {
+    "postgres": get_env_int("JOB_CONCURRENCY_POSTGRES", 1),
+    "mongodb": get_env_int("JOB_CONCURRENCY_MONGODB", 1),
+    "minio": get_env_int("JOB_CONCURRENCY_MINIO", 2),
+}
+# Finished jobs kept for /jobs
+JOB_HISTORY_SIZE = get_env_int("JOB_HISTORY_SIZE", 200)
+
+# Tracing Configuration (seconds before a request or collection is logged)
+SLOW_REQUEST_THRESHOLD = get_env_float("SLOW_REQUEST_THRESHOLD", 0.5)
+SLOW_COLLECTOR_THRESHOLD = get_env_float("SLOW_COLLECTOR_THRESHOLD", 5.0)
+SLOW_LOG_SIZE = get_env_int("SLOW_LOG_SIZE", 100)
+# Spans recorded per trace; further spans are only counted
+TRACE_MAX_SPANS = get_env_int("TRACE_MAX_SPANS", 1000)
+# Upper bound on an on-demand /debug/profile run
+PROFILE_MAX_SECONDS = get_env_float("PROFILE_MAX_SECONDS", 60.0)
+
+# Circuit Breakers: consecutive connection failures before a backend is
+# treated as down, and the first and longest wait before probing it again
+CIRCUIT_FAILURE_THRESHOLD = get_env_int("CIRCUIT_FAILURE_THRESHOLD", 3)
+CIRCUIT_RESET_TIMEOUT = get_env_float("CIRCUIT_RESET_TIMEOUT", 5.0)
+CIRCUIT_MAX_RESET_TIMEOUT = get_env_float("CIRCUIT_MAX_RESET_TIMEOUT", 120.0)
@@ -1,16 +1,57 @@
 """Infra Manager API - Main application entry point."""
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import health, services
+from routers import debug, events, health, jobs, metrics, services
+from services.clients import clients
+from services.executors import shutdown_executors
+from services.http import (
+    CompressionMiddleware,
+    ETagMiddleware,
+    ORJSONResponse,
+    ServerTimingMiddleware,
+)
+from services.jobs import jobs as job_runner
+from services.snapshots import snapshots
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Infra Manager API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start collectors and the Docker watchers; close clients on shutdown."""
+    await snapshots.start()
+    await health.connect_docker()
+    if health.docker_client:
+        await health.container_index.start()
+        await health.container_stats.start()
+    try:
+        yield
+    finally:
+        await job_runner.shutdown()
+        await health.container_stats.stop()
+        await health.container_index.stop()
+        await snapshots.stop()
+        await clients.close()
+        shutdown_executors()
+
+
+app = FastAPI(
+    title="Infra Manager API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# ETags are computed on the uncompressed body, so compression wraps them
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware)
+# Outermost of the three, so rendering, ETags and compression are timed too
+app.add_middleware(ServerTimingMiddleware, exclude=("/debug/profile",))
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -24,6 +65,10 @@ app.add_middleware(
 # Include routers
 app.include_router(health.router)
 app.include_router(services.router)
+app.include_router(events.router)
+app.include_router(metrics.router)
+app.include_router(jobs.router)
+app.include_router(debug.router)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+"""Diagnostics endpoints: the slow log and an on-demand profiler."""
+
+import asyncio
+import logging
+from typing import Literal, Optional
+
+from config import PROFILE_MAX_SECONDS
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from services.profiler import profiler
+from services.tracing import slow_log
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/slow")
+async def slow_requests(
+    kind: Optional[Literal["request", "collector"]] = None,
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """Recent slow requests and snapshot collections with their slowest spans."""
+    return {"entries": slow_log.list(kind, limit)}
+
+
+@router.delete("/slow")
+async def clear_slow_requests():
+    """Empty the slow log."""
+    slow_log.clear()
+    return {"status": "success", "message": "Slow log cleared"}
+
+
+@router.get("/profile")
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=PROFILE_MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    format: Literal["json", "folded"] = "json",
+):
+    """Sample every thread's stack for `seconds` and report where time went.
+
+    `format=folded` returns collapsed stacks for flamegraph.pl or speedscope.
+    """
+    if profiler.running:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    logger.info(f"Profiling for {seconds}s every {interval_ms}ms")
+    try:
+        report = await asyncio.to_thread(profiler.profile, seconds, interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if format == "folded":
+        return PlainTextResponse("\n".join(report["folded"]) + "\n")
+    return report
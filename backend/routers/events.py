@@ -0,0 +1,55 @@
+"""Server-Sent Events stream of live container and service updates."""
+
+import logging
+from typing import AsyncIterator
+
+from config import EVENTS_HEARTBEAT_INTERVAL
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from routers import health
+from services.events import broker, format_sse
+from services.snapshots import snapshots
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["events"])
+
+
+@router.get("/events")
+async def stream_events():
+    """Push container state changes and service snapshot diffs as they happen.
+
+    The stream opens with the full current state (`containers` plus one
+    `snapshot` per service) and then sends `container` and `snapshot`
+    patches. A comment line is sent as a heartbeat when nothing changes.
+    """
+    if broker.is_full:
+        raise HTTPException(status_code=503, detail="Too many event subscribers")
+
+    return StreamingResponse(
+        _event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _event_stream() -> AsyncIterator[str]:
+    """Yield the initial state, then pending events and heartbeats."""
+    # Subscribe before reading the current state so no change is missed
+    subscriber = broker.subscribe()
+    try:
+        yield "retry: 3000\n\n"
+        if health.container_index.ready:
+            yield format_sse("containers", health.container_index.list())
+        for name in snapshots.names:
+            yield format_sse("snapshot", {"service": name, "data": snapshots.get(name)})
+
+        while True:
+            batch = await subscriber.next_batch(EVENTS_HEARTBEAT_INTERVAL)
+            if not batch:
+                yield ": heartbeat\n\n"
+                continue
+            for event, payload in batch:
+                yield format_sse(event, payload)
+    finally:
+        broker.unsubscribe(subscriber)
@@ -1,20 +1,65 @@
 """Health and Docker service listing endpoints."""
 
 import logging
+import time
+from typing import Literal, Optional
 
-import docker
-from fastapi import APIRouter, HTTPException
+from config import CONTAINER_RECONCILE_INTERVAL, LOG_DEFAULT_TAIL, LOG_STREAM_MAX
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from services.breaker import breakers
+from services.clients import clients
+from services.container_logs import LogStream, LogStreams, compile_filter
+from services.container_stats import ContainerStats
+from services.containers import ContainerIndex
+from services.executors import run_blocking
+from services.history import parse_range
+from services.tracing import current_trace
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
-# Docker client
-try:
-    docker_client = docker.from_env()
-except Exception as e:
-    logger.error(f"Failed to initialize Docker client: {e}")
-    docker_client = None
+# Docker client, connected at startup by connect_docker()
+docker_client = None
+
+# In-memory container state, kept current by the Docker events stream
+container_index = ContainerIndex(docker_client, CONTAINER_RECONCILE_INTERVAL)
+
+# Live resource usage, one Docker stats stream per running container
+container_stats = ContainerStats(docker_client, container_index)
+
+# Open container log streams, each followed on its own thread
+log_streams = LogStreams(LOG_STREAM_MAX)
+
+LOG_MEDIA_TYPES = {
+    "text": "text/plain; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+async def connect_docker() -> None:
+    """Connect to the Docker daemon on a worker thread.
+
+    Importing the SDK and probing the daemon used to happen at import
+    time, blocking startup; a client that is already set is kept.
+    """
+    global docker_client, container_index, container_stats
+    if docker_client is not None:
+        return
+
+    def connect():
+        import docker
+
+        return docker.from_env()
+
+    try:
+        docker_client = await run_blocking("docker", connect)
+    except Exception as e:
+        logger.error(f"Failed to initialize Docker client: {e}")
+        return
+    container_index = ContainerIndex(docker_client, CONTAINER_RECONCILE_INTERVAL)
+    container_stats = ContainerStats(docker_client, container_index)
 
 
 @router.get("/health")
@@ -23,35 +68,119 @@ def health_check():
     return {"status": "ok"}
 
 
+@router.get("/health/pools")
+def pool_stats():
+    """Connection pool sizes and checkout wait times per backend."""
+    return clients.stats()
+
+
+@router.get("/health/breakers")
+def breaker_states():
+    """Circuit breaker state per backend: closed, open or half_open."""
+    return {name: breaker.to_dict() for name, breaker in breakers.items()}
+
+
 @router.get("/services")
 async def list_services():
     """Lists all shared infrastructure services and their status."""
     if not docker_client:
         return {"error": "Docker client not available"}
+    if not container_index.ready:
+        raise HTTPException(status_code=503, detail="Container index not ready")
+    return container_index.list()
+
+
+@router.get("/services/stats")
+async def list_container_stats():
+    """Latest CPU, memory, network and block I/O usage of each running service."""
+    if not docker_client:
+        return {"error": "Docker client not available"}
+    return container_stats.list()
+
+
+@router.get("/services/{name}/stats")
+async def get_container_stats(name: str):
+    """Latest resource usage of one service container and its recent samples."""
+    if not docker_client:
+        return {"error": "Docker client not available"}
+    stats = container_stats.get(name)
+    if stats is None:
+        raise HTTPException(
+            status_code=404, detail=f"No stats for container {name}; is it running?"
+        )
+    return stats
+
+
+@router.get("/services/{name}/logs")
+async def stream_container_logs(
+    name: str,
+    follow: bool = True,
+    tail: str = Query(
+        str(LOG_DEFAULT_TAIL), description="Lines from the end to start at, or all"
+    ),
+    since: Optional[str] = Query(
+        None, description="Unix timestamp or a range such as 15m or 2h"
+    ),
+    pattern: Optional[str] = Query(
+        None, max_length=500, description="Only send lines matching this regex"
+    ),
+    ignore_case: bool = False,
+    stdout: bool = True,
+    stderr: bool = True,
+    timestamps: bool = False,
+    format: Literal["text", "ndjson"] = "text",
+):
+    """Stream a service container's logs as they are written.
+
+    Lines are filtered by `pattern` before they are sent and streamed in
+    chunks, never buffered whole. `format=ndjson` sends one
+    `{"timestamp", "line"}` object per line.
+    """
+    if not docker_client:
+        return {"error": "Docker client not available"}
+    if not container_index.ready:
+        raise HTTPException(status_code=503, detail="Container index not ready")
+    container = next((c for c in container_index.list() if c["name"] == name), None)
+    if container is None:
+        raise HTTPException(status_code=404, detail=f"Container {name} not found")
+    if log_streams.is_full:
+        raise HTTPException(status_code=503, detail="Too many log streams")
 
-    services = []
     try:
-        containers = docker_client.containers.list(all=True)
-        for container in containers:
-            # We only care about containers with 'infra-' prefix or specific names
-            if container.name.startswith("infra-"):
-                services.append(
-                    {
-                        "id": container.short_id,
-                        "name": container.name,
-                        "image": (
-                            container.image.tags[0]
-                            if container.image.tags
-                            else "unknown"
-                        ),
-                        "status": container.status,
-                        "health": container.attrs.get("State", {})
-                        .get("Health", {})
-                        .get("Status", "unknown"),
-                    }
-                )
-    except Exception as e:
-        logger.error(f"Error listing Docker containers: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        regex = compile_filter(pattern, ignore_case)
+        if tail != "all":
+            if not tail.isdigit():
+                raise ValueError(f"Invalid tail: {tail}")
+            tail = int(tail)
+        start = None
+        if since:
+            try:
+                start = float(since)
+            except ValueError:
+                start = time.time() - parse_range(since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if follow:
+        # Followed logs are long-lived by design, not slow requests
+        trace = current_trace()
+        if trace is not None:
+            trace.loggable = False
 
-    return services
+    log = LogStream(
+        docker_client,
+        container["id"],
+        follow=follow,
+        tail=tail,
+        since=start,
+        stdout=stdout,
+        stderr=stderr,
+        timestamps=timestamps,
+        pattern=regex,
+        format=format,
+    )
+    return StreamingResponse(
+        log_streams.stream(log),
+        media_type=LOG_MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
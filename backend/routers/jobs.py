@@ -0,0 +1,65 @@
+"""Background job endpoints."""
+
+import logging
+from typing import AsyncIterator
+
+from config import EVENTS_HEARTBEAT_INTERVAL
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from services.events import format_sse
+from services.jobs import Job, jobs
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _get_job(job_id: str) -> Job:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("")
+async def list_jobs():
+    """List recent jobs, newest first."""
+    return {"jobs": [job.to_dict() for job in jobs.list()]}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """Get a job's status, progress and elapsed time."""
+    return _get_job(job_id).to_dict()
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str):
+    """Stream a job's state as Server-Sent Events until it finishes."""
+    job = _get_job(job_id)
+    return StreamingResponse(
+        _job_stream(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job."""
+    job = _get_job(job_id)
+    if job.finished:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} already finished")
+    jobs.cancel(job_id)
+    return job.to_dict()
+
+
+async def _job_stream(job: Job) -> AsyncIterator[str]:
+    """Yield the job state on every change, then a final `done` event."""
+    while True:
+        version = job.version
+        yield format_sse("job", job.to_dict())
+        if job.finished:
+            yield format_sse("done", job.to_dict())
+            return
+        await job.wait_for_change(version, EVENTS_HEARTBEAT_INTERVAL)
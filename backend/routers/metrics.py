@@ -0,0 +1,54 @@
+"""Prometheus metrics and metrics history endpoints."""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from routers import health
+from services.clients import clients
+from services.history import history, parse_range
+from services.instrumentation import (
+    BreakerCollector,
+    ContainerStatsCollector,
+    PoolCollector,
+    ServiceCollector,
+)
+from services.snapshots import snapshots
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+# Pool, service, breaker and container gauges are read from memory at scrape time
+REGISTRY.register(PoolCollector(clients.stats))
+REGISTRY.register(ServiceCollector(snapshots))
+REGISTRY.register(BreakerCollector())
+REGISTRY.register(ContainerStatsCollector(lambda: health.container_stats.list()))
+
+
+@router.get("")
+async def prometheus_metrics():
+    """Metrics in the Prometheus text exposition format."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+@router.get("/history")
+def metrics_history(
+    series: Optional[str] = Query(
+        None,
+        description="Comma-separated series names or globs, e.g. postgres.db.*",
+    ),
+    range: str = Query("1h", description="Time range such as 15m, 6h, 7d or 4w"),
+):
+    """Get recorded metric history, or list the available series."""
+    if not series:
+        return {"series": history.names()}
+
+    try:
+        seconds = parse_range(range)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    patterns = [p.strip() for p in series.split(",") if p.strip()]
+    return {"range_seconds": seconds, "series": history.query(patterns, seconds)}
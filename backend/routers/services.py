@@ -1,64 +1,366 @@
 """Service-specific endpoints including operations."""
 
-from fastapi import APIRouter
-from services.minio_service import MinioService
-from services.mongodb_service import MongoDBService
-from services.postgres_service import PostgresService
-from services.qdrant_service import QdrantService
-from services.redis_service import RedisService
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
+
+from config import (
+    MONGODB_COLLECTIONS_PAGE_SIZE,
+    MONGODB_PROTECTED_DBS,
+    POSTGRES_INSIGHTS_TOP,
+    POSTGRES_PROTECTED_DBS,
+    POSTGRES_PROVISION_MAX_BATCH,
+    POSTGRES_TABLES_PAGE_SIZE,
+    SERVICES_OVERVIEW_TIMEOUT,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
+from services.breaker import CircuitOpenError, breakers
+from services.http import ORJSONResponse, conditional_response, make_etag
+from services.jobs import ProgressFn, jobs
+from services.registry import registry
+from services.shaping import decode_cursor, shape
+from services.snapshots import snapshots
 
 router = APIRouter(prefix="/services", tags=["services"])
 
 
+class Shape:
+    """`?fields=` and `?depth=` query parameters for detail payloads."""
+
+    def __init__(
+        self,
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to keep, e.g. databases.name",
+        ),
+        depth: Literal["summary", "full"] = Query(
+            "summary", description="summary drops the lists nested in lists"
+        ),
+    ) -> None:
+        self.fields = fields
+        self.depth = depth
+
+    def __call__(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return shape(data, self.fields, self.depth)
+
+    @property
+    def key(self) -> str:
+        return f"{self.depth}|{self.fields or ''}"
+
+
+class PostgresBatchCreate(BaseModel):
+    """Databases to create, optionally cloned from a pre-migrated template."""
+
+    names: List[str] = Field(min_length=1, max_length=POSTGRES_PROVISION_MAX_BATCH)
+    template: Optional[str] = None
+    # wal_log suits small templates; file_copy is faster for large ones
+    strategy: Optional[Literal["wal_log", "file_copy"]] = None
+
+
+def _available(service: str) -> Callable[[], Awaitable[None]]:
+    """Dependency loading `service`, or failing fast when it cannot serve.
+
+    Answers 404 for a disabled service and 503 while its circuit is open.
+    Otherwise the service module is imported (off the event loop) so the
+    handler can take it from `registry.get` without blocking.
+    """
+    breaker = breakers[service]
+
+    async def check() -> None:
+        if not registry.enabled(service):
+            raise HTTPException(
+                status_code=404, detail=f"Service {service} is not enabled"
+            )
+        try:
+            breaker.check()
+        except CircuitOpenError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(math.ceil(e.retry_in))},
+            )
+        await registry.load(service)
+
+    return check
+
+
+def _cursor(cursor: Optional[str]) -> Optional[List[Any]]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/overview")
+async def services_overview(
+    request: Request,
+    services: Optional[str] = Query(
+        None, description="Comma-separated services to include (default: all)"
+    ),
+    timeout: float = Query(
+        SERVICES_OVERVIEW_TIMEOUT, gt=0, le=60, description="Per-service deadline"
+    ),
+    shaped: Shape = Depends(),
+):
+    """Get every service's details concurrently, each under a hard deadline."""
+    names = snapshots.names
+    if services:
+        names = [name.strip() for name in services.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(snapshots.names))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown services: {', '.join(unknown)}",
+            )
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(snapshots.fetch(name, timeout) for name in names))
+    overview = {name: shaped(result) for name, result in zip(names, results)}
+    content = {
+        "services": overview,
+        "timed_out": [
+            name for name, info in overview.items() if info["status"] == "timeout"
+        ],
+        "duration_seconds": round(time.perf_counter() - start, 3),
+    }
+    # Unchanged when every included snapshot's data is unchanged
+    latest = [snapshots.latest(name) for name in names]
+    if content["timed_out"] or any(snapshot is None for snapshot in latest):
+        return ORJSONResponse(content)
+    etag = make_etag(
+        " ".join([shaped.key] + [snapshot.etag for snapshot in latest]).encode()
+    )
+    return conditional_response(request, etag, content)
+
+
 @router.get("/redis")
-async def redis_info():
-    """Get detailed info from Redis."""
-    return RedisService.get_info()
+async def redis_info(request: Request, shaped: Shape = Depends()):
+    """Get detailed info from Redis (cached snapshot)."""
+    return _snapshot_response(request, "redis", shaped)
+
+
+@router.get("/redis/keyspace", dependencies=[Depends(_available("redis"))])
+async def redis_keyspace(
+    db: Optional[str] = Query(
+        None, description="Comma-separated logical DBs (default: all in INFO)"
+    ),
+    delimiter: str = Query(":", min_length=1, description="Key prefix delimiter"),
+    depth: int = Query(1, ge=1, le=5, description="Delimiter segments per prefix"),
+    budget: Optional[float] = Query(None, gt=0, le=30, description="Seconds"),
+    max_keys: Optional[int] = Query(None, ge=1, le=1_000_000),
+):
+    """Estimate Redis memory and key counts per key prefix (sampled)."""
+    dbs = None
+    if db:
+        try:
+            dbs = [int(part) for part in db.split(",") if part.strip()]
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid db list: {db}")
+    return await registry.get("redis").analyze_keyspace(
+        dbs, delimiter, depth, budget, max_keys
+    )
 
 
 @router.get("/postgres")
-async def postgres_info():
-    """Get detailed info from PostgreSQL."""
-    return PostgresService.get_info()
+async def postgres_info(request: Request, shaped: Shape = Depends()):
+    """Get detailed info from PostgreSQL (cached snapshot)."""
+    return _snapshot_response(request, "postgres", shaped)
+
+
+@router.get("/postgres/insights", dependencies=[Depends(_available("postgres"))])
+async def postgres_insights(
+    top: int = Query(POSTGRES_INSIGHTS_TOP, ge=1, le=100),
+    database: Optional[str] = None,
+):
+    """Top statements, connections, index usage and bloat, with current rates."""
+    return await registry.get("postgres").get_insights(top, database)
 
 
 @router.get("/minio")
-async def minio_info():
-    """Get detailed info from MinIO."""
-    return MinioService.get_info()
+async def minio_info(request: Request, shaped: Shape = Depends()):
+    """Get detailed info from MinIO (cached snapshot)."""
+    return _snapshot_response(request, "minio", shaped)
 
 
 @router.get("/qdrant")
-async def qdrant_info():
-    """Get detailed info from Qdrant."""
-    return QdrantService.get_info()
+async def qdrant_info(request: Request, shaped: Shape = Depends()):
+    """Get detailed info from Qdrant (cached snapshot)."""
+    return _snapshot_response(request, "qdrant", shaped)
 
 
 @router.get("/mongodb")
-async def mongodb_info():
-    """Get detailed info from MongoDB."""
-    return MongoDBService.get_info()
+async def mongodb_info(request: Request, shaped: Shape = Depends()):
+    """Get detailed info from MongoDB (cached snapshot)."""
+    return _snapshot_response(request, "mongodb", shaped)
+
 
+@router.get(
+    "/mongodb/databases/{db_name}/collections",
+    dependencies=[Depends(_available("mongodb"))],
+)
+async def mongodb_collections(
+    db_name: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the last page"),
+    limit: int = Query(MONGODB_COLLECTIONS_PAGE_SIZE, ge=1, le=1000),
+    sort: Literal["size", "name"] = Query("size"),
+    fields: Optional[str] = Query(None, description="e.g. collections.name"),
+):
+    """Page through a MongoDB database's collection stats."""
+    result = await registry.get("mongodb").list_collections(
+        db_name, _cursor(cursor), limit, sort
+    )
+    return shape(result, fields, "full")
 
-@router.post("/postgres/databases/{db_name}")
+
+@router.get(
+    "/postgres/databases/{db_name}", dependencies=[Depends(_available("postgres"))]
+)
+async def postgres_database(
+    db_name: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the last page"),
+    limit: int = Query(POSTGRES_TABLES_PAGE_SIZE, ge=1, le=1000),
+    fields: Optional[str] = Query(None, description="e.g. tables.name"),
+):
+    """Get one PostgreSQL database's details with a page of its tables."""
+    after = _cursor(cursor)
+    result = await registry.get("postgres").get_database(
+        db_name, str(after[0]) if after else "", limit
+    )
+    return shape(result, fields, "full")
+
+
+@router.post(
+    "/postgres/databases/{db_name}", dependencies=[Depends(_available("postgres"))]
+)
 async def create_postgres_database(db_name: str):
     """Create a new PostgreSQL database."""
-    return PostgresService.create_database(db_name)
+    result = await registry.get("postgres").create_database(db_name)
+    if result.get("status") == "success":
+        await snapshots.invalidate("postgres")
+    return result
+
 
+@router.post("/postgres/databases", dependencies=[Depends(_available("postgres"))])
+async def create_postgres_databases(request: PostgresBatchCreate):
+    """Create many PostgreSQL databases at once; reports each one's outcome."""
+    result = await registry.get("postgres").create_databases(
+        request.names, request.template, request.strategy
+    )
+    if result.get("status") in ("success", "partial"):
+        await snapshots.invalidate("postgres")
+    return result
 
-@router.delete("/postgres/databases/{db_name}")
+
+@router.delete(
+    "/postgres/databases/{db_name}",
+    status_code=202,
+    dependencies=[Depends(_available("postgres"))],
+)
 async def drop_postgres_database(db_name: str):
-    """Drop a PostgreSQL database."""
-    return PostgresService.drop_database(db_name)
+    """Drop a PostgreSQL database in the background; returns the job."""
+    if db_name in POSTGRES_PROTECTED_DBS:
+        raise HTTPException(
+            status_code=400, detail=f"Cannot drop protected database: {db_name}"
+        )
+    await _require(
+        registry.get("postgres").database_exists(db_name),
+        f"Database {db_name} not found",
+    )
+    return _submit_job(
+        "drop_database",
+        "postgres",
+        db_name,
+        lambda progress: registry.get("postgres").drop_database(db_name),
+    )
 
 
-@router.delete("/minio/buckets/{bucket_name}")
+@router.delete(
+    "/minio/buckets/{bucket_name}",
+    status_code=202,
+    dependencies=[Depends(_available("minio"))],
+)
 async def drop_minio_bucket(bucket_name: str):
-    """Drop a MinIO bucket."""
-    return MinioService.drop_bucket(bucket_name)
+    """Drop a MinIO bucket in the background; returns the job."""
+    await _require(
+        registry.get("minio").bucket_exists(bucket_name),
+        f"Bucket {bucket_name} not found",
+    )
+    return _submit_job(
+        "drop_bucket",
+        "minio",
+        bucket_name,
+        lambda progress: registry.get("minio").drop_bucket(bucket_name, progress),
+    )
 
 
-@router.delete("/mongodb/databases/{db_name}")
+@router.delete(
+    "/mongodb/databases/{db_name}",
+    status_code=202,
+    dependencies=[Depends(_available("mongodb"))],
+)
 async def drop_mongodb_database(db_name: str):
-    """Drop a MongoDB database."""
-    return MongoDBService.drop_database(db_name)
+    """Drop a MongoDB database in the background; returns the job."""
+    if db_name in MONGODB_PROTECTED_DBS:
+        raise HTTPException(
+            status_code=400, detail=f"Cannot drop protected database: {db_name}"
+        )
+    await _require(
+        registry.get("mongodb").database_exists(db_name),
+        f"Database {db_name} not found",
+    )
+    return _submit_job(
+        "drop_database",
+        "mongodb",
+        db_name,
+        lambda progress: registry.get("mongodb").drop_database(db_name),
+    )
+
+
+def _snapshot_response(request: Request, name: str, shaped: Shape) -> Response:
+    """A service's snapshot, or 304 if the client's copy has the same data."""
+    if name not in snapshots.names:
+        raise HTTPException(status_code=404, detail=f"Service {name} is not enabled")
+    content = shaped(snapshots.get(name))
+    snapshot = snapshots.latest(name)
+    if snapshot is None:
+        return ORJSONResponse(content)
+    etag = make_etag(f"{shaped.key} {snapshot.etag}".encode())
+    return conditional_response(request, etag, content)
+
+
+async def _require(exists: Awaitable[bool], detail: str) -> None:
+    """Answer 404 unless `exists` is true, before a job is queued for it."""
+    try:
+        found = await exists
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if not found:
+        raise HTTPException(status_code=404, detail=detail)
+
+
+def _submit_job(
+    kind: str,
+    service: str,
+    target: str,
+    operation: Callable[[ProgressFn], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Run a mutation as a background job that refreshes the snapshot on success."""
+
+    async def run(progress: ProgressFn) -> Dict[str, Any]:
+        result = await operation(progress)
+        if result.get("status") == "success":
+            await snapshots.invalidate(service)
+        return result
+
+    job = jobs.submit(kind, service, target, run)
+    return {
+        "status": "accepted",
+        "message": f"{kind} {target} queued as job {job.id}",
+        "job_id": job.id,
+        "job": job.to_dict(),
+    }
@@ -0,0 +1,208 @@
+"""Per-backend circuit breakers so a dead service fails fast."""
+
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from config import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_RESET_TIMEOUT,
+    CIRCUIT_RESET_TIMEOUT,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Errors meaning the backend itself is unreachable. Query errors and our
+# own asyncio deadlines (e.g. one slow database) never trip a breaker.
+# Named as "module:class" so checking them never imports a driver.
+UNAVAILABLE_ERRORS: Dict[str, Tuple[str, ...]] = {
+    "postgres": ("psycopg:OperationalError",),
+    "redis": ("redis.exceptions:ConnectionError", "redis.exceptions:TimeoutError"),
+    "mongodb": ("pymongo.errors:ConnectionFailure",),
+    "minio": (
+        "botocore.exceptions:ConnectionError",
+        "botocore.exceptions:HTTPClientError",
+    ),
+    "qdrant": ("qdrant_client.http.exceptions:ResponseHandlingException",),
+}
+UNAVAILABLE_GRPC_CODES = ("UNAVAILABLE", "DEADLINE_EXCEEDED")
+# Postgres SQLSTATEs (or classes) that concern the server rather than one
+# database: connection exceptions, shutdowns, not yet accepting connections
+# and no free connection slots. Others, e.g. 3D000 for a missing database,
+# don't count.
+POSTGRES_UNAVAILABLE_SQLSTATES = ("08", "57P01", "57P02", "57P03", "53300")
+# libpq reports startup errors without a SQLSTATE, so the server-wide ones
+# (57P03 and 53300) are matched on the server's message
+POSTGRES_UNAVAILABLE_STARTUP = re.compile(
+    r"FATAL:\s+(the database system is|sorry, too many clients"
+    r"|remaining connection slots are reserved)"
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose circuit is open."""
+
+    def __init__(self, service: str, retry_in: float) -> None:
+        super().__init__(
+            f"{service} is unavailable; next attempt in {max(0.0, retry_in):.1f}s"
+        )
+        self.service = service
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Opens after consecutive connection failures and probes with backoff.
+
+    Closed: calls go through and `failure_threshold` consecutive failures
+    open the circuit. Open: calls fail immediately with CircuitOpenError
+    until the backoff has passed. Half-open: calls go through again; the
+    first outcome closes the circuit, or reopens it with double the backoff
+    (up to `max_reset_timeout`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        max_reset_timeout: float = CIRCUIT_MAX_RESET_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened = False
+        self._backoff = reset_timeout
+        self._retry_at = 0.0
+        self._opened_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        if not self._opened:
+            return CLOSED
+        return OPEN if time.monotonic() < self._retry_at else HALF_OPEN
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if calls should not reach the backend now."""
+        if self._opened:
+            retry_in = self._retry_at - time.monotonic()
+            if retry_in > 0:
+                raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._opened:
+                self._opened = False
+                self._opened_at = None
+                self._backoff = self._reset_timeout
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+            if self._opened:
+                if time.monotonic() < self._retry_at:
+                    # A call that started before the circuit opened
+                    return
+                # The half-open probe failed
+                self._backoff = min(self._backoff * 2, self._max_reset_timeout)
+            elif self._failures < self._failure_threshold:
+                return
+            else:
+                self._opened = True
+                self._opened_at = time.time()
+                self._trips += 1
+            self._retry_at = time.monotonic() + self._backoff
+
+    def observe(self, error: Optional[BaseException]) -> None:
+        """Record a call's outcome; errors that aren't outages are ignored."""
+        if error is None:
+            self.record_success()
+        elif is_unavailable(self.name, error):
+            self.record_failure(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self.state
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opened_at": self._opened_at,
+                "retry_in_seconds": (
+                    round(max(0.0, self._retry_at - time.monotonic()), 3)
+                    if state == OPEN
+                    else None
+                ),
+                "backoff_seconds": self._backoff,
+                "trips": self._trips,
+                "last_error": self._last_error,
+            }
+
+    def unavailable(self) -> Dict[str, Any]:
+        """The answer served in place of a snapshot while the circuit is open.
+
+        Stable for as long as the circuit stays open, so repeated answers
+        don't look like changes to ETags and live updates.
+        """
+        return {
+            "status": "error",
+            "message": f"{self.name} is unavailable: {self._last_error}",
+            "circuit": OPEN,
+            "unavailable_since": self._opened_at,
+        }
+
+
+def _loaded_types(names: Tuple[str, ...]) -> Tuple[type, ...]:
+    """The named exception classes whose modules are already imported.
+
+    A driver that was never imported cannot have raised its errors.
+    """
+    types = []
+    for name in names:
+        module, _, attr = name.partition(":")
+        if module in sys.modules:
+            types.append(getattr(sys.modules[module], attr))
+    return tuple(types)
+
+
+def _postgres_unavailable(error: BaseException) -> bool:
+    """Whether a psycopg OperationalError concerns the whole server.
+
+    A pool timeout is judged by the connect error behind it, if any.
+    """
+    if error.__cause__ is not None:
+        error = error.__cause__
+    sqlstate = getattr(error, "sqlstate", None)
+    if sqlstate is not None:
+        return sqlstate.startswith(POSTGRES_UNAVAILABLE_SQLSTATES)
+    message = str(error)
+    # Without "FATAL:" the error came from libpq itself: refused, timed out
+    # or dropped connections
+    return "FATAL:" not in message or bool(POSTGRES_UNAVAILABLE_STARTUP.search(message))
+
+
+def is_unavailable(service: str, error: BaseException) -> bool:
+    """Whether `error` means the service itself can't be reached."""
+    if isinstance(error, _loaded_types(UNAVAILABLE_ERRORS.get(service, ()))):
+        return service != "postgres" or _postgres_unavailable(error)
+    grpc = sys.modules.get("grpc")
+    return (
+        grpc is not None
+        and isinstance(error, grpc.RpcError)
+        and getattr(getattr(error, "code", lambda: None)(), "name", None)
+        in UNAVAILABLE_GRPC_CODES
+    )
+
+
+breakers: Dict[str, CircuitBreaker] = {
+    name: CircuitBreaker(name) for name in UNAVAILABLE_ERRORS
+}
@@ -0,0 +1,82 @@
+"""Small in-memory TTL cache for expensive backend lookups."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Caches values for `ttl` seconds, keeping at most `max_entries`.
+
+    `get_or_load` shares one in-flight load between concurrent callers of
+    the same key, so a burst of misses costs a single backend call.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple[float, T]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """The cached value, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Cache a value, evicting the least recently used beyond the limit."""
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Forget a key."""
+        self._entries.pop(key, None)
+
+    def prune(self, keep: Callable[[Hashable], bool]) -> None:
+        """Forget every key for which `keep(key)` is false."""
+        for key in [key for key in self._entries if not keep(key)]:
+            del self._entries[key]
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value, loading and caching it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        future = self._loading.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._loading[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,432 @@
+"""Shared, long-lived clients for every backend service."""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+from config import (
+    MINIO_ACCESS_KEY,
+    MINIO_CONNECT_TIMEOUT,
+    MINIO_ENDPOINT,
+    MINIO_MAX_ATTEMPTS,
+    MINIO_MAX_POOL_CONNECTIONS,
+    MINIO_READ_TIMEOUT,
+    MINIO_SECRET_KEY,
+    MONGODB_AUTH_SOURCE,
+    MONGODB_CONNECT_TIMEOUT,
+    MONGODB_HOST,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_PASSWORD,
+    MONGODB_PORT,
+    MONGODB_SERVER_SELECTION_TIMEOUT,
+    MONGODB_SOCKET_TIMEOUT,
+    MONGODB_USER,
+    POSTGRES_CONNECT_TIMEOUT,
+    POSTGRES_DB_POOL_MAX_SIZE,
+    POSTGRES_DEFAULT_DB,
+    POSTGRES_HOST,
+    POSTGRES_PASSWORD,
+    POSTGRES_POOL_MAX_IDLE,
+    POSTGRES_POOL_MAX_SIZE,
+    POSTGRES_POOL_MIN_SIZE,
+    POSTGRES_POOL_TIMEOUT,
+    POSTGRES_PORT,
+    POSTGRES_USER,
+    QDRANT_GRPC_PORT,
+    QDRANT_HOST,
+    QDRANT_PREFER_GRPC,
+    QDRANT_REST_PORT,
+    QDRANT_TIMEOUT,
+    REDIS_CONNECT_TIMEOUT,
+    REDIS_HOST,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_PORT,
+    REDIS_READ_TIMEOUT,
+    REDIS_RETRIES,
+)
+from services.tracing import record
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+    from psycopg import AsyncConnection
+    from psycopg_pool import AsyncConnectionPool
+    from pymongo import AsyncMongoClient
+    from qdrant_client import AsyncQdrantClient
+    from services.mongo_pool import MongoPoolListener
+    from services.redis_pool import TimedRedisPool
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStats:
+    """Thread-safe accumulator for connection checkout wait times."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record a single checkout that waited `seconds`."""
+        ms = seconds * 1000
+        with self._lock:
+            self._count += 1
+            self._total_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the accumulated stats."""
+        with self._lock:
+            return {
+                "checkouts": self._count,
+                "wait_ms_total": round(self._total_ms, 3),
+                "wait_ms_avg": (
+                    round(self._total_ms / self._count, 3) if self._count else 0.0
+                ),
+                "wait_ms_max": round(self._max_ms, 3),
+            }
+
+
+class PostgresReservedError(RuntimeError):
+    """Raised when borrowing a connection to a reserved database."""
+
+    def __init__(self, dbname: str) -> None:
+        super().__init__(f"Database {dbname} is in use as a template")
+        self.dbname = dbname
+
+
+class ClientRegistry:
+    """Holds one long-lived client or pool per backend.
+
+    Accessors create their client on first use, which also lets the
+    services work outside the app (e.g. from a script); FastAPI's lifespan
+    calls `close()` at shutdown. Every client is the native
+    asyncio variant of its driver except boto3, which has none and is only
+    used from the bounded MinIO executor.
+
+    Drivers are imported by the accessors, so a backend that is never used
+    (or disabled in ENABLED_SERVICES) never loads its driver.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._postgres_lock = asyncio.Lock()
+        self._postgres_pools: Dict[str, "AsyncConnectionPool"] = {}
+        # Borrowed connections per database, and databases kept unconnected
+        self._postgres_borrowed: Dict[str, int] = {}
+        self._postgres_reserved: Dict[str, int] = {}
+        self._postgres_idle = asyncio.Condition()
+        # Why the latest background connect to each database failed
+        self._postgres_connect_errors: Dict[str, BaseException] = {}
+        self._redis_pool: Optional["TimedRedisPool"] = None
+        self._mongo_client: Optional["AsyncMongoClient"] = None
+        self._mongo_listener: Optional["MongoPoolListener"] = None
+        self._s3_client: Any = None
+        self._qdrant_client: Optional["AsyncQdrantClient"] = None
+
+    async def close(self) -> None:
+        """Close every pool and client held by the registry."""
+        async with self._postgres_lock:
+            pools = list(self._postgres_pools.values())
+            self._postgres_pools.clear()
+        with self._lock:
+            redis_pool, self._redis_pool = self._redis_pool, None
+            mongo_client, self._mongo_client = self._mongo_client, None
+            self._mongo_listener = None
+            s3_client, self._s3_client = self._s3_client, None
+            qdrant_client, self._qdrant_client = self._qdrant_client, None
+
+        for pool in pools:
+            await pool.close()
+        if redis_pool:
+            await redis_pool.disconnect()
+        if mongo_client:
+            await mongo_client.close()
+        if s3_client:
+            s3_client.close()
+        if qdrant_client:
+            await qdrant_client.close()
+        logger.info("Backend client registry closed")
+
+    async def _postgres_pool(self, dbname: str) -> "AsyncConnectionPool":
+        """Get (creating and opening if needed) the pool for a database."""
+        pool = self._postgres_pools.get(dbname)
+        if pool is not None:
+            return pool
+        from psycopg import AsyncConnection
+        from psycopg_pool import AsyncConnectionPool
+
+        errors = self._postgres_connect_errors
+
+        class RecordingConnection(AsyncConnection):
+            """Remembers why connecting failed; the pool only logs it."""
+
+            @classmethod
+            async def connect(cls, *args: Any, **kwargs: Any) -> "AsyncConnection":
+                try:
+                    conn = await super().connect(*args, **kwargs)
+                except Exception as error:
+                    errors[dbname] = error
+                    raise
+                errors.pop(dbname, None)
+                return conn
+
+        async with self._postgres_lock:
+            pool = self._postgres_pools.get(dbname)
+            if pool is None:
+                is_default = dbname == POSTGRES_DEFAULT_DB
+                pool = AsyncConnectionPool(
+                    kwargs={
+                        "host": POSTGRES_HOST,
+                        "port": POSTGRES_PORT,
+                        "user": POSTGRES_USER,
+                        "password": POSTGRES_PASSWORD,
+                        "dbname": dbname,
+                        "autocommit": True,
+                        "connect_timeout": POSTGRES_CONNECT_TIMEOUT,
+                    },
+                    min_size=POSTGRES_POOL_MIN_SIZE if is_default else 0,
+                    max_size=(
+                        POSTGRES_POOL_MAX_SIZE
+                        if is_default
+                        else POSTGRES_DB_POOL_MAX_SIZE
+                    ),
+                    max_idle=POSTGRES_POOL_MAX_IDLE,
+                    timeout=POSTGRES_POOL_TIMEOUT,
+                    name=f"postgres-{dbname}",
+                    connection_class=RecordingConnection,
+                    open=False,
+                )
+                await pool.open()
+                self._postgres_pools[dbname] = pool
+            return pool
+
+    @asynccontextmanager
+    async def postgres(
+        self, dbname: str = POSTGRES_DEFAULT_DB
+    ) -> AsyncIterator["AsyncConnection"]:
+        """Borrow a pooled connection to a PostgreSQL database.
+
+        Traced as `postgres.connect`, including opening a new pool. Raises
+        PostgresReservedError for a database held by `reserve_postgres`.
+        A PoolTimeout carries the last connect error as its `__cause__`.
+        """
+        if self.is_reserved(dbname):
+            raise PostgresReservedError(dbname)
+        start = time.perf_counter()
+        self._postgres_borrowed[dbname] = self._postgres_borrowed.get(dbname, 0) + 1
+        try:
+            pool = await self._postgres_pool(dbname)
+            async with pool.connection() as conn:
+                record("postgres.connect", start, dbname)
+                yield conn
+        except Exception as error:
+            from psycopg_pool import PoolTimeout
+
+            if isinstance(error, PoolTimeout) and error.__cause__ is None:
+                error.__cause__ = self._postgres_connect_errors.get(dbname)
+            raise
+        finally:
+            async with self._postgres_idle:
+                self._postgres_borrowed[dbname] -= 1
+                if not self._postgres_borrowed[dbname]:
+                    del self._postgres_borrowed[dbname]
+                    self._postgres_idle.notify_all()
+
+    def is_reserved(self, dbname: str) -> bool:
+        """Whether a database must not be connected to right now."""
+        return dbname in self._postgres_reserved
+
+    @asynccontextmanager
+    async def reserve_postgres(self, dbname: str) -> AsyncIterator[None]:
+        """Hold no connections to a database for the duration of the block.
+
+        New borrows are refused, in-flight ones are waited for and the pool
+        is closed. Needed by statements such as `CREATE DATABASE ... TEMPLATE`
+        that fail while the source database has other sessions.
+        """
+        self._postgres_reserved[dbname] = self._postgres_reserved.get(dbname, 0) + 1
+        try:
+            async with self._postgres_idle:
+                await self._postgres_idle.wait_for(
+                    lambda: dbname not in self._postgres_borrowed
+                )
+            await self.release_postgres(dbname)
+            yield
+        finally:
+            self._postgres_reserved[dbname] -= 1
+            if not self._postgres_reserved[dbname]:
+                del self._postgres_reserved[dbname]
+
+    async def release_postgres(self, dbname: str) -> None:
+        """Close the pool for a database so it holds no connections to it."""
+        async with self._postgres_lock:
+            pool = self._postgres_pools.pop(dbname, None)
+            self._postgres_connect_errors.pop(dbname, None)
+        if pool is not None:
+            await pool.close()
+
+    def redis(self) -> "aioredis.Redis":
+        """Get a Redis client backed by the shared connection pool."""
+        import redis.asyncio as aioredis
+        from redis.asyncio.retry import Retry
+        from redis.backoff import ExponentialBackoff
+        from services.redis_pool import TimedRedisPool
+
+        with self._lock:
+            if self._redis_pool is None:
+                self._redis_pool = TimedRedisPool(
+                    host=REDIS_HOST,
+                    port=REDIS_PORT,
+                    decode_responses=True,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                    timeout=REDIS_POOL_TIMEOUT,
+                    socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                    socket_timeout=REDIS_READ_TIMEOUT,
+                    retry=Retry(ExponentialBackoff(cap=1.0), REDIS_RETRIES),
+                )
+            return aioredis.Redis(connection_pool=self._redis_pool)
+
+    @asynccontextmanager
+    async def redis_db(self, db: int) -> AsyncIterator["aioredis.Redis"]:
+        """Open a dedicated single-connection client on a logical Redis DB.
+
+        Responses are left as bytes so keys that are not valid UTF-8 survive.
+        """
+        import redis.asyncio as aioredis
+        from redis.asyncio.retry import Retry
+        from redis.backoff import ExponentialBackoff
+
+        client = aioredis.Redis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=db,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            socket_timeout=REDIS_READ_TIMEOUT,
+            retry=Retry(ExponentialBackoff(cap=1.0), REDIS_RETRIES),
+            single_connection_client=True,
+        )
+        try:
+            yield client
+        finally:
+            await client.aclose()
+
+    def mongo(self) -> "AsyncMongoClient":
+        """Get the shared MongoDB client."""
+        from pymongo import AsyncMongoClient
+        from services.mongo_pool import MongoPoolListener
+
+        with self._lock:
+            if self._mongo_client is None:
+                self._mongo_listener = MongoPoolListener()
+                self._mongo_client = AsyncMongoClient(
+                    MONGODB_HOST,
+                    MONGODB_PORT,
+                    username=MONGODB_USER,
+                    password=MONGODB_PASSWORD,
+                    authSource=MONGODB_AUTH_SOURCE,
+                    serverSelectionTimeoutMS=int(
+                        MONGODB_SERVER_SELECTION_TIMEOUT * 1000
+                    ),
+                    connectTimeoutMS=int(MONGODB_CONNECT_TIMEOUT * 1000),
+                    socketTimeoutMS=int(MONGODB_SOCKET_TIMEOUT * 1000),
+                    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                    event_listeners=[self._mongo_listener],
+                )
+            return self._mongo_client
+
+    def s3(self):
+        """Get the shared MinIO S3 client (thread-safe, blocking)."""
+        with self._lock:
+            if self._s3_client is None:
+                import boto3
+                from botocore.config import Config
+
+                self._s3_client = boto3.client(
+                    "s3",
+                    endpoint_url=MINIO_ENDPOINT,
+                    aws_access_key_id=MINIO_ACCESS_KEY,
+                    aws_secret_access_key=MINIO_SECRET_KEY,
+                    config=Config(
+                        signature_version="s3v4",
+                        max_pool_connections=MINIO_MAX_POOL_CONNECTIONS,
+                        connect_timeout=MINIO_CONNECT_TIMEOUT,
+                        read_timeout=MINIO_READ_TIMEOUT,
+                        retries={
+                            "max_attempts": MINIO_MAX_ATTEMPTS,
+                            "mode": "standard",
+                        },
+                    ),
+                )
+            return self._s3_client
+
+    def qdrant(self) -> "AsyncQdrantClient":
+        """Get the shared Qdrant client."""
+        with self._lock:
+            if self._qdrant_client is None:
+                from qdrant_client import AsyncQdrantClient
+
+                self._qdrant_client = AsyncQdrantClient(
+                    host=QDRANT_HOST,
+                    port=QDRANT_REST_PORT,
+                    grpc_port=QDRANT_GRPC_PORT,
+                    prefer_grpc=QDRANT_PREFER_GRPC,
+                    timeout=QDRANT_TIMEOUT,
+                )
+            return self._qdrant_client
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool sizes and checkout wait times for every backend."""
+        with self._lock:
+            postgres_pools = dict(self._postgres_pools)
+            redis_pool = self._redis_pool
+            mongo_listener = self._mongo_listener
+            s3_ready = self._s3_client is not None
+            qdrant_ready = self._qdrant_client is not None
+
+        postgres: Dict[str, Any] = {}
+        for dbname, pool in postgres_pools.items():
+            pool_stats = pool.get_stats()
+            postgres[dbname] = {
+                "size": pool_stats.get("pool_size", 0),
+                "available": pool_stats.get("pool_available", 0),
+                "max_size": pool_stats.get("pool_max", pool.max_size),
+                "waiting": pool_stats.get("requests_waiting", 0),
+                "checkouts": pool_stats.get("requests_num", 0),
+                "wait_ms_total": pool_stats.get("requests_wait_ms", 0),
+                "timeouts": pool_stats.get("requests_errors", 0),
+            }
+
+        return {
+            "postgres": postgres,
+            "redis": (
+                {
+                    "size": redis_pool.created,
+                    "in_use": redis_pool.in_use,
+                    "max_size": redis_pool.max_connections,
+                    **redis_pool.wait_stats.to_dict(),
+                }
+                if redis_pool
+                else None
+            ),
+            "mongodb": (
+                {
+                    "size": mongo_listener.open_connections,
+                    "in_use": mongo_listener.in_use,
+                    "max_size": MONGODB_MAX_POOL_SIZE,
+                    **mongo_listener.wait_stats.to_dict(),
+                }
+                if mongo_listener
+                else None
+            ),
+            "minio": ({"max_size": MINIO_MAX_POOL_CONNECTIONS} if s3_ready else None),
+            "qdrant": {"ready": qdrant_ready},
+        }
+
+
+clients = ClientRegistry()
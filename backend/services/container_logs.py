@@ -0,0 +1,262 @@
+"""Incremental, filtered log streams for the infra containers."""
+
+import asyncio
+import logging
+import re
+import threading
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+import orjson
+from config import LOG_CHUNK_BYTES, LOG_MAX_LINE_BYTES, LOG_STREAM_BUFFER
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stream in the buffer
+_END = None
+
+
+class LogStream:
+    """Streams one container's logs without holding them in memory.
+
+    A dedicated thread reads Docker's log stream, splits it into lines,
+    applies the regex filter and renders the kept lines. Rendered chunks
+    go into a buffer of LOG_STREAM_BUFFER slots that the event loop drains.
+    When the client reads slowly the buffer fills and the thread blocks, so
+    Docker's socket stops being read. Backpressure ends at the daemon
+    instead of in this process's memory.
+
+    The thread only wakes the loop rather than waiting on it, so a log
+    written one line per frame isn't paced by loop round trips.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        container_id: str,
+        *,
+        follow: bool,
+        tail: Union[int, str],
+        since: Optional[float],
+        stdout: bool,
+        stderr: bool,
+        timestamps: bool,
+        pattern: Optional[Pattern[str]],
+        format: str,
+    ) -> None:
+        self._client = client
+        self._container_id = container_id
+        self._options: Dict[str, Any] = {
+            "stdout": stdout,
+            "stderr": stderr,
+            "follow": follow,
+            "tail": tail,
+            # NDJSON lines always carry their timestamp
+            "timestamps": timestamps or format == "ndjson",
+        }
+        if since is not None:
+            self._options["since"] = since
+        self._pattern = pattern
+        self._format = format
+        self._buffer: Deque[Optional[bytes]] = deque()
+        self._slots = threading.Semaphore(LOG_STREAM_BUFFER)
+        self._ready = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stream: Any = None
+        self._stopping = threading.Event()
+        # Timestamp and filter outcome of the last piece, for its continuations
+        self._timestamp: Optional[str] = None
+        self._kept = False
+        self._thread = threading.Thread(
+            target=self._read, name=f"logs-{container_id}", daemon=True
+        )
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield rendered output until the log ends or the client leaves.
+
+        Chunks already waiting in the buffer are joined, up to
+        LOG_CHUNK_BYTES, so a fast producer is sent in few large writes.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._thread.start()
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                parts: List[bytes] = []
+                size = 0
+                while self._buffer and size < LOG_CHUNK_BYTES:
+                    chunk = self._buffer.popleft()
+                    self._slots.release()
+                    if chunk is _END:
+                        if parts:
+                            yield b"".join(parts)
+                        return
+                    parts.append(chunk)
+                    size += len(chunk)
+                if self._buffer:
+                    # Over LOG_CHUNK_BYTES; send the rest on the next pass
+                    self._ready.set()
+                if parts:
+                    yield b"".join(parts)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop reading; unblocks a follow stream waiting for output."""
+        self._stopping.set()
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _read(self) -> None:
+        pending = b""
+        # Whether `pending` continues a line whose start was already sent
+        continued = False
+        try:
+            self._stream = self._client.api.logs(
+                self._container_id, stream=True, **self._options
+            )
+            for data in self._stream:
+                if self._stopping.is_set():
+                    return
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                pieces: List[Tuple[bytes, bool]] = []
+                for line in lines:
+                    pieces.extend(_split_line(line, continued))
+                    continued = False
+                if len(pending) > LOG_MAX_LINE_BYTES:
+                    # Send runaway lines in pieces instead of buffering them whole
+                    *done, (pending, _) = _split_line(pending, continued)
+                    pieces.extend(done)
+                    continued = True
+                chunk = self._render(pieces)
+                if chunk and not self._put(chunk):
+                    return
+            if pending:
+                chunk = self._render(_split_line(pending, continued))
+                if chunk:
+                    self._put(chunk)
+        except Exception as e:
+            if self._stopping.is_set():
+                return
+            logger.error(f"Log stream for {self._container_id} failed: {e}")
+            if self._format == "ndjson":
+                self._put(orjson.dumps({"error": str(e)}) + b"\n")
+        finally:
+            self._stream = None
+            if not self._stopping.is_set():
+                self._put(_END)
+
+    def _render(self, pieces: List[Tuple[bytes, bool]]) -> bytes:
+        """Filter line pieces and render the kept ones in the response format.
+
+        Each piece is `(raw, partial)`; partial pieces continue the previous
+        one's line. They share its timestamp and are kept whenever the
+        piece before them was, so a match keeps the rest of its line.
+        """
+        out = []
+        for raw, partial in pieces:
+            line = raw.decode("utf-8", "replace").rstrip("\r")
+            if partial:
+                timestamp = self._timestamp
+            else:
+                timestamp = None
+                if self._options["timestamps"]:
+                    timestamp, _, line = line.partition(" ")
+                self._timestamp = timestamp
+            self._kept = (
+                self._pattern is None
+                or (partial and self._kept)
+                or self._pattern.search(line) is not None
+            )
+            if not self._kept:
+                continue
+            if self._format == "ndjson":
+                out.append(
+                    orjson.dumps(
+                        {"timestamp": timestamp, "line": line, "partial": partial}
+                    )
+                )
+            elif timestamp is not None:
+                out.append(f"{timestamp} {line}".encode())
+            else:
+                out.append(line.encode())
+        return b"\n".join(out) + b"\n" if out else b""
+
+    def _put(self, chunk: Optional[bytes]) -> bool:
+        """Buffer a chunk, waiting for a free slot; False once closed."""
+        while not self._slots.acquire(timeout=1.0):
+            if self._stopping.is_set():
+                return False
+        self._buffer.append(chunk)
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # The event loop is gone
+            return False
+        return True
+
+
+def _split_line(line: bytes, continued: bool) -> List[Tuple[bytes, bool]]:
+    """Cut a line into LOG_MAX_LINE_BYTES pieces, flagging continuations.
+
+    Cuts back off to a UTF-8 character boundary. `continued` marks the
+    first piece as continuing an earlier one too.
+    """
+    pieces = []
+    while len(line) > LOG_MAX_LINE_BYTES:
+        cut = LOG_MAX_LINE_BYTES
+        while cut > 0 and line[cut] & 0xC0 == 0x80:
+            cut -= 1
+        cut = cut or LOG_MAX_LINE_BYTES
+        pieces.append((line[:cut], continued))
+        line = line[cut:]
+        continued = True
+    pieces.append((line, continued))
+    return pieces
+
+
+class LogStreams:
+    """Tracks open log streams so their threads stay bounded."""
+
+    def __init__(self, max_streams: int) -> None:
+        self._max_streams = max_streams
+        self._open: List[LogStream] = []
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._open) >= self._max_streams
+
+    async def stream(self, log: LogStream) -> AsyncIterator[bytes]:
+        """Yield from `log` while counting it as open."""
+        self._open.append(log)
+        try:
+            async for chunk in log.chunks():
+                yield chunk
+        finally:
+            self._open.remove(log)
+
+
+def compile_filter(pattern: Optional[str], ignore_case: bool) -> Optional[Pattern]:
+    """Compile a line filter, raising ValueError for an invalid regex."""
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern: {e}")
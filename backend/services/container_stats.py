@@ -0,0 +1,266 @@
+"""Live CPU, memory, network and block I/O stats for the infra containers."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from config import CONTAINER_STATS_HISTORY, CONTAINER_STATS_RECONCILE_INTERVAL
+from services.history import history
+
+logger = logging.getLogger(__name__)
+
+# Fields of each sample kept in the short per-container history
+HISTORY_FIELDS = (
+    "cpu_percent",
+    "memory_bytes",
+    "network_rx_rate",
+    "network_tx_rate",
+    "block_read_rate",
+    "block_write_rate",
+)
+
+
+def _cpu_totals(sample: Dict[str, Any]) -> tuple:
+    cpu = sample.get("cpu_stats") or {}
+    usage = cpu.get("cpu_usage") or {}
+    online = cpu.get("online_cpus") or len(usage.get("percpu_usage") or []) or 1
+    return usage.get("total_usage", 0), cpu.get("system_cpu_usage", 0), online
+
+
+def _memory_used(memory: Dict[str, Any]) -> int:
+    """Usage minus reclaimable page cache, as `docker stats` reports it."""
+    usage = memory.get("usage", 0)
+    stats = memory.get("stats") or {}
+    # cgroup v2 reports inactive_file, v1 total_inactive_file
+    cache = stats.get("inactive_file", stats.get("total_inactive_file", 0))
+    return max(0, usage - cache) if cache < usage else usage
+
+
+def _network_totals(sample: Dict[str, Any]) -> tuple:
+    networks = (sample.get("networks") or {}).values()
+    return (
+        sum(n.get("rx_bytes", 0) for n in networks),
+        sum(n.get("tx_bytes", 0) for n in networks),
+    )
+
+
+def _block_totals(sample: Dict[str, Any]) -> tuple:
+    entries = (sample.get("blkio_stats") or {}).get("io_service_bytes_recursive")
+    read = write = 0
+    for entry in entries or []:
+        op = entry.get("op", "").lower()
+        if op == "read":
+            read += entry.get("value", 0)
+        elif op == "write":
+            write += entry.get("value", 0)
+    return read, write
+
+
+class _Counters:
+    """The cumulative counters of one raw sample, kept to diff the next one."""
+
+    def __init__(self, sample: Dict[str, Any], received: float) -> None:
+        self.received = received
+        self.cpu_total, self.system_total, self.online_cpus = _cpu_totals(sample)
+        self.rx, self.tx = _network_totals(sample)
+        self.block_read, self.block_write = _block_totals(sample)
+
+
+def compute(
+    sample: Dict[str, Any], current: _Counters, previous: Optional[_Counters]
+) -> Dict[str, Any]:
+    """Turn a raw Docker stats sample into percentages and per-second rates.
+
+    Rates need a previous sample; the first one of a stream reports them
+    as None rather than trusting Docker's zeroed `precpu_stats`.
+    """
+    memory = sample.get("memory_stats") or {}
+    used = _memory_used(memory)
+    limit = memory.get("limit") or 0
+    stats: Dict[str, Any] = {
+        "cpu_percent": None,
+        "online_cpus": current.online_cpus,
+        "memory_bytes": used,
+        "memory_limit_bytes": limit or None,
+        "memory_percent": round(used / limit * 100, 2) if limit else None,
+        "network_rx_bytes": current.rx,
+        "network_tx_bytes": current.tx,
+        "network_rx_rate": None,
+        "network_tx_rate": None,
+        "block_read_bytes": current.block_read,
+        "block_write_bytes": current.block_write,
+        "block_read_rate": None,
+        "block_write_rate": None,
+        "pids": (sample.get("pids_stats") or {}).get("current"),
+    }
+    if previous is None:
+        return stats
+
+    cpu_delta = current.cpu_total - previous.cpu_total
+    system_delta = current.system_total - previous.system_total
+    if system_delta > 0 and cpu_delta >= 0:
+        stats["cpu_percent"] = round(
+            cpu_delta / system_delta * current.online_cpus * 100, 2
+        )
+
+    elapsed = current.received - previous.received
+    if elapsed > 0:
+        for field, now, before in (
+            ("network_rx_rate", current.rx, previous.rx),
+            ("network_tx_rate", current.tx, previous.tx),
+            ("block_read_rate", current.block_read, previous.block_read),
+            ("block_write_rate", current.block_write, previous.block_write),
+        ):
+            # Counters restart with the container; skip the negative delta
+            if now >= before:
+                stats[field] = round((now - before) / elapsed, 1)
+    return stats
+
+
+class _ContainerStream:
+    """Latest stats and short history of one container, fed by its thread."""
+
+    def __init__(self, container_id: str, name: str) -> None:
+        self.container_id = container_id
+        self.name = name
+        self.latest: Optional[Dict[str, Any]] = None
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=CONTAINER_STATS_HISTORY)
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.error: Optional[str] = None
+
+
+class ContainerStats:
+    """One persistent `docker stats` stream per running infra container.
+
+    Docker pushes a sample about once a second on each stream, so reads
+    are served from memory instead of paying the ~2s one-shot `stats`
+    call per container. Each stream runs on its own daemon thread, and
+    the set of streams follows the running containers in the index.
+    """
+
+    def __init__(self, client: Any, index: Any) -> None:
+        self._client = client
+        self._index = index
+        self._lock = threading.Lock()
+        self._streams: Dict[str, _ContainerStream] = {}
+        self._reconciler: Optional[asyncio.Task] = None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Latest stats of every followed container, sorted by name."""
+        with self._lock:
+            streams = list(self._streams.values())
+        return sorted(
+            (self._describe(stream) for stream in streams), key=lambda s: s["name"]
+        )
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Latest stats and recent samples of one container, by name."""
+        with self._lock:
+            stream = next((s for s in self._streams.values() if s.name == name), None)
+        if stream is None:
+            return None
+        return {**self._describe(stream), "history": list(stream.history)}
+
+    async def start(self) -> None:
+        """Follow the running containers, re-checking the index periodically."""
+        self._sync()
+        self._reconciler = asyncio.create_task(
+            self._reconcile_loop(), name="container-stats"
+        )
+
+    async def stop(self) -> None:
+        """Stop every stream; threads exit after their next sample."""
+        if self._reconciler is not None:
+            self._reconciler.cancel()
+            await asyncio.gather(self._reconciler, return_exceptions=True)
+            self._reconciler = None
+        with self._lock:
+            streams = list(self._streams.values())
+            self._streams.clear()
+        for stream in streams:
+            stream.stopping.set()
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(CONTAINER_STATS_RECONCILE_INTERVAL)
+            try:
+                self._sync()
+            except Exception as e:
+                logger.error(f"Container stats reconciliation failed: {e}")
+
+    def _sync(self) -> None:
+        """Start streams for new running containers and stop stale ones."""
+        running = {
+            c["id"]: c["name"] for c in self._index.list() if c["status"] == "running"
+        }
+        with self._lock:
+            for container_id in list(self._streams):
+                stream = self._streams[container_id]
+                if container_id not in running or not stream.thread.is_alive():
+                    stream.stopping.set()
+                    del self._streams[container_id]
+            for container_id, name in running.items():
+                if container_id not in self._streams:
+                    stream = _ContainerStream(container_id, name)
+                    stream.thread = threading.Thread(
+                        target=self._follow,
+                        args=(stream,),
+                        name=f"stats-{name}",
+                        daemon=True,
+                    )
+                    self._streams[container_id] = stream
+                    stream.thread.start()
+
+    def _follow(self, stream: _ContainerStream) -> None:
+        """Consume one container's stats stream until stopped or it ends.
+
+        A stream that ends or fails is dropped, and restarted by the next
+        sync if the container is still running.
+        """
+        previous: Optional[_Counters] = None
+        try:
+            samples = self._client.api.stats(
+                stream.container_id, stream=True, decode=True
+            )
+            for sample in samples:
+                if stream.stopping.is_set():
+                    break
+                if not sample.get("read") or sample["read"].startswith("0001-"):
+                    # Sent while the container is stopping
+                    continue
+                current = _Counters(sample, time.monotonic())
+                stats = compute(sample, current, previous)
+                previous = current
+                self._record(stream, stats)
+        except Exception as e:
+            if not stream.stopping.is_set():
+                logger.error(f"Stats stream for {stream.name} failed: {e}")
+                stream.error = str(e)
+
+    def _record(self, stream: _ContainerStream, stats: Dict[str, Any]) -> None:
+        timestamp = time.time()
+        stream.latest = {**stats, "updated_at": timestamp}
+        stream.history.append(
+            {"timestamp": timestamp, **{f: stats[f] for f in HISTORY_FIELDS}}
+        )
+        history.record(
+            {
+                f"container.{stream.name}.{field}": stats[field]
+                for field in HISTORY_FIELDS
+                if stats[field] is not None
+            },
+            timestamp,
+        )
+
+    @staticmethod
+    def _describe(stream: _ContainerStream) -> Dict[str, Any]:
+        return {
+            "id": stream.container_id,
+            "name": stream.name,
+            "stats": stream.latest,
+            "error": stream.error,
+        }
@@ -0,0 +1,198 @@
+"""In-memory index of infra containers, kept current by Docker events."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from services.events import broker
+from services.executors import run_blocking
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_PREFIX = "infra-"
+WATCHED_EVENTS = ["create", "start", "stop", "die", "health_status", "destroy"]
+
+
+def _parse_health(status: str) -> str:
+    """Extract the health state from a `docker ps` status like "Up 2h (healthy)"."""
+    if "(health: starting)" in status:
+        return "starting"
+    if "(unhealthy)" in status:
+        return "unhealthy"
+    if "(healthy)" in status:
+        return "healthy"
+    return "unknown"
+
+
+class ContainerIndex:
+    """Container state for `/services`, served from memory.
+
+    The index is filled with one `docker ps` call at startup and then updated
+    from the Docker events stream, which a dedicated thread follows. Each
+    event costs a single filtered list call for that container. Image tags
+    are cached by image ID, so they are only inspected once per image. A
+    periodic full reconciliation repairs anything a dropped event missed.
+    """
+
+    def __init__(self, client: Any, reconcile_interval: float) -> None:
+        self._client = client
+        self._reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        self._containers: Dict[str, Dict[str, Any]] = {}
+        self._image_tags: Dict[str, str] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stream: Any = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reconciler: Optional[asyncio.Task] = None
+        self.ready = False
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Return the indexed containers, sorted by name."""
+        with self._lock:
+            containers = list(self._containers.values())
+        return sorted(containers, key=lambda c: c["name"])
+
+    async def start(self) -> None:
+        """Fill the index, then follow the events stream and reconcile."""
+        self._loop = asyncio.get_running_loop()
+        self._stopping.clear()
+        try:
+            await run_blocking("docker", self._reconcile)
+        except Exception as e:
+            logger.error(f"Initial Docker container listing failed: {e}")
+        self._thread = threading.Thread(
+            target=self._follow_events, name="docker-events", daemon=True
+        )
+        self._thread.start()
+        self._reconciler = asyncio.create_task(
+            self._reconcile_loop(), name="container-reconcile"
+        )
+
+    async def stop(self) -> None:
+        """Stop following events and cancel reconciliation."""
+        self._stopping.set()
+        stream = self._stream
+        if stream is not None:
+            stream.close()
+        if self._reconciler is not None:
+            self._reconciler.cancel()
+            await asyncio.gather(self._reconciler, return_exceptions=True)
+            self._reconciler = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join, 5)
+            self._thread = None
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await run_blocking("docker", self._reconcile)
+            except Exception as e:
+                logger.error(f"Docker container reconciliation failed: {e}")
+
+    def _follow_events(self) -> None:
+        """Apply container events until stopped, reconnecting on errors."""
+        backoff = 1.0
+        while not self._stopping.is_set():
+            try:
+                self._stream = self._client.api.events(
+                    filters={"type": "container", "event": WATCHED_EVENTS},
+                    decode=True,
+                )
+                # Events may have been missed while reconnecting
+                if backoff > 1.0:
+                    self._reconcile()
+                    backoff = 1.0
+                for event in self._stream:
+                    self._apply_event(event)
+            except Exception as e:
+                if self._stopping.is_set():
+                    break
+                logger.error(f"Docker events stream failed: {e}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                self._stream = None
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Update the single container an event refers to."""
+        actor = event.get("Actor", {})
+        name = actor.get("Attributes", {}).get("name", "")
+        container_id = actor.get("ID") or event.get("id")
+        if not name.startswith(CONTAINER_PREFIX) or not container_id:
+            return
+
+        if event.get("Action") == "destroy":
+            self._replace({container_id: None})
+            return
+        rows = self._client.api.containers(all=True, filters={"id": container_id})
+        self._replace({container_id: self._to_service(rows[0]) if rows else None})
+
+    def _reconcile(self) -> None:
+        """Rebuild the whole index from a single `docker ps` call."""
+        rows = self._client.api.containers(all=True, filters={"name": CONTAINER_PREFIX})
+        current: Dict[str, Optional[Dict[str, Any]]] = {}
+        for row in rows:
+            # The name filter matches substrings, the prefix check is exact
+            if (row.get("Names") or [""])[0].lstrip("/").startswith(CONTAINER_PREFIX):
+                current[row["Id"]] = self._to_service(row)
+
+        with self._lock:
+            for container_id in self._containers.keys() - current.keys():
+                current[container_id] = None
+            in_use = {row.get("ImageID") for row in rows}
+            for image_id in list(self._image_tags):
+                if image_id not in in_use:
+                    del self._image_tags[image_id]
+        self._replace(current)
+        self.ready = True
+
+    def _replace(self, updates: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Apply updates (None removes) and publish the ones that changed."""
+        changed: List[Dict[str, Any]] = []
+        with self._lock:
+            for container_id, service in updates.items():
+                previous = self._containers.get(container_id)
+                if service is None:
+                    if previous is not None:
+                        del self._containers[container_id]
+                        changed.append({"name": previous["name"], "container": None})
+                elif previous != service:
+                    self._containers[container_id] = service
+                    changed.append({"name": service["name"], "container": service})
+        if changed and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._publish, changed)
+
+    @staticmethod
+    def _publish(changed: List[Dict[str, Any]]) -> None:
+        for change in changed:
+            broker.publish("container", change["name"], change)
+
+    def _to_service(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a `docker ps` row to the `/services` response shape."""
+        names = row.get("Names") or [""]
+        return {
+            "id": row["Id"][:12],
+            "name": names[0].lstrip("/"),
+            "image": self._image_tag(row.get("ImageID", "")),
+            "status": row.get("State", "unknown"),
+            "health": _parse_health(row.get("Status", "")),
+        }
+
+    def _image_tag(self, image_id: str) -> str:
+        """First tag of an image, inspected once per image ID."""
+        with self._lock:
+            tag = self._image_tags.get(image_id)
+        if tag is None:
+            try:
+                tags = self._client.api.inspect_image(image_id).get("RepoTags") or []
+            except Exception as e:
+                logger.error(f"Error inspecting image {image_id}: {e}")
+                return "unknown"
+            tag = tags[0] if tags else "unknown"
+            with self._lock:
+                self._image_tags[image_id] = tag
+        return tag
@@ -0,0 +1,50 @@
+"""Per-second rates from cumulative counters, between successive samples."""
+
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+Counters = Dict[str, float]
+
+
+class CounterRates:
+    """Turns lifetime counters (calls, scans, commits) into rates.
+
+    Each namespace keeps only its latest sample, replaced on every call,
+    so keys that disappear (dropped tables, evicted statements) are
+    forgotten automatically.
+    """
+
+    def __init__(self) -> None:
+        self._samples: Dict[str, Tuple[float, Dict[Hashable, Counters]]] = {}
+
+    def rates(
+        self, namespace: str, sample: Dict[Hashable, Counters]
+    ) -> Tuple[Optional[float], Dict[Hashable, Optional[Counters]]]:
+        """Record `sample` and return the interval and each key's rates.
+
+        Keys that are new, or whose counters went backwards (a stats
+        reset), have no rates until the next sample.
+        """
+        now = time.monotonic()
+        previous = self._samples.get(namespace)
+        self._samples[namespace] = (now, sample)
+        if previous is None or now <= previous[0]:
+            return None, {key: None for key in sample}
+
+        elapsed = now - previous[0]
+        rates: Dict[Hashable, Optional[Counters]] = {}
+        for key, counters in sample.items():
+            before = previous[1].get(key)
+            if before is None or any(
+                counters[name] < before.get(name, 0) for name in counters
+            ):
+                rates[key] = None
+            else:
+                rates[key] = {
+                    name: (value - before.get(name, 0)) / elapsed
+                    for name, value in counters.items()
+                }
+        return elapsed, rates
+
+    def forget(self, namespace: str) -> None:
+        self._samples.pop(namespace, None)
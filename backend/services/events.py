@@ -0,0 +1,108 @@
+"""In-process publish/subscribe broker for pushing live updates to clients."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import EVENTS_MAX_SUBSCRIBERS
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def diff_dicts(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow diff of two dicts as `{"set": {...}, "unset": [...]}`."""
+    return {
+        "set": {k: v for k, v in new.items() if old.get(k, _MISSING) != v},
+        "unset": [k for k in old if k not in new],
+    }
+
+
+def format_sse(event: str, payload: Any) -> str:
+    """Frame a payload as a Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+class Subscriber:
+    """A single client's pending events, coalesced per key.
+
+    Only the latest event per (event, key) is kept, so a slow consumer holds
+    at most one pending event per container or service no matter how far
+    behind it falls. When an incremental event is coalesced onto another
+    one, the publisher's full-state fallback is sent instead.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+        self._ready = asyncio.Event()
+        self.coalesced = 0
+
+    def push(self, event: str, key: str, payload: Any, full: Any = None) -> None:
+        """Queue an event, replacing any pending event with the same key."""
+        slot = (event, key)
+        if slot in self._pending:
+            self.coalesced += 1
+            if full is not None:
+                event, payload = full
+        self._pending[slot] = (event, payload)
+        self._ready.set()
+
+    async def next_batch(self, timeout: float) -> List[Tuple[str, Any]]:
+        """Wait up to `timeout` seconds for events and drain them."""
+        if not self._pending:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+
+class EventBroker:
+    """Fans published events out to every subscriber."""
+
+    def __init__(self, max_subscribers: int) -> None:
+        self._max_subscribers = max_subscribers
+        self._subscribers: Set[Subscriber] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the subscriber limit has been reached."""
+        return len(self._subscribers) >= self._max_subscribers
+
+    def subscribe(self) -> Subscriber:
+        """Register a new subscriber."""
+        subscriber = Subscriber()
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber."""
+        self._subscribers.discard(subscriber)
+
+    def publish(
+        self,
+        event: str,
+        key: str,
+        payload: Any,
+        full: Optional[Tuple[str, Any]] = None,
+    ) -> None:
+        """Publish an event to every subscriber.
+
+        `full` is an optional `(event, payload)` pair carrying the complete
+        state, used in place of `payload` when it has to be coalesced.
+        """
+        for subscriber in list(self._subscribers):
+            subscriber.push(event, key, payload, full)
+
+
+broker = EventBroker(EVENTS_MAX_SUBSCRIBERS)
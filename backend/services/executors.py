@@ -0,0 +1,53 @@
+"""Dedicated, bounded thread pools for SDKs without an asyncio driver."""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from config import DOCKER_WORKERS, MINIO_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# boto3 (MinIO) and the Docker SDK are blocking-only; each gets its own pool
+# so a slow backend can only exhaust its own workers, never the event loop.
+EXECUTOR_SIZES: Dict[str, int] = {
+    "minio": MINIO_WORKERS,
+    "docker": DOCKER_WORKERS,
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    """Get (creating if needed) the named executor."""
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_SIZES[name], thread_name_prefix=name
+            )
+            _executors[name] = executor
+        return executor
+
+
+async def run_blocking(name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on the named executor without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(name), call)
+
+
+def shutdown_executors() -> None:
+    """Shut down every executor, dropping queued work."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+    logger.info("Blocking executors shut down")
@@ -0,0 +1,216 @@
+"""Bounded in-memory metrics history with downsampled ring buffers."""
+
+import fnmatch
+import logging
+import re
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import HISTORY_MAX_SERIES, HISTORY_TIERS
+
+logger = logging.getLogger(__name__)
+
+RANGE_PATTERN = re.compile(r"^(\d+)([mhdw])$")
+RANGE_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_range(value: str) -> int:
+    """Parse a range like "15m", "6h", "7d" or "4w" into seconds."""
+    match = RANGE_PATTERN.match(value.strip())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid range: {value}")
+    return int(match.group(1)) * RANGE_UNITS[match.group(2)]
+
+
+class RingBuffer:
+    """Fixed-capacity series of (bucket start, mean) pairs.
+
+    Values live in two preallocated arrays (uint32 timestamps and doubles,
+    12 bytes per slot), so memory is fixed when the buffer is created no
+    matter how long the process runs.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._timestamps = array("I", bytes(4 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self.capacity = capacity
+        self._head = 0
+        self._count = 0
+
+    def append(self, timestamp: int, value: float) -> None:
+        """Append a point, overwriting the oldest once full."""
+        self._timestamps[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def since(self, start: int) -> List[Tuple[int, float]]:
+        """Points with a timestamp at or after `start`, oldest first."""
+        points = []
+        first = (self._head - self._count) % self.capacity
+        for i in range(self._count):
+            slot = (first + i) % self.capacity
+            if self._timestamps[slot] >= start:
+                points.append((self._timestamps[slot], self._values[slot]))
+        return points
+
+
+class Tier:
+    """One resolution of a series: the open bucket plus closed bucket means."""
+
+    def __init__(self, step: int, capacity: int) -> None:
+        self.step = step
+        self.buffer = RingBuffer(capacity)
+        self._bucket = -1
+        self._sum = 0.0
+        self._count = 0
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a raw sample, closing the open bucket if it has ended."""
+        bucket = int(timestamp) // self.step * self.step
+        if bucket != self._bucket:
+            if self._count:
+                self.buffer.append(self._bucket, self._sum / self._count)
+            self._bucket, self._sum, self._count = bucket, 0.0, 0
+        self._sum += value
+        self._count += 1
+
+    def since(self, start: int) -> List[Tuple[int, float]]:
+        """Closed buckets since `start` followed by the open one."""
+        points = self.buffer.since(start)
+        if self._count and self._bucket >= start:
+            points.append((self._bucket, self._sum / self._count))
+        return points
+
+
+class Series:
+    """A metric recorded at every tier resolution."""
+
+    def __init__(self, tiers: List[Tuple[int, int]]) -> None:
+        self.tiers = [Tier(step, capacity) for step, capacity in tiers]
+        self.last_write = 0.0
+
+    def add(self, timestamp: float, value: float) -> None:
+        self.last_write = timestamp
+        for tier in self.tiers:
+            tier.add(timestamp, value)
+
+    def tier_for(self, seconds: int) -> Tier:
+        """The finest tier whose retention covers `seconds`."""
+        for tier in self.tiers:
+            if tier.step * tier.buffer.capacity >= seconds:
+                return tier
+        return self.tiers[-1]
+
+
+class MetricsHistory:
+    """Named series, each downsampled into fixed-size 1m/5m/1h tiers.
+
+    Series are kept in least-recently-written order. A series with no
+    sample for its longest tier window (a dropped database or removed
+    container) is evicted, and at `max_series` the least recently written
+    series makes room for a new one.
+    """
+
+    def __init__(self, tiers: List[Tuple[int, int]], max_series: int) -> None:
+        self._tiers = tiers
+        self._max_series = max_series
+        self._retention = max(step * capacity for step, capacity in tiers)
+        self._series: "OrderedDict[str, Series]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._limit_logged = False
+
+    def names(self) -> List[str]:
+        """Names of all recorded series."""
+        with self._lock:
+            return sorted(self._series)
+
+    def record(
+        self, values: Dict[str, float], timestamp: Optional[float] = None
+    ) -> None:
+        """Record one sample for each series in `values`."""
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._evict_idle(timestamp)
+            for name, value in values.items():
+                series = self._series.get(name)
+                if series is None:
+                    if len(self._series) >= self._max_series:
+                        evicted, _ = self._series.popitem(last=False)
+                        if not self._limit_logged:
+                            self._limit_logged = True
+                            logger.warning(
+                                f"History series limit ({self._max_series}) reached, "
+                                "evicting least recently written series "
+                                f"such as {evicted}"
+                            )
+                    series = self._series[name] = Series(self._tiers)
+                else:
+                    self._series.move_to_end(name)
+                series.add(timestamp, value)
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop series with no sample within the longest tier window."""
+        cutoff = now - self._retention
+        while self._series:
+            name, series = next(iter(self._series.items()))
+            if series.last_write >= cutoff:
+                break
+            del self._series[name]
+
+    def query(
+        self, patterns: Iterable[str], seconds: int, now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Points for every series matching the glob `patterns` over a range."""
+        start = int((time.time() if now is None else now) - seconds)
+        result: Dict[str, Any] = {}
+        with self._lock:
+            for name, series in self._series.items():
+                if any(fnmatch.fnmatchcase(name, p) for p in patterns):
+                    tier = series.tier_for(seconds)
+                    result[name] = {
+                        "step_seconds": tier.step,
+                        "points": [[ts, value] for ts, value in tier.since(start)],
+                    }
+        return result
+
+
+def _number(value: Any) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def extract_metrics(service: str, info: Dict[str, Any]) -> Dict[str, float]:
+    """Pull the numeric metrics worth keeping out of a service snapshot."""
+    if info.get("status") != "connected":
+        return {}
+    values: Dict[str, Optional[float]] = {}
+    if service == "redis":
+        for field in ("used_memory", "connected_clients", "keys"):
+            values[f"redis.{field}"] = _number(info.get(field))
+    elif service == "postgres":
+        values["postgres.connections"] = _number(info.get("connections"))
+        for db in info.get("databases", []):
+            values[f"postgres.db.{db['name']}.size_bytes"] = _number(
+                db.get("size_bytes")
+            )
+            values[f"postgres.db.{db['name']}.connections"] = _number(
+                db.get("connections")
+            )
+    elif service == "qdrant":
+        for collection in info.get("collections", []):
+            values[f"qdrant.collection.{collection['name']}.points_count"] = _number(
+                collection.get("points_count")
+            )
+    elif service == "mongodb":
+        for db in info.get("databases", []):
+            for field in ("collection_count", "objects", "storage_size_bytes"):
+                values[f"mongodb.db.{db['name']}.{field}"] = _number(db.get(field))
+    elif service == "minio":
+        values["minio.bucket_count"] = _number(info.get("bucket_count"))
+    return {name: value for name, value in values.items() if value is not None}
+
+
+history = MetricsHistory(HISTORY_TIERS, HISTORY_MAX_SERIES)
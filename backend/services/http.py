@@ -0,0 +1,230 @@
+"""HTTP plumbing: orjson responses, ETags, compression and Server-Timing."""
+
+import gzip
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+
+import brotli
+import orjson
+from config import (
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MIN_SIZE,
+)
+from services.tracing import span, trace
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        with span("serialize"):
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def make_etag(body: bytes) -> str:
+    """Weak content-hash ETag (weak, since compression changes the bytes)."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(request: Request, etag: str, content: Any) -> Response:
+    """304 if the client already holds `etag`, else `content` as JSON.
+
+    Lets an endpoint that knows its ETag up front skip serialization.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(content, headers=headers)
+
+
+class _BufferedResponse:
+    """Base for middleware that rewrites single-message GET responses.
+
+    The start message is held until the first body message. Streaming
+    responses (more than one body message, e.g. Server-Sent Events) are
+    passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    def applies(self, scope: Scope) -> bool:
+        return scope["type"] == "http"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        held: Optional[Message] = None
+
+        async def wrapped_send(message: Message) -> None:
+            nonlocal held
+            if message["type"] == "http.response.start":
+                held = message
+                return
+            if held is not None and message["type"] == "http.response.body":
+                start, held = held, None
+                if not message.get("more_body", False):
+                    start, message = self.rewrite(request_headers, start, message)
+                await send(start)
+            await send(message)
+
+        await self.app(scope, receive, wrapped_send)
+
+    def rewrite(
+        self, request_headers: Headers, start: Message, body: Message
+    ) -> Tuple[Message, Message]:
+        raise NotImplementedError
+
+
+class ETagMiddleware(_BufferedResponse):
+    """Adds content-hash ETags to GET responses and answers 304s.
+
+    Responses that already carry an ETag (set by `conditional_response`)
+    keep it, so those endpoints can skip rendering entirely.
+    """
+
+    def applies(self, scope: Scope) -> bool:
+        return scope["type"] == "http" and scope["method"] == "GET"
+
+    def rewrite(
+        self, request_headers: Headers, start: Message, body: Message
+    ) -> Tuple[Message, Message]:
+        if start["status"] != 200:
+            return start, body
+        headers = MutableHeaders(raw=start["headers"])
+        etag = headers.get("etag")
+        if etag is None:
+            with span("etag"):
+                etag = make_etag(body.get("body", b""))
+            headers["ETag"] = etag
+        if "cache-control" not in headers:
+            headers["Cache-Control"] = "no-cache"
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            kept = {"etag", "cache-control", "vary"}
+            return (
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (k, v) for k, v in start["headers"] if k.decode() in kept
+                    ],
+                },
+                {"type": "http.response.body", "body": b""},
+            )
+        return start, body
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, honouring q=0."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in ("br", "gzip"):
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+class CompressionMiddleware(_BufferedResponse):
+    """Brotli or gzip compression for responses above a size threshold."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+    ) -> None:
+        super().__init__(app)
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def rewrite(
+        self, request_headers: Headers, start: Message, body: Message
+    ) -> Tuple[Message, Message]:
+        content = body.get("body", b"")
+        headers = MutableHeaders(raw=start["headers"])
+        encoding = _choose_encoding(request_headers.get("accept-encoding", ""))
+        if (
+            encoding is None
+            or len(content) < self.minimum_size
+            or "content-encoding" in headers
+            or headers.get("content-type", "").startswith("text/event-stream")
+        ):
+            return start, body
+
+        with span("compress"):
+            if encoding == "br":
+                compressed = brotli.compress(content, quality=self.brotli_quality)
+            else:
+                compressed = gzip.compress(content, compresslevel=self.gzip_level)
+        headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        return start, {**body, "body": compressed}
+
+
+class ServerTimingMiddleware:
+    """Traces each request and reports its spans as `Server-Timing`.
+
+    Must wrap the ETag and compression middleware so their spans are
+    recorded before the headers go out. Requests over
+    SLOW_REQUEST_THRESHOLD are kept in the slow log, except event streams
+    and paths in `exclude`, which are long-lived by design.
+    """
+
+    def __init__(self, app: ASGIApp, exclude: Tuple[str, ...] = ()) -> None:
+        self.app = app
+        self.exclude = exclude
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with trace("request", f"{scope['method']} {scope['path']}") as t:
+            t.loggable = not scope["path"].startswith(self.exclude)
+
+            async def wrapped_send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    if headers.get("content-type", "").startswith("text/event-stream"):
+                        t.loggable = False
+                    t.status = message["status"]
+                    headers.append("Server-Timing", t.server_timing())
+                    # Lets the cross-origin dashboard read it via the
+                    # Performance API
+                    headers["Timing-Allow-Origin"] = "*"
+                await send(message)
+
+            await self.app(scope, receive, wrapped_send)
@@ -0,0 +1,310 @@
+"""Prometheus metrics for collectors, backend calls, pools and services."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from services.breaker import breakers
+from services.tracing import record
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+COLLECTOR_DURATION = Histogram(
+    "infra_collector_duration_seconds",
+    "Duration of a service snapshot collection",
+    ["service"],
+    buckets=LATENCY_BUCKETS,
+)
+COLLECTOR_RUNS = Counter(
+    "infra_collector_runs_total",
+    "Snapshot collections by resulting status",
+    ["service", "status"],
+)
+BACKEND_CALL_DURATION = Histogram(
+    "infra_backend_call_duration_seconds",
+    "Duration of individual backend calls",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+ERRORS = Counter(
+    "infra_errors_total",
+    "Backend and collector failures by exception type",
+    ["service", "exception"],
+)
+SNAPSHOT_READS = Counter(
+    "infra_snapshot_reads_total",
+    "Snapshot cache reads by result (hit, stale or miss)",
+    ["service", "result"],
+)
+
+
+@contextmanager
+def timed(service: str, operation: str, target: Optional[str] = None) -> Iterator[None]:
+    """Time a backend call and count it as an error if it raises.
+
+    Works around both blocking and awaited calls, e.g.
+    `with timed("redis", "info"): info = await r.info()`. The call is also
+    recorded as a `service.operation` span of the current trace; `target`
+    (a database, bucket or collection) is kept on the span only.
+
+    The outcome feeds the service's circuit breaker; while it is open the
+    call is not made and CircuitOpenError is raised instead.
+    """
+    breaker = breakers.get(service)
+    if breaker is not None:
+        breaker.check()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        ERRORS.labels(service, type(e).__name__).inc()
+        if breaker is not None:
+            breaker.observe(e)
+        raise
+    else:
+        if breaker is not None:
+            breaker.observe(None)
+    finally:
+        BACKEND_CALL_DURATION.labels(service, operation).observe(
+            time.perf_counter() - start
+        )
+        record(f"{service}.{operation}", start, target)
+
+
+class PoolCollector:
+    """Exports connection pool utilization from `ClientRegistry.stats()`."""
+
+    def __init__(self, stats: Callable[[], Dict[str, Any]]) -> None:
+        self._stats = stats
+
+    def collect(self):
+        labels = ["service", "pool"]
+        size = GaugeMetricFamily(
+            "infra_pool_size", "Open pool connections", labels=labels
+        )
+        in_use = GaugeMetricFamily(
+            "infra_pool_in_use", "Pool connections checked out", labels=labels
+        )
+        max_size = GaugeMetricFamily(
+            "infra_pool_max_size", "Maximum pool connections", labels=labels
+        )
+        waiting = GaugeMetricFamily(
+            "infra_pool_waiting", "Requests waiting for a connection", labels=labels
+        )
+        checkouts = CounterMetricFamily(
+            "infra_pool_checkouts", "Pool connection checkouts", labels=labels
+        )
+        wait_seconds = CounterMetricFamily(
+            "infra_pool_wait_seconds",
+            "Total time spent waiting for pool connections",
+            labels=labels,
+        )
+
+        stats = self._stats()
+        pools = [("postgres", db, s) for db, s in stats["postgres"].items()]
+        pools += [
+            (service, "default", stats[service])
+            for service in ("redis", "mongodb")
+            if stats[service]
+        ]
+        for service, pool, s in pools:
+            label_values = [service, pool]
+            size.add_metric(label_values, s["size"])
+            in_use.add_metric(
+                label_values, s.get("in_use", s["size"] - s.get("available", 0))
+            )
+            max_size.add_metric(label_values, s["max_size"])
+            waiting.add_metric(label_values, s.get("waiting", 0))
+            checkouts.add_metric(label_values, s["checkouts"])
+            wait_seconds.add_metric(label_values, s["wait_ms_total"] / 1000)
+        yield from (size, in_use, max_size, waiting, checkouts, wait_seconds)
+
+
+class BreakerCollector:
+    """Exports the state of every backend's circuit breaker."""
+
+    def collect(self):
+        state = GaugeMetricFamily(
+            "infra_circuit_state",
+            "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+            labels=["service"],
+        )
+        trips = CounterMetricFamily(
+            "infra_circuit_trips",
+            "Times the circuit breaker opened",
+            labels=["service"],
+        )
+        levels = {"closed": 0, "half_open": 1, "open": 2}
+        for name, breaker in breakers.items():
+            info = breaker.to_dict()
+            state.add_metric([name], levels[info["state"]])
+            trips.add_metric([name], info["trips"])
+        yield from (state, trips)
+
+
+class ContainerStatsCollector:
+    """Exports the latest resource usage from `ContainerStats.list()`."""
+
+    def __init__(self, stats: Callable[[], List[Dict[str, Any]]]) -> None:
+        self._stats = stats
+
+    def collect(self):
+        labels = ["container"]
+        cpu = GaugeMetricFamily(
+            "infra_container_cpu_percent",
+            "Container CPU usage (100 per fully used core)",
+            labels=labels,
+        )
+        memory = GaugeMetricFamily(
+            "infra_container_memory_bytes",
+            "Container memory usage excluding page cache",
+            labels=labels,
+        )
+        memory_limit = GaugeMetricFamily(
+            "infra_container_memory_limit_bytes",
+            "Container memory limit",
+            labels=labels,
+        )
+        network = CounterMetricFamily(
+            "infra_container_network_bytes",
+            "Bytes sent and received over the container's networks",
+            labels=labels + ["direction"],
+        )
+        block = CounterMetricFamily(
+            "infra_container_block_io_bytes",
+            "Bytes read from and written to block devices",
+            labels=labels + ["operation"],
+        )
+        for container in self._stats():
+            s = container["stats"]
+            if not s:
+                continue
+            name = [container["name"]]
+            if s["cpu_percent"] is not None:
+                cpu.add_metric(name, s["cpu_percent"])
+            memory.add_metric(name, s["memory_bytes"])
+            if s["memory_limit_bytes"]:
+                memory_limit.add_metric(name, s["memory_limit_bytes"])
+            network.add_metric(name + ["rx"], s["network_rx_bytes"])
+            network.add_metric(name + ["tx"], s["network_tx_bytes"])
+            block.add_metric(name + ["read"], s["block_read_bytes"])
+            block.add_metric(name + ["write"], s["block_write_bytes"])
+        yield from (cpu, memory, memory_limit, network, block)
+
+
+class ServiceCollector:
+    """Exports the latest snapshot of every service as gauges.
+
+    Reads only what the snapshot collector already holds in memory, so a
+    scrape never touches a backend.
+    """
+
+    def __init__(self, snapshots: Any) -> None:
+        self._snapshots = snapshots
+
+    def collect(self):
+        up = GaugeMetricFamily(
+            "infra_service_up",
+            "Whether the last snapshot connected",
+            labels=["service"],
+        )
+        age = GaugeMetricFamily(
+            "infra_snapshot_age_seconds",
+            "Age of the latest snapshot",
+            labels=["service"],
+        )
+        redis_memory = GaugeMetricFamily(
+            "infra_redis_used_memory_bytes", "Redis used memory"
+        )
+        redis_clients = GaugeMetricFamily(
+            "infra_redis_connected_clients", "Redis connected clients"
+        )
+        redis_keys = GaugeMetricFamily("infra_redis_keys", "Keys in the Redis DB")
+        pg_connections = GaugeMetricFamily(
+            "infra_postgres_connections", "PostgreSQL connections"
+        )
+        pg_db_size = GaugeMetricFamily(
+            "infra_postgres_database_size_bytes",
+            "PostgreSQL database size",
+            labels=["database"],
+        )
+        pg_db_connections = GaugeMetricFamily(
+            "infra_postgres_database_connections",
+            "PostgreSQL connections per database",
+            labels=["database"],
+        )
+        qdrant_points = GaugeMetricFamily(
+            "infra_qdrant_collection_points",
+            "Points per Qdrant collection",
+            labels=["collection"],
+        )
+        mongo_collections = GaugeMetricFamily(
+            "infra_mongodb_database_collections",
+            "Collections per MongoDB database",
+            labels=["database"],
+        )
+        mongo_storage = GaugeMetricFamily(
+            "infra_mongodb_database_storage_bytes",
+            "Storage plus index size per MongoDB database",
+            labels=["database"],
+        )
+        minio_buckets = GaugeMetricFamily("infra_minio_buckets", "MinIO buckets")
+
+        for name in self._snapshots.names:
+            snapshot = self._snapshots.latest(name)
+            if snapshot is None:
+                continue
+            data = snapshot.data
+            connected = data.get("status") == "connected"
+            up.add_metric([name], 1 if connected else 0)
+            age.add_metric([name], snapshot.age)
+            if not connected:
+                continue
+
+            if name == "redis":
+                for family, field in (
+                    (redis_memory, "used_memory"),
+                    (redis_clients, "connected_clients"),
+                    (redis_keys, "keys"),
+                ):
+                    if data.get(field) is not None:
+                        family.add_metric([], data[field])
+            elif name == "postgres":
+                pg_connections.add_metric([], data.get("connections", 0))
+                for db in data.get("databases", []):
+                    if db.get("size_bytes") is not None:
+                        pg_db_size.add_metric([db["name"]], db["size_bytes"])
+                    pg_db_connections.add_metric([db["name"]], db["connections"])
+            elif name == "qdrant":
+                for collection in data.get("collections", []):
+                    if collection.get("points_count") is not None:
+                        qdrant_points.add_metric(
+                            [collection["name"]], collection["points_count"]
+                        )
+            elif name == "mongodb":
+                for db in data.get("databases", []):
+                    mongo_collections.add_metric([db["name"]], db["collection_count"])
+                    if "storage_size_bytes" in db:
+                        mongo_storage.add_metric(
+                            [db["name"]],
+                            db["storage_size_bytes"] + db["index_size_bytes"],
+                        )
+            elif name == "minio":
+                minio_buckets.add_metric([], data.get("bucket_count", 0))
+
+        yield from (
+            up,
+            age,
+            redis_memory,
+            redis_clients,
+            redis_keys,
+            pg_connections,
+            pg_db_size,
+            pg_db_connections,
+            qdrant_points,
+            mongo_collections,
+            mongo_storage,
+            minio_buckets,
+        )
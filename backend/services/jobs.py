@@ -0,0 +1,188 @@
+"""Background job runner for long-running destructive operations."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import JOB_BACKEND_CONCURRENCY, JOB_HISTORY_SIZE, JOB_WORKERS
+from services.events import broker
+
+logger = logging.getLogger(__name__)
+
+ProgressFn = Callable[[Dict[str, Any]], None]
+JobFn = Callable[[ProgressFn], Awaitable[Dict[str, Any]]]
+
+FINISHED = ("succeeded", "failed", "cancelled")
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class Job:
+    """One submitted operation and its progress."""
+
+    def __init__(self, kind: str, backend: str, target: str) -> None:
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.backend = backend
+        self.target = target
+        self.status = "queued"
+        self.progress: Dict[str, Any] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self.version = 0
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds spent running so far (or in total once finished)."""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job as a JSON-serializable dict."""
+        elapsed = self.elapsed
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "backend": self.backend,
+            "target": self.target,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+            "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+        }
+
+    def changed(self) -> None:
+        """Wake up the job's stream waiters; announce it on /events once done.
+
+        Progress ticks only go to `/jobs/{id}/stream`, so a chatty job
+        (e.g. a bucket purge) doesn't flood every dashboard subscriber.
+        """
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+        if self.finished:
+            broker.publish("job", self.id, self.to_dict())
+
+    async def wait_for_change(self, version: int, timeout: float) -> None:
+        """Wait until the job moves past `version` or `timeout` seconds pass."""
+        if self.version != version:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class JobRunner:
+    """Runs jobs in the background under global and per-backend limits.
+
+    At most `workers` jobs run at once, and at most
+    `backend_limits[backend]` of them against the same backend, so a burst
+    of drops queues up instead of saturating one server. Finished jobs are
+    kept for inspection, up to `history_size` of them.
+    """
+
+    def __init__(
+        self, workers: int, backend_limits: Dict[str, int], history_size: int
+    ) -> None:
+        self._workers = asyncio.Semaphore(workers)
+        self._backend_limits = backend_limits
+        self._backend_slots: Dict[str, asyncio.Semaphore] = {}
+        self._history_size = history_size
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+
+    def submit(self, kind: str, backend: str, target: str, func: JobFn) -> Job:
+        """Queue `func(progress)` as a job and return it immediately."""
+        job = Job(kind, backend, target)
+        self._jobs[job.id] = job
+        self._prune()
+        job.task = asyncio.create_task(self._run(job, func), name=f"job-{job.id}")
+        job.changed()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """All known jobs, newest first."""
+        return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued or running job."""
+        job = self._jobs.get(job_id)
+        if job is not None and not job.finished and job.task is not None:
+            job.task.cancel()
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel every unfinished job."""
+        tasks = [j.task for j in self._jobs.values() if j.task and not j.finished]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job, func: JobFn) -> None:
+        backend_slots = self._backend_slots.setdefault(
+            job.backend, asyncio.Semaphore(self._backend_limits.get(job.backend, 1))
+        )
+
+        def report(progress: Dict[str, Any]) -> None:
+            job.progress = progress
+            job.changed()
+
+        try:
+            async with self._workers, backend_slots:
+                job.status = "running"
+                job.started_at = time.time()
+                job.changed()
+                job.result = await func(report)
+            if job.result.get("status") == "error":
+                job.status = "failed"
+                job.error = job.result.get("message")
+            else:
+                job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind} {job.target}) failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            job.changed()
+            logger.info(
+                f"Job {job.id} ({job.kind} {job.target}) {job.status} "
+                f"after {job.elapsed or 0:.2f}s"
+            )
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the history size."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(self._jobs) - self._history_size)]:
+            del self._jobs[job_id]
+
+
+jobs = JobRunner(JOB_WORKERS, JOB_BACKEND_CONCURRENCY, JOB_HISTORY_SIZE)
@@ -0,0 +1,206 @@
+"""Batched, parallel, version-aware purge of MinIO buckets."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from config import MINIO_PURGE_BATCH_SIZE, MINIO_PURGE_CONCURRENCY, MINIO_PURGE_RETRIES
+from services.executors import run_blocking
+from services.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+# Listing passes before giving up on a bucket that keeps refilling
+MAX_PASSES = 5
+
+
+def _version(version_id: Optional[str]) -> str:
+    """Normalize a version id; unversioned objects have the "null" version."""
+    return version_id or "null"
+
+
+class PurgeProgress:
+    """Counters for a running purge."""
+
+    def __init__(self, bucket: str) -> None:
+        self.bucket = bucket
+        self.started = time.monotonic()
+        self.listed = 0
+        self.deleted = 0
+        self.failed = 0
+        self.batches = 0
+        self.aborted_uploads = 0
+        self.errors: List[str] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counters with elapsed time and throughput."""
+        elapsed = time.monotonic() - self.started
+        return {
+            "bucket": self.bucket,
+            "listed": self.listed,
+            "deleted": self.deleted,
+            "failed": self.failed,
+            "batches": self.batches,
+            "aborted_uploads": self.aborted_uploads,
+            "elapsed_seconds": round(elapsed, 3),
+            "objects_per_second": round(self.deleted / elapsed, 1) if elapsed else 0.0,
+            "errors": list(self.errors),
+        }
+
+
+class BucketPurge:
+    """Deletes every object version, delete marker and upload in a bucket.
+
+    Listing pages are turned into `delete_objects` batches of up to 1000
+    keys, with at most `concurrency` batches in flight on the MinIO
+    executor. Listing pauses while the pool is full, so memory stays
+    bounded by the in-flight batches regardless of bucket size.
+    """
+
+    def __init__(
+        self,
+        s3,
+        bucket: str,
+        on_progress: Optional[ProgressCallback] = None,
+        concurrency: int = MINIO_PURGE_CONCURRENCY,
+        batch_size: int = MINIO_PURGE_BATCH_SIZE,
+    ) -> None:
+        self._s3 = s3
+        self._bucket = bucket
+        self._on_progress = on_progress
+        self._slots = asyncio.Semaphore(concurrency)
+        self._batch_size = min(batch_size, 1000)
+        self.progress = PurgeProgress(bucket)
+        self._last_log = time.monotonic()
+
+    async def run(self) -> Dict[str, Any]:
+        """Empty the bucket and return the final progress counters."""
+        await self._abort_uploads()
+
+        # Re-list until a pass finds nothing, so writes racing the purge
+        # and keys a listing missed are caught before the bucket is dropped
+        for _ in range(MAX_PASSES):
+            listed = self.progress.listed
+            await self._purge_pass()
+            if self.progress.listed == listed or self.progress.failed:
+                break
+        return self.progress.to_dict()
+
+    async def _purge_pass(self) -> None:
+        """List the bucket once, deleting each page in concurrent batches."""
+        tasks: List[asyncio.Task] = []
+        try:
+            async for batch in self._batches():
+                await self._slots.acquire()
+                tasks = [t for t in tasks if not t.done()]
+                tasks.append(asyncio.create_task(self._delete(batch)))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _batches(self):
+        """Yield lists of {Key, VersionId} from every listing page."""
+        kwargs: Dict[str, Any] = {"Bucket": self._bucket, "MaxKeys": self._batch_size}
+        while True:
+            with timed("minio", "list_object_versions"):
+                page = await run_blocking(
+                    "minio", self._s3.list_object_versions, **kwargs
+                )
+            keys = [
+                {"Key": item["Key"], "VersionId": item["VersionId"]}
+                for item in page.get("Versions", []) + page.get("DeleteMarkers", [])
+            ]
+            self.progress.listed += len(keys)
+            for start in range(0, len(keys), self._batch_size):
+                yield keys[start : start + self._batch_size]
+            if not page.get("IsTruncated"):
+                return
+            kwargs["KeyMarker"] = page["NextKeyMarker"]
+            kwargs["VersionIdMarker"] = page.get("NextVersionIdMarker", "")
+
+    async def _delete(self, batch: List[Dict[str, str]]) -> None:
+        """Delete one batch, retrying transient failures with backoff."""
+        try:
+            for attempt in range(MINIO_PURGE_RETRIES + 1):
+                try:
+                    with timed("minio", "delete_objects"):
+                        response = await run_blocking(
+                            "minio",
+                            self._s3.delete_objects,
+                            Bucket=self._bucket,
+                            Delete={"Objects": batch, "Quiet": True},
+                        )
+                except Exception as e:
+                    if attempt == MINIO_PURGE_RETRIES:
+                        self._record_failure(len(batch), str(e))
+                        return
+                    await asyncio.sleep(0.5 * 2**attempt)
+                    continue
+
+                errors = response.get("Errors", [])
+                failed = {(e["Key"], _version(e.get("VersionId"))) for e in errors}
+                self.progress.deleted += len(batch) - len(failed)
+                self.progress.batches += 1
+                if not failed:
+                    break
+                retry = [
+                    o for o in batch if (o["Key"], _version(o["VersionId"])) in failed
+                ]
+                # Errors for keys not in the batch can't be retried
+                if len(retry) < len(failed):
+                    self._record_failure(
+                        len(failed) - len(retry), errors[0].get("Message", "")
+                    )
+                if not retry:
+                    break
+                batch = retry
+                if attempt == MINIO_PURGE_RETRIES:
+                    self._record_failure(len(batch), errors[0].get("Message", ""))
+                    break
+                await asyncio.sleep(0.5 * 2**attempt)
+            self._report()
+        finally:
+            self._slots.release()
+
+    async def _abort_uploads(self) -> None:
+        """Abort unfinished multipart uploads, which also hold storage."""
+        kwargs: Dict[str, Any] = {"Bucket": self._bucket}
+        while True:
+            page = await run_blocking(
+                "minio", self._s3.list_multipart_uploads, **kwargs
+            )
+            for upload in page.get("Uploads", []):
+                await run_blocking(
+                    "minio",
+                    self._s3.abort_multipart_upload,
+                    Bucket=self._bucket,
+                    Key=upload["Key"],
+                    UploadId=upload["UploadId"],
+                )
+                self.progress.aborted_uploads += 1
+            if not page.get("IsTruncated"):
+                return
+            kwargs["KeyMarker"] = page["NextKeyMarker"]
+            kwargs["UploadIdMarker"] = page["NextUploadIdMarker"]
+
+    def _record_failure(self, count: int, message: str) -> None:
+        self.progress.failed += count
+        if len(self.progress.errors) < 10:
+            self.progress.errors.append(message)
+
+    def _report(self) -> None:
+        progress = self.progress.to_dict()
+        if self._on_progress is not None:
+            self._on_progress(progress)
+        now = time.monotonic()
+        if now - self._last_log >= 10:
+            self._last_log = now
+            logger.info(
+                f"Purging bucket {self._bucket}: {progress['deleted']} objects deleted "
+                f"({progress['objects_per_second']}/s)"
+            )
@@ -1,11 +1,15 @@
 """MinIO service module."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-import boto3
-from botocore.config import Config
-from config import MINIO_ACCESS_KEY, MINIO_CONSOLE_URL, MINIO_ENDPOINT, MINIO_SECRET_KEY
+from config import MINIO_CONSOLE_URL, MINIO_ENDPOINT
+from services.clients import clients
+from services.executors import run_blocking
+from services.instrumentation import timed
+from services.minio_purge import BucketPurge, ProgressCallback
+from services.minio_usage import bucket_usage
+from services.units import format_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -15,68 +19,101 @@ class MinioService:
 
     @staticmethod
     def _get_client():
-        """Get MinIO S3 client."""
-        return boto3.client(
-            "s3",
-            endpoint_url=MINIO_ENDPOINT,
-            aws_access_key_id=MINIO_ACCESS_KEY,
-            aws_secret_access_key=MINIO_SECRET_KEY,
-            config=Config(signature_version="s3v4"),
-        )
+        """Get the shared MinIO S3 client."""
+        return clients.s3()
 
     @staticmethod
-    def get_info() -> Dict[str, Any]:
-        """Get detailed info from MinIO."""
-        try:
-            s3 = MinioService._get_client()
-            buckets_response = s3.list_buckets()
-            bucket_names: List[str] = [
-                b["Name"] for b in buckets_response.get("Buckets", [])
-            ]
+    async def get_info() -> Dict[str, Any]:
+        """Get detailed info from MinIO, including per-bucket usage."""
+        info = await run_blocking("minio", MinioService._get_info)
+        if info["status"] == "connected":
+            usage = await bucket_usage.collect(
+                MinioService._get_client(), info["buckets"]
+            )
+            info["usage"] = usage
+            info["total_size_bytes"] = sum(u["size_bytes"] or 0 for u in usage.values())
+            info["total_size"] = format_bytes(info["total_size_bytes"])
+        return info
 
-            return {
-                "status": "connected",
-                "endpoint": MINIO_ENDPOINT,
-                "console_url": MINIO_CONSOLE_URL,
-                "buckets": bucket_names,
-                "bucket_count": len(bucket_names),
-            }
+    @staticmethod
+    async def bucket_exists(bucket_name: str) -> bool:
+        """Whether a bucket exists (raises if MinIO is unreachable)."""
+        try:
+            await run_blocking(
+                "minio", MinioService._get_client().head_bucket, Bucket=bucket_name
+            )
         except Exception as e:
-            logger.error(f"MinIO connection error: {e}")
-            return {"status": "error", "message": str(e)}
+            # botocore's ClientError for a missing bucket carries a 404
+            error = (getattr(e, "response", None) or {}).get("Error", {})
+            if error.get("Code") in ("404", "NoSuchBucket"):
+                return False
+            raise
+        return True
 
     @staticmethod
-    def drop_bucket(bucket_name: str) -> Dict[str, Any]:
-        """Drop a MinIO bucket."""
+    async def drop_bucket(
+        bucket_name: str, on_progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Drop a MinIO bucket after purging every object version in it."""
         try:
             s3 = MinioService._get_client()
 
             # Check if bucket exists
             try:
-                s3.head_bucket(Bucket=bucket_name)
+                await run_blocking("minio", s3.head_bucket, Bucket=bucket_name)
             except Exception:
                 return {
                     "status": "error",
                     "message": f"Bucket {bucket_name} not found",
                 }
 
-            # List and delete all objects in the bucket first
-            try:
-                response = s3.list_objects_v2(Bucket=bucket_name)
-                if "Contents" in response:
-                    objects = [{"Key": obj["Key"]} for obj in response["Contents"]]
-                    s3.delete_objects(Bucket=bucket_name, Delete={"Objects": objects})
-            except Exception as e:
-                logger.warning(f"Error deleting objects from bucket {bucket_name}: {e}")
+            # Delete all object versions, delete markers and uploads first
+            progress = await BucketPurge(s3, bucket_name, on_progress).run()
+            if progress["failed"]:
+                return {
+                    "status": "error",
+                    "message": (
+                        f"Failed to delete {progress['failed']} objects from bucket "
+                        f"{bucket_name}: {'; '.join(progress['errors'])}"
+                    ),
+                    "purge": progress,
+                }
 
             # Delete the bucket
-            s3.delete_bucket(Bucket=bucket_name)
+            await run_blocking("minio", s3.delete_bucket, Bucket=bucket_name)
+            bucket_usage.forget(bucket_name)
 
-            logger.info(f"Successfully dropped bucket: {bucket_name}")
+            logger.info(
+                f"Successfully dropped bucket: {bucket_name} "
+                f"({progress['deleted']} objects in {progress['elapsed_seconds']}s)"
+            )
             return {
                 "status": "success",
                 "message": f"Bucket {bucket_name} dropped successfully",
+                "purge": progress,
             }
         except Exception as e:
             logger.error(f"Error dropping bucket {bucket_name}: {e}")
             return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    def _get_info() -> Dict[str, Any]:
+        """Blocking implementation of `get_info`."""
+        try:
+            s3 = MinioService._get_client()
+            with timed("minio", "list_buckets"):
+                buckets_response = s3.list_buckets()
+            bucket_names: List[str] = [
+                b["Name"] for b in buckets_response.get("Buckets", [])
+            ]
+
+            return {
+                "status": "connected",
+                "endpoint": MINIO_ENDPOINT,
+                "console_url": MINIO_CONSOLE_URL,
+                "buckets": bucket_names,
+                "bucket_count": len(bucket_names),
+            }
+        except Exception as e:
+            logger.error(f"MinIO connection error: {e}")
+            return {"status": "error", "message": str(e)}
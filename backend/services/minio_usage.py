@@ -0,0 +1,206 @@
+"""Incremental, time-budgeted MinIO bucket usage scans."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from config import (
+    MINIO_USAGE_CONCURRENCY,
+    MINIO_USAGE_MAX_PREFIXES,
+    MINIO_USAGE_PAGE_SIZE,
+    MINIO_USAGE_SCAN_BUDGET,
+)
+from services.executors import run_blocking
+from services.instrumentation import timed
+from services.units import format_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class _PrefixScan:
+    """Running totals for one key prefix, resumable after `last_key`."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.last_key: Optional[str] = None
+        self.objects = 0
+        self.size_bytes = 0
+        self.done = False
+
+    def advance(self, s3, bucket: str, deadline: float) -> None:
+        """List pages until the prefix is exhausted or the deadline passes."""
+        while not self.done and time.monotonic() < deadline:
+            kwargs: Dict[str, Any] = {
+                "Bucket": bucket,
+                "Prefix": self.prefix,
+                "MaxKeys": MINIO_USAGE_PAGE_SIZE,
+            }
+            if self.last_key is not None:
+                kwargs["StartAfter"] = self.last_key
+            with timed("minio", "list_objects", bucket):
+                page = s3.list_objects_v2(**kwargs)
+            contents = page.get("Contents", [])
+            self.objects += len(contents)
+            self.size_bytes += sum(obj["Size"] for obj in contents)
+            if contents:
+                self.last_key = contents[-1]["Key"]
+            self.done = not page.get("IsTruncated")
+
+
+class _BucketScan:
+    """One full pass over a bucket, split across its top-level prefixes.
+
+    Only counters and resume keys are kept, never object listings, so
+    memory stays constant however many objects the bucket holds.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.root = _PrefixScan("")
+        self.prefixes: Optional[List[_PrefixScan]] = None
+        self._seen_prefixes: List[str] = []
+        self._token: Optional[str] = None
+
+    def split(self, s3, bucket: str, deadline: float) -> None:
+        """Count root-level objects and collect the top-level prefixes."""
+        root = self.root
+        while not root.done and time.monotonic() < deadline:
+            kwargs: Dict[str, Any] = {
+                "Bucket": bucket,
+                "Delimiter": "/",
+                "MaxKeys": MINIO_USAGE_PAGE_SIZE,
+            }
+            if self._token is not None:
+                kwargs["ContinuationToken"] = self._token
+            with timed("minio", "list_objects", bucket):
+                page = s3.list_objects_v2(**kwargs)
+            contents = page.get("Contents", [])
+            root.objects += len(contents)
+            root.size_bytes += sum(obj["Size"] for obj in contents)
+            self._seen_prefixes.extend(
+                p["Prefix"] for p in page.get("CommonPrefixes", [])
+            )
+            self._token = page.get("NextContinuationToken")
+            root.done = not page.get("IsTruncated")
+
+            if len(self._seen_prefixes) > MINIO_USAGE_MAX_PREFIXES:
+                # Too many to track separately: one unsplit scan instead
+                self.root = _PrefixScan("")
+                self.prefixes = []
+                self._seen_prefixes = []
+                return
+
+        if root.done:
+            self.prefixes = [_PrefixScan(p) for p in self._seen_prefixes]
+            self._seen_prefixes = []
+
+    @property
+    def pending(self) -> List[_PrefixScan]:
+        """Prefix scans that still have pages left."""
+        scans = self.prefixes or []
+        if self.prefixes is not None and not self.root.done:
+            scans = [self.root] + scans
+        return [scan for scan in scans if not scan.done]
+
+    @property
+    def complete(self) -> bool:
+        return self.prefixes is not None and not self.pending
+
+    @property
+    def objects(self) -> int:
+        return self.root.objects + sum(p.objects for p in self.prefixes or [])
+
+    @property
+    def size_bytes(self) -> int:
+        return self.root.size_bytes + sum(p.size_bytes for p in self.prefixes or [])
+
+
+class BucketUsage:
+    """Per-bucket object counts and sizes, refreshed a budgeted slice at a time.
+
+    Each `collect` call advances the in-progress scan of every bucket until
+    the time budget runs out; prefixes are listed in parallel on the MinIO
+    executor. The last completed result is served while a rescan is under
+    way, so a bucket with millions of objects is summed over several calls.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._scans: Dict[str, _BucketScan] = {}
+
+    async def collect(
+        self, s3, buckets: List[str], budget: float = MINIO_USAGE_SCAN_BUDGET
+    ) -> Dict[str, Dict[str, Any]]:
+        """Advance every bucket's scan within `budget` seconds and report."""
+        for bucket in (set(self._results) | set(self._scans)) - set(buckets):
+            self.forget(bucket)
+
+        deadline = time.monotonic() + budget
+        semaphore = asyncio.Semaphore(MINIO_USAGE_CONCURRENCY)
+        await asyncio.gather(
+            *(self._advance(s3, bucket, deadline, semaphore) for bucket in buckets)
+        )
+        return {bucket: self._report(bucket) for bucket in buckets}
+
+    def forget(self, bucket: str) -> None:
+        """Drop cached usage and scan state for a bucket."""
+        self._results.pop(bucket, None)
+        self._scans.pop(bucket, None)
+
+    async def _advance(
+        self, s3, bucket: str, deadline: float, semaphore: asyncio.Semaphore
+    ) -> None:
+        scan = self._scans.setdefault(bucket, _BucketScan())
+
+        async def run(func, *args) -> None:
+            async with semaphore:
+                if time.monotonic() < deadline:
+                    await run_blocking("minio", func, *args)
+
+        try:
+            if scan.prefixes is None:
+                await run(scan.split, s3, bucket, deadline)
+            if scan.prefixes is not None:
+                await asyncio.gather(
+                    *(run(p.advance, s3, bucket, deadline) for p in scan.pending)
+                )
+        except Exception as e:
+            logger.error(f"Error scanning usage of bucket {bucket}: {e}")
+            self._scans.pop(bucket, None)
+            return
+
+        if scan.complete:
+            self._results[bucket] = {
+                "objects": scan.objects,
+                "size_bytes": scan.size_bytes,
+                "size": format_bytes(scan.size_bytes),
+                "scanned_at": datetime.fromtimestamp(
+                    scan.started_at, timezone.utc
+                ).isoformat(),
+                "scan_seconds": round(time.time() - scan.started_at, 3),
+            }
+            del self._scans[bucket]
+
+    def _report(self, bucket: str) -> Dict[str, Any]:
+        result = self._results.get(bucket)
+        scan = self._scans.get(bucket)
+        report: Dict[str, Any] = (
+            dict(result)
+            if result
+            else {
+                "objects": None,
+                "size_bytes": None,
+                "size": None,
+                "scanned_at": None,
+            }
+        )
+        # True while an unfinished scan is still being resumed
+        report["scanning"] = scan is not None
+        if scan is not None:
+            report["scanned_objects"] = scan.objects
+        return report
+
+
+bucket_usage = BucketUsage()
@@ -0,0 +1,54 @@
+"""MongoDB pool listener feeding the pool stats endpoint."""
+
+import threading
+
+from pymongo import monitoring
+from services.clients import WaitStats
+
+
+class MongoPoolListener(monitoring.ConnectionPoolListener):
+    """Tracks MongoDB pool size and checkout wait times."""
+
+    def __init__(self) -> None:
+        self.wait_stats = WaitStats()
+        self._lock = threading.Lock()
+        self.open_connections = 0
+        self.in_use = 0
+
+    def _adjust(self, attr: str, delta: int) -> None:
+        with self._lock:
+            setattr(self, attr, max(0, getattr(self, attr) + delta))
+
+    def connection_created(self, event):
+        self._adjust("open_connections", 1)
+
+    def connection_closed(self, event):
+        self._adjust("open_connections", -1)
+
+    def connection_checked_out(self, event):
+        self.wait_stats.record(event.duration or 0.0)
+        self._adjust("in_use", 1)
+
+    def connection_checked_in(self, event):
+        self._adjust("in_use", -1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
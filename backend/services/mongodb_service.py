@@ -1,66 +1,74 @@
 """MongoDB service module."""
 
+import asyncio
+import bisect
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from config import (
-    MONGODB_AUTH_SOURCE,
+    MONGODB_COLLECTIONS_PAGE_SIZE,
     MONGODB_HOST,
-    MONGODB_PASSWORD,
     MONGODB_PORT,
     MONGODB_PROTECTED_DBS,
-    MONGODB_USER,
+    MONGODB_STATS_CONCURRENCY,
+    MONGODB_STATS_TTL,
 )
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.errors import ConnectionFailure
+from services.cache import TTLCache
+from services.clients import clients
+from services.instrumentation import timed
+from services.shaping import encode_cursor
+from services.units import format_bytes
 
 logger = logging.getLogger(__name__)
 
+# Per-database collection stats, sorted by size, reused between snapshots
+# so only databases whose entry expired or changed are walked again
+_collection_stats: TTLCache[Dict[str, Any]] = TTLCache(MONGODB_STATS_TTL)
+
+# Collection orderings for paging; each key doubles as the page cursor
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], List[Any]]] = {
+    "size": lambda c: [
+        -(c.get("storage_size_bytes", 0) + c.get("index_size_bytes", 0)),
+        c["name"],
+    ],
+    "name": lambda c: [c["name"]],
+}
+
 
 class MongoDBService:
     """Service class for MongoDB operations."""
 
     @staticmethod
-    def _get_client() -> MongoClient:
-        """Get MongoDB client."""
-        return MongoClient(
-            MONGODB_HOST,
-            MONGODB_PORT,
-            username=MONGODB_USER,
-            password=MONGODB_PASSWORD,
-            authSource=MONGODB_AUTH_SOURCE,
-            serverSelectionTimeoutMS=5000,
-        )
+    def _get_client() -> AsyncMongoClient:
+        """Get the shared MongoDB client."""
+        return clients.mongo()
 
     @staticmethod
-    def get_info() -> Dict[str, Any]:
+    async def get_info() -> Dict[str, Any]:
         """Get detailed info from MongoDB."""
         try:
             client = MongoDBService._get_client()
             # Test connection
-            client.admin.command("ping")
+            with timed("mongodb", "ping"):
+                await client.admin.command("ping")
 
             # Get list of databases (excluding system databases)
-            db_names = [
-                db
-                for db in client.list_database_names()
-                if db not in MONGODB_PROTECTED_DBS
-            ]
-
-            # Get collections for each database
-            databases_info: List[Dict[str, Any]] = []
-            for db_name in db_names:
-                db = client[db_name]
-                collections = db.list_collection_names()
-                databases_info.append(
-                    {
-                        "name": db_name,
-                        "collections": collections,
-                        "collection_count": len(collections),
-                    }
-                )
+            with timed("mongodb", "list_databases"):
+                all_db_names = await client.list_database_names()
+            db_names = [db for db in all_db_names if db not in MONGODB_PROTECTED_DBS]
 
-            client.close()
+            # Stats for every database, gathered concurrently
+            semaphore = asyncio.Semaphore(MONGODB_STATS_CONCURRENCY)
+            databases_info = await asyncio.gather(
+                *(
+                    MongoDBService._database_info(client[name], semaphore)
+                    for name in db_names
+                )
+            )
+            _collection_stats.prune(lambda name: name in db_names)
 
             return {
                 "status": "connected",
@@ -68,6 +76,10 @@ class MongoDBService:
                 "port": MONGODB_PORT,
                 "databases": databases_info,
                 "database_count": len(databases_info),
+                "total_size_bytes": sum(
+                    db.get("storage_size_bytes", 0) + db.get("index_size_bytes", 0)
+                    for db in databases_info
+                ),
             }
         except ConnectionFailure as e:
             logger.error(f"MongoDB connection error: {e}")
@@ -77,7 +89,13 @@ class MongoDBService:
             return {"status": "error", "message": str(e)}
 
     @staticmethod
-    def drop_database(db_name: str) -> Dict[str, Any]:
+    async def database_exists(db_name: str) -> bool:
+        """Whether a database exists (raises if the server is unreachable)."""
+        client = MongoDBService._get_client()
+        return db_name in await client.list_database_names()
+
+    @staticmethod
+    async def drop_database(db_name: str) -> Dict[str, Any]:
         """Drop a MongoDB database."""
         # Check if database is protected
         if db_name in MONGODB_PROTECTED_DBS:
@@ -90,13 +108,12 @@ class MongoDBService:
             client = MongoDBService._get_client()
 
             # Check if database exists
-            if db_name not in client.list_database_names():
-                client.close()
+            if db_name not in await client.list_database_names():
                 return {"status": "error", "message": f"Database {db_name} not found"}
 
             # Drop the database
-            client.drop_database(db_name)
-            client.close()
+            await client.drop_database(db_name)
+            _collection_stats.pop(db_name)
 
             logger.info(f"Successfully dropped database: {db_name}")
             return {
@@ -106,3 +123,141 @@ class MongoDBService:
         except Exception as e:
             logger.error(f"Error dropping database {db_name}: {e}")
             return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def list_collections(
+        db_name: str,
+        after: Optional[List[Any]] = None,
+        limit: int = MONGODB_COLLECTIONS_PAGE_SIZE,
+        sort: str = "size",
+    ) -> Dict[str, Any]:
+        """Get one page of a database's collection stats after cursor key `after`.
+
+        Sorted largest first (`size`) or by `name`; collection stats are
+        walked on the first request and cached for MONGODB_STATS_TTL.
+        """
+        try:
+            client = MongoDBService._get_client()
+            if db_name not in await client.list_database_names():
+                return {"status": "error", "message": f"Database {db_name} not found"}
+
+            db = client[db_name]
+            semaphore = asyncio.Semaphore(MONGODB_STATS_CONCURRENCY)
+            stats = await MongoDBService._db_stats(db, semaphore)
+            collections = await MongoDBService._collections(db, semaphore, stats)
+
+            sort_key = SORT_KEYS[sort]
+            if sort != "size":
+                collections = sorted(collections, key=sort_key)
+            start = 0
+            if after is not None:
+                keys = [sort_key(c) for c in collections]
+                start = bisect.bisect_right(keys, after)
+            page = collections[start : start + limit]
+            has_more = start + limit < len(collections)
+            return {
+                "status": "success",
+                "database": db_name,
+                "total": len(collections),
+                "sort": sort,
+                "collections": page,
+                "next_cursor": (
+                    encode_cursor(sort_key(page[-1])) if page and has_more else None
+                ),
+            }
+        except Exception as e:
+            logger.error(f"Error listing collections of {db_name}: {e}")
+            return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def _database_info(
+        db: AsyncDatabase, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """dbStats totals for one database.
+
+        Per-collection stats are left to `list_collections`, which pages them.
+        """
+        try:
+            stats = await MongoDBService._db_stats(db, semaphore)
+        except Exception as e:
+            logger.error(f"Error collecting stats for MongoDB database {db.name}: {e}")
+            return {"name": db.name, "collection_count": 0, "error": str(e)}
+
+        storage_size = int(stats.get("storageSize", 0))
+        index_size = int(stats.get("indexSize", 0))
+        return {
+            "name": db.name,
+            "collection_count": int(stats.get("collections", 0)),
+            "objects": int(stats.get("objects", 0)),
+            "data_size_bytes": int(stats.get("dataSize", 0)),
+            "storage_size_bytes": storage_size,
+            "index_size_bytes": index_size,
+            "size": format_bytes(storage_size + index_size),
+        }
+
+    @staticmethod
+    async def _db_stats(
+        db: AsyncDatabase, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Fresh dbStats; forgets cached collection stats that it contradicts."""
+        async with semaphore:
+            with timed("mongodb", "db_stats", db.name):
+                stats = await db.command("dbStats")
+
+        cached = _collection_stats.get(db.name)
+        if cached is not None and cached["collection_count"] != stats.get(
+            "collections"
+        ):
+            # Collections were created or dropped since the cached walk
+            _collection_stats.pop(db.name)
+        return stats
+
+    @staticmethod
+    async def _collections(
+        db: AsyncDatabase, semaphore: asyncio.Semaphore, stats: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """The database's collection stats, from the cache when still fresh."""
+
+        async def walk() -> Dict[str, Any]:
+            return {
+                "collection_count": stats.get("collections"),
+                "collections": await MongoDBService._collection_stats(db, semaphore),
+            }
+
+        entry = await _collection_stats.get_or_load(db.name, walk)
+        return entry["collections"]
+
+    @staticmethod
+    async def _collection_stats(
+        db: AsyncDatabase, semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """`$collStats` storage stats for every collection, largest first."""
+        async with semaphore:
+            with timed("mongodb", "list_collections", db.name):
+                names = await db.list_collection_names(filter={"type": "collection"})
+
+        async def stats(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    with timed("mongodb", "coll_stats", f"{db.name}.{name}"):
+                        cursor = await db[name].aggregate(
+                            [{"$collStats": {"storageStats": {}}}]
+                        )
+                        # One document per shard on sharded clusters
+                        shards = [doc["storageStats"] async for doc in cursor]
+                except Exception as e:
+                    return {"name": name, "error": str(e)}
+            storage_size = sum(int(s.get("storageSize", 0)) for s in shards)
+            index_size = sum(int(s.get("totalIndexSize", 0)) for s in shards)
+            return {
+                "name": name,
+                "count": sum(int(s.get("count", 0)) for s in shards),
+                "data_size_bytes": sum(int(s.get("size", 0)) for s in shards),
+                "storage_size_bytes": storage_size,
+                "index_size_bytes": index_size,
+                "indexes": max((int(s.get("nindexes", 0)) for s in shards), default=0),
+                "size": format_bytes(storage_size + index_size),
+            }
+
+        collections = await asyncio.gather(*(stats(name) for name in names))
+        return sorted(collections, key=SORT_KEYS["size"])
@@ -1,102 +1,263 @@
 """PostgreSQL service module."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-import psycopg2
 from config import (
+    POSTGRES_CATALOG_CONCURRENCY,
+    POSTGRES_CATALOG_TIMEOUT,
     POSTGRES_DEFAULT_DB,
     POSTGRES_HOST,
-    POSTGRES_PASSWORD,
+    POSTGRES_INSIGHTS_BLOAT_RATIO,
+    POSTGRES_INSIGHTS_MIN_ROWS,
+    POSTGRES_INSIGHTS_TOP,
+    POSTGRES_INSIGHTS_TTL,
     POSTGRES_PORT,
     POSTGRES_PROTECTED_DBS,
-    POSTGRES_USER,
+    POSTGRES_PROVISION_CONCURRENCY,
+    POSTGRES_TABLES_PAGE_SIZE,
 )
+from psycopg import sql
+from services.cache import TTLCache
+from services.clients import clients
+from services.counters import CounterRates
+from services.instrumentation import timed
+from services.shaping import encode_cursor
 
 logger = logging.getLogger(__name__)
 
 
+# Database list, sizes and connection counts in a single round trip
+DATABASES_QUERY = """
+    WITH activity AS (
+        SELECT datname, count(*) AS connections
+        FROM pg_stat_activity
+        GROUP BY datname
+    )
+    SELECT
+        d.datname,
+        d.datallowconn,
+        s.size_bytes,
+        pg_size_pretty(s.size_bytes),
+        COALESCE(a.connections, 0),
+        (SELECT sum(connections) FROM activity)
+    FROM pg_database d
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN has_database_privilege(d.datname, 'CONNECT')
+            THEN pg_database_size(d.datname)
+        END AS size_bytes
+    ) s
+    LEFT JOIN activity a ON a.datname = d.datname
+    WHERE NOT d.datistemplate
+    ORDER BY d.datname;
+"""
+
+# Relations listed per database; reads pg_class directly, which is much
+# cheaper than the information_schema views
+RELATIONS_FILTER = """
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+    AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+"""
+
+TABLE_COUNT_QUERY = "SELECT count(*)" + RELATIONS_FILTER
+
+# One keyset page of tables: relname is unique within the schema
+TABLES_PAGE_QUERY = (
+    """
+    SELECT
+        c.relname,
+        c.relkind,
+        c.reltuples::bigint,
+        pg_total_relation_size(c.oid),
+        pg_size_pretty(pg_total_relation_size(c.oid))
+"""
+    + RELATIONS_FILTER
+    + """
+    AND c.relname > %s
+    ORDER BY c.relname
+    LIMIT %s;
+"""
+)
+
+# A single database's size and connection count
+DATABASE_QUERY = """
+    SELECT
+        d.datallowconn,
+        s.size_bytes,
+        pg_size_pretty(s.size_bytes),
+        (SELECT count(*) FROM pg_stat_activity a WHERE a.datname = d.datname)
+    FROM pg_database d
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN has_database_privilege(d.datname, 'CONNECT')
+            THEN pg_database_size(d.datname)
+        END AS size_bytes
+    ) s
+    WHERE d.datname = %s AND NOT d.datistemplate;
+"""
+
+RELKINDS = {
+    "r": "table",
+    "p": "partitioned table",
+    "v": "view",
+    "m": "materialized view",
+    "f": "foreign table",
+}
+
+
+# Workload insights. Cluster-wide counters per database; rates are
+# computed between calls
+DATABASE_STATS_QUERY = """
+    SELECT
+        s.datname,
+        s.xact_commit + s.xact_rollback,
+        s.xact_rollback,
+        s.blks_read,
+        s.blks_hit,
+        s.tup_inserted + s.tup_updated + s.tup_deleted,
+        s.tup_returned + s.tup_fetched,
+        s.temp_bytes,
+        s.deadlocks
+    FROM pg_stat_database s
+    JOIN pg_database d ON d.oid = s.datid
+    WHERE NOT d.datistemplate AND d.datallowconn
+    ORDER BY s.datname;
+"""
+
+# Connections by database and application; lock waits count as waiting
+ACTIVITY_QUERY = """
+    SELECT
+        datname,
+        COALESCE(NULLIF(application_name, ''), 'unknown'),
+        count(*) FILTER (
+            WHERE state = 'active' AND wait_event_type IS DISTINCT FROM 'Lock'
+        ),
+        count(*) FILTER (WHERE state = 'idle'),
+        count(*) FILTER (WHERE state LIKE 'idle in transaction%'),
+        count(*) FILTER (WHERE wait_event_type = 'Lock'),
+        extract(epoch FROM max(now() - xact_start) FILTER (WHERE state <> 'idle'))
+            ::float8
+    FROM pg_stat_activity
+    WHERE backend_type = 'client backend' AND pid <> pg_backend_pid()
+    GROUP BY 1, 2
+    ORDER BY count(*) DESC;
+"""
+
+STATEMENTS_EXTENSION_QUERY = (
+    "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements';"
+)
+
+# Counters only: showtext => false skips reading the query text file, which
+# can hold megabytes, on every refresh
+STATEMENTS_QUERY = """
+    SELECT s.queryid, d.datname, r.rolname,
+        s.calls, s.total_exec_time, s.rows, s.shared_blks_hit, s.shared_blks_read
+    FROM pg_stat_statements(false) s
+    LEFT JOIN pg_database d ON d.oid = s.dbid
+    LEFT JOIN pg_roles r ON r.oid = s.userid
+    WHERE s.queryid IS NOT NULL;
+"""
+
+# Texts for statements shown but not yet cached. The view reads the whole
+# query text file whatever the filter, so texts are cached by queryid and
+# this runs only when a new statement reaches the top lists
+STATEMENT_TEXTS_QUERY = """
+    SELECT DISTINCT ON (queryid) queryid, query
+    FROM pg_stat_statements
+    WHERE queryid = ANY(%s);
+"""
+
+# Per database: scan and churn counters with size for each user table
+TABLE_STATS_QUERY = """
+    SELECT
+        schemaname || '.' || relname,
+        seq_scan,
+        seq_tup_read,
+        COALESCE(idx_scan, 0),
+        n_live_tup,
+        n_dead_tup,
+        n_tup_ins + n_tup_upd + n_tup_del,
+        pg_table_size(relid),
+        extract(epoch FROM GREATEST(last_vacuum, last_autovacuum))::float8
+    FROM pg_stat_user_tables;
+"""
+
+# Per database: never-scanned indexes that don't enforce a constraint
+UNUSED_INDEXES_QUERY = """
+    SELECT
+        s.schemaname || '.' || s.relname,
+        s.indexrelname,
+        pg_relation_size(s.indexrelid),
+        pg_size_pretty(pg_relation_size(s.indexrelid))
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.idx_scan = 0 AND NOT i.indisunique AND NOT i.indisprimary
+    ORDER BY pg_relation_size(s.indexrelid) DESC
+    LIMIT %s;
+"""
+
+EXISTING_DATABASES_QUERY = "SELECT datname FROM pg_database WHERE datname = ANY(%s);"
+
+# CREATE DATABASE ... STRATEGY values, available from PostgreSQL 15
+CREATE_STRATEGIES = {"wal_log": "WAL_LOG", "file_copy": "FILE_COPY"}
+
+# Longest statement text returned by the insights endpoint
+STATEMENT_TEXT_LIMIT = 2000
+
+# Insights are cached briefly; rates span the time between two loads
+_insights: TTLCache[Dict[str, Any]] = TTLCache(POSTGRES_INSIGHTS_TTL)
+_rates = CounterRates()
+# queryid -> statement text, kept while the statement is in pg_stat_statements
+_statement_texts: Dict[int, str] = {}
+
+INVALID_NAME_MESSAGE = (
+    "Invalid database name. Use only alphanumeric characters, hyphens, and "
+    "underscores."
+)
+
+
+def _valid_name(db_name: str) -> bool:
+    return bool(db_name) and db_name.replace("_", "").replace("-", "").isalnum()
+
+
+def _create_statement(
+    db_name: str, template: Optional[str], strategy: Optional[str]
+) -> sql.Composed:
+    statement = sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name))
+    if template:
+        statement += sql.SQL(" TEMPLATE {}").format(sql.Identifier(template))
+    if strategy:
+        statement += sql.SQL(" STRATEGY {}").format(
+            sql.SQL(CREATE_STRATEGIES[strategy])
+        )
+    return statement + sql.SQL(";")
+
+
 class PostgresService:
     """Service class for PostgreSQL operations."""
 
     @staticmethod
-    def get_info() -> Dict[str, Any]:
+    async def get_info() -> Dict[str, Any]:
         """Get detailed info from PostgreSQL."""
         try:
-            conn = psycopg2.connect(
-                host=POSTGRES_HOST,
-                port=POSTGRES_PORT,
-                user=POSTGRES_USER,
-                password=POSTGRES_PASSWORD,
-                dbname=POSTGRES_DEFAULT_DB,
-            )
-            cur = conn.cursor()
-
-            # Get all databases
-            cur.execute("SELECT datname FROM pg_database WHERE datistemplate = false;")
-            databases = [row[0] for row in cur.fetchall()]
-
-            # Get connection count
-            cur.execute("SELECT count(*) FROM pg_stat_activity;")
-            connections = cur.fetchone()[0]
-
-            # Get database sizes
-            cur.execute(
-                """
-                SELECT datname, pg_size_pretty(pg_database_size(datname)) as size
-                FROM pg_database
-                WHERE datistemplate = false;
-            """
+            with timed("postgres", "databases"):
+                async with clients.postgres() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(DATABASES_QUERY)
+                        rows = await cur.fetchall()
+
+            connections = int(rows[0][5]) if rows else 0
+            semaphore = asyncio.Semaphore(POSTGRES_CATALOG_CONCURRENCY)
+            databases_info: List[Dict[str, Any]] = list(
+                await asyncio.gather(
+                    *(PostgresService._collect_database(row, semaphore) for row in rows)
+                )
             )
-            db_sizes = {row[0]: row[1] for row in cur.fetchall()}
-
-            cur.close()
-            conn.close()
-
-            # Get tables for each database
-            databases_info: List[Dict[str, Any]] = []
-            for db_name in databases:
-                db_conn = None
-                try:
-                    db_conn = psycopg2.connect(
-                        host=POSTGRES_HOST,
-                        port=POSTGRES_PORT,
-                        user=POSTGRES_USER,
-                        password=POSTGRES_PASSWORD,
-                        dbname=db_name,
-                    )
-                    db_cur = db_conn.cursor()
-                    db_cur.execute(
-                        """
-                        SELECT table_name
-                        FROM information_schema.tables
-                        WHERE table_schema = 'public'
-                        ORDER BY table_name;
-                    """
-                    )
-                    db_tables = [row[0] for row in db_cur.fetchall()]
-                    db_cur.close()
-                    databases_info.append(
-                        {
-                            "name": db_name,
-                            "size": db_sizes.get(db_name),
-                            "tables": db_tables,
-                            "table_count": len(db_tables),
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error fetching tables for DB {db_name}: {e}")
-                    databases_info.append(
-                        {
-                            "name": db_name,
-                            "size": db_sizes.get(db_name),
-                            "tables": [],
-                            "table_count": 0,
-                        }
-                    )
-                finally:
-                    if db_conn:
-                        db_conn.close()
 
             return {
                 "status": "connected",
@@ -105,48 +266,509 @@ class PostgresService:
                 "databases": databases_info,
                 "database_count": len(databases_info),
                 "connections": connections,
+                "partial": any(
+                    db["status"] in ("timeout", "error") for db in databases_info
+                ),
             }
         except Exception as e:
             logger.error(f"Postgres connection error: {e}")
             return {"status": "error", "message": str(e)}
 
     @staticmethod
-    def create_database(db_name: str) -> Dict[str, Any]:
-        """Create a new blank PostgreSQL database."""
+    async def _collect_database(
+        row: Tuple[Any, ...], semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Count one database's tables, bounded by the catalog timeout.
+
+        Table lists are left to `get_database`, which pages them on demand.
+        """
+        db_name, allow_conn, size_bytes, size, db_connections, _ = row
+        db_info: Dict[str, Any] = {
+            "name": db_name,
+            "size": size,
+            "size_bytes": size_bytes,
+            "connections": db_connections,
+            "status": "ok",
+            "table_count": 0,
+        }
+        if not allow_conn:
+            db_info["status"] = "skipped"
+            return db_info
+        if clients.is_reserved(db_name):
+            db_info["status"] = "skipped"
+            db_info["message"] = "In use as a template"
+            return db_info
+
+        async with semaphore:
+            try:
+                with timed("postgres", "table_count", db_name):
+                    db_info["table_count"] = await asyncio.wait_for(
+                        PostgresService._count_tables(db_name),
+                        timeout=POSTGRES_CATALOG_TIMEOUT,
+                    )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Timed out fetching tables for DB {db_name} "
+                    f"after {POSTGRES_CATALOG_TIMEOUT}s"
+                )
+                db_info["status"] = "timeout"
+            except Exception as e:
+                logger.error(f"Error fetching tables for DB {db_name}: {e}")
+                db_info["status"] = "error"
+                db_info["message"] = str(e)
+        return db_info
+
+    @staticmethod
+    async def _count_tables(db_name: str) -> int:
+        """Count the public tables of a database."""
+        async with clients.postgres(db_name) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(TABLE_COUNT_QUERY)
+                row = await cur.fetchone()
+        return int(row[0])
+
+    @staticmethod
+    async def get_database(
+        db_name: str, after: str = "", limit: int = POSTGRES_TABLES_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """Get one database's details with a page of tables after `after`."""
         try:
-            # Validate database name
-            if not db_name or not db_name.replace("_", "").replace("-", "").isalnum():
+            with timed("postgres", "database", db_name):
+                async with clients.postgres() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(DATABASE_QUERY, (db_name,))
+                        row = await cur.fetchone()
+            if row is None:
+                return {"status": "error", "message": f"Database {db_name} not found"}
+            allow_conn, size_bytes, size, connections = row
+            if not allow_conn:
                 return {
                     "status": "error",
-                    "message": "Invalid database name. Use only alphanumeric characters, hyphens, and underscores.",
+                    "message": f"Database {db_name} does not allow connections",
                 }
 
-            # Connect to default database to create the new database
-            conn = psycopg2.connect(
-                host=POSTGRES_HOST,
-                port=POSTGRES_PORT,
-                user=POSTGRES_USER,
-                password=POSTGRES_PASSWORD,
-                dbname=POSTGRES_DEFAULT_DB,
+            with timed("postgres", "tables", db_name):
+                table_count, tables = await asyncio.wait_for(
+                    PostgresService._get_tables(db_name, after, limit),
+                    timeout=POSTGRES_CATALOG_TIMEOUT,
+                )
+            return {
+                "status": "success",
+                "name": db_name,
+                "size_bytes": size_bytes,
+                "size": size,
+                "connections": connections,
+                "table_count": table_count,
+                "tables": tables,
+                "next_cursor": (
+                    encode_cursor([tables[-1]["name"]])
+                    if len(tables) == limit
+                    else None
+                ),
+            }
+        except asyncio.TimeoutError:
+            message = f"Timed out fetching tables after {POSTGRES_CATALOG_TIMEOUT}s"
+            logger.warning(f"{message} for DB {db_name}")
+            return {"status": "timeout", "message": message}
+        except Exception as e:
+            logger.error(f"Error fetching details for DB {db_name}: {e}")
+            return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def _get_tables(
+        db_name: str, after: str, limit: int
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Count the public tables and list a page of them with sizes."""
+        async with clients.postgres(db_name) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(TABLE_COUNT_QUERY)
+                count_row = await cur.fetchone()
+                await cur.execute(TABLES_PAGE_QUERY, (after, limit))
+                rows = await cur.fetchall()
+
+        tables = [
+            {
+                "name": name,
+                "kind": RELKINDS.get(relkind, relkind),
+                # reltuples is -1 until the first ANALYZE and meaningless for views
+                "rows_estimate": (
+                    rows_estimate
+                    if relkind in ("r", "p", "m") and rows_estimate >= 0
+                    else None
+                ),
+                "size_bytes": size_bytes,
+                "size": size,
+            }
+            for name, relkind, rows_estimate, size_bytes, size in rows
+        ]
+        return int(count_row[0]), tables
+
+    @staticmethod
+    async def get_insights(
+        top: int = POSTGRES_INSIGHTS_TOP, database: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Workload insights: what is loading the instance, and from where.
+
+        Reports per-database throughput, connections by database and
+        application, the top statements from pg_stat_statements, and per
+        database the unused indexes, missing-index candidates and bloated
+        tables. Counters are turned into per-second rates over the time
+        since the previous load, so they describe now rather than uptime.
+        """
+        result = await _insights.get_or_load(
+            (top, database), lambda: PostgresService._collect_insights(top, database)
+        )
+        if result["status"] == "error":
+            _insights.pop((top, database))
+        return result
+
+    @staticmethod
+    async def _collect_insights(top: int, database: Optional[str]) -> Dict[str, Any]:
+        try:
+            with timed("postgres", "insights"):
+                async with clients.postgres() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(DATABASE_STATS_QUERY)
+                        database_rows = await cur.fetchall()
+                        await cur.execute(ACTIVITY_QUERY)
+                        activity_rows = await cur.fetchall()
+                        await cur.execute(STATEMENTS_EXTENSION_QUERY)
+                        has_statements = await cur.fetchone() is not None
+
+            if database is not None:
+                database_rows = [row for row in database_rows if row[0] == database]
+                activity_rows = [row for row in activity_rows if row[0] == database]
+                if not database_rows:
+                    return {
+                        "status": "error",
+                        "message": f"Database {database} not found",
+                    }
+
+            interval, databases = PostgresService._database_rates(
+                database_rows, database
             )
-            conn.autocommit = True
-            cur = conn.cursor()
-
-            # Check if database already exists
-            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s;", (db_name,))
-            if cur.fetchone():
-                cur.close()
-                conn.close()
-                return {
-                    "status": "error",
-                    "message": f"Database {db_name} already exists",
+            semaphore = asyncio.Semaphore(POSTGRES_CATALOG_CONCURRENCY)
+            details = await asyncio.gather(
+                *(
+                    PostgresService._database_insights(db["name"], top, semaphore)
+                    for db in databases
+                )
+            )
+            for db, detail in zip(databases, details):
+                db.update(detail)
+
+            if has_statements:
+                statements = await PostgresService._statements(top, database)
+            else:
+                statements = {
+                    "available": False,
+                    "message": (
+                        "pg_stat_statements is not installed; add it to "
+                        "shared_preload_libraries and run CREATE EXTENSION "
+                        f"pg_stat_statements in {POSTGRES_DEFAULT_DB}"
+                    ),
+                }
+
+            return {
+                "status": "connected",
+                "interval_seconds": round(interval, 1) if interval else None,
+                "databases": databases,
+                "connections": [
+                    {
+                        "database": db_name,
+                        "application": application,
+                        "active": active,
+                        "idle": idle,
+                        "idle_in_transaction": idle_in_transaction,
+                        "waiting": waiting,
+                        "longest_transaction_seconds": (
+                            round(longest, 1) if longest is not None else None
+                        ),
+                    }
+                    for (
+                        db_name,
+                        application,
+                        active,
+                        idle,
+                        idle_in_transaction,
+                        waiting,
+                        longest,
+                    ) in activity_rows
+                ],
+                "statements": statements,
+            }
+        except Exception as e:
+            logger.error(f"Error collecting Postgres insights: {e}")
+            return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    def _database_rates(
+        rows: List[Tuple[Any, ...]], database: Optional[str]
+    ) -> Tuple[Optional[float], List[Dict[str, Any]]]:
+        """Throughput per database from pg_stat_database counters."""
+        fields = (
+            "transactions",
+            "rollbacks",
+            "blocks_read",
+            "blocks_hit",
+            "rows_written",
+            "rows_read",
+            "temp_bytes",
+        )
+        sample = {row[0]: dict(zip(fields, map(float, row[1:8]))) for row in rows}
+        interval, rates = _rates.rates(f"databases:{database or ''}", sample)
+
+        databases = []
+        for row in rows:
+            name, deadlocks = row[0], row[8]
+            rate = rates[name]
+            counters = rate or sample[name]
+            blocks = counters["blocks_read"] + counters["blocks_hit"]
+            db_info: Dict[str, Any] = {
+                "name": name,
+                "deadlocks": deadlocks,
+                # Over the interval when known, otherwise since stats reset
+                "cache_hit_ratio": (
+                    round(counters["blocks_hit"] / blocks, 4) if blocks else None
+                ),
+            }
+            for field in ("transactions", "rollbacks", "rows_written", "rows_read"):
+                db_info[f"{field}_per_second"] = round(rate[field], 2) if rate else None
+            db_info["temp_bytes_per_second"] = (
+                round(rate["temp_bytes"]) if rate else None
+            )
+            databases.append(db_info)
+        return interval, databases
+
+    @staticmethod
+    async def _database_insights(
+        db_name: str, top: int, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Index and table health of one database, bounded by the catalog timeout."""
+        async with semaphore:
+            try:
+                with timed("postgres", "table_stats", db_name):
+                    table_rows, index_rows = await asyncio.wait_for(
+                        PostgresService._table_stats(db_name, top),
+                        timeout=POSTGRES_CATALOG_TIMEOUT,
+                    )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Timed out fetching table stats for DB {db_name} "
+                    f"after {POSTGRES_CATALOG_TIMEOUT}s"
+                )
+                return {"status": "timeout"}
+            except Exception as e:
+                logger.error(f"Error fetching table stats for DB {db_name}: {e}")
+                return {"status": "error", "message": str(e)}
+
+        sample = {
+            row[0]: {
+                "seq_scan": float(row[1]),
+                "seq_rows": float(row[2]),
+                "idx_scan": float(row[3]),
+                "writes": float(row[6]),
+            }
+            for row in table_rows
+        }
+        _, rates = _rates.rates(f"tables:{db_name}", sample)
+
+        candidates = []
+        bloated = []
+        for (
+            table,
+            seq_scan,
+            seq_rows,
+            idx_scan,
+            live,
+            dead,
+            _,
+            size,
+            vacuumed,
+        ) in table_rows:
+            rate = rates[table]
+            if live >= POSTGRES_INSIGHTS_MIN_ROWS and seq_scan > idx_scan:
+                candidates.append(
+                    {
+                        "table": table,
+                        "rows": live,
+                        "seq_scan": seq_scan,
+                        "idx_scan": idx_scan,
+                        "avg_rows_per_seq_scan": seq_rows // seq_scan,
+                        "seq_scans_per_second": (
+                            round(rate["seq_scan"], 3) if rate else None
+                        ),
+                        "seq_rows_per_second": (
+                            round(rate["seq_rows"]) if rate else None
+                        ),
+                    }
+                )
+            dead_ratio = dead / (live + dead) if live + dead else 0.0
+            if dead_ratio >= POSTGRES_INSIGHTS_BLOAT_RATIO:
+                bloated.append(
+                    {
+                        "table": table,
+                        "size_bytes": size,
+                        "live_tuples": live,
+                        "dead_tuples": dead,
+                        "dead_ratio": round(dead_ratio, 3),
+                        # Estimated from dead tuple counts, not a page scan
+                        "estimated_bloat_bytes": int(size * dead_ratio),
+                        "last_vacuum": vacuumed,
+                    }
+                )
+
+        # Rank by rows scanned over the interval, then since stats reset
+        candidates.sort(
+            key=lambda c: (
+                c["seq_rows_per_second"] or 0,
+                c["avg_rows_per_seq_scan"] * c["seq_scan"],
+            ),
+            reverse=True,
+        )
+        bloated.sort(key=lambda b: b["estimated_bloat_bytes"], reverse=True)
+        return {
+            "status": "ok",
+            "unused_indexes": [
+                {"table": table, "index": index, "size_bytes": size_bytes, "size": size}
+                for table, index, size_bytes, size in index_rows
+            ],
+            "missing_index_candidates": candidates[:top],
+            "bloated_tables": bloated[:top],
+        }
+
+    @staticmethod
+    async def _table_stats(
+        db_name: str, top: int
+    ) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+        async with clients.postgres(db_name) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(TABLE_STATS_QUERY)
+                table_rows = await cur.fetchall()
+                await cur.execute(UNUSED_INDEXES_QUERY, (top,))
+                index_rows = await cur.fetchall()
+        return table_rows, index_rows
+
+    @staticmethod
+    async def _statements(top: int, database: Optional[str]) -> Dict[str, Any]:
+        """Top statements by total, mean and recent execution time."""
+        with timed("postgres", "statements"):
+            async with clients.postgres() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(STATEMENTS_QUERY)
+                    rows = await cur.fetchall()
+
+        # Top-level and nested entries of the same statement are summed
+        sample: Dict[Tuple[Any, ...], Dict[str, float]] = {}
+        for queryid, db_name, user, calls, total_ms, rows_, hit, read in rows:
+            if database is not None and db_name != database:
+                continue
+            counters = sample.setdefault(
+                (queryid, db_name, user),
+                {"calls": 0.0, "total_ms": 0.0, "rows": 0.0, "hit": 0.0, "read": 0.0},
+            )
+            counters["calls"] += calls
+            counters["total_ms"] += total_ms
+            counters["rows"] += rows_
+            counters["hit"] += hit
+            counters["read"] += read
+        interval, rates = _rates.rates(f"statements:{database or ''}", sample)
+
+        statements = []
+        for (queryid, db_name, user), counters in sample.items():
+            rate = rates[(queryid, db_name, user)]
+            calls = counters["calls"]
+            blocks = counters["hit"] + counters["read"]
+            statements.append(
+                {
+                    "queryid": str(queryid),
+                    "database": db_name,
+                    "user": user,
+                    "calls": int(calls),
+                    "total_ms": round(counters["total_ms"], 2),
+                    "mean_ms": round(counters["total_ms"] / calls, 3) if calls else 0,
+                    "rows": int(counters["rows"]),
+                    "cache_hit_ratio": (
+                        round(counters["hit"] / blocks, 4) if blocks else None
+                    ),
+                    "calls_per_second": round(rate["calls"], 3) if rate else None,
+                    # Execution time per wall-clock second, i.e. busy backends
+                    "ms_per_second": round(rate["total_ms"], 2) if rate else None,
+                    "recent_mean_ms": (
+                        round(rate["total_ms"] / rate["calls"], 3)
+                        if rate and rate["calls"]
+                        else None
+                    ),
                 }
+            )
 
-            # Create the database
-            cur.execute(f'CREATE DATABASE "{db_name}";')
+        result: Dict[str, Any] = {
+            "available": True,
+            "count": len(statements),
+            "top_by_total_time": sorted(
+                statements, key=lambda s: s["total_ms"], reverse=True
+            )[:top],
+            "top_by_mean_time": sorted(
+                statements, key=lambda s: s["mean_ms"], reverse=True
+            )[:top],
+            "top_by_recent_time": (
+                sorted(
+                    (s for s in statements if s["ms_per_second"]),
+                    key=lambda s: s["ms_per_second"],
+                    reverse=True,
+                )[:top]
+                if interval
+                else None
+            ),
+        }
 
-            cur.close()
-            conn.close()
+        shown = {
+            int(s["queryid"])
+            for key in ("top_by_total_time", "top_by_mean_time", "top_by_recent_time")
+            for s in result[key] or []
+        }
+        # Forget texts of statements evicted from pg_stat_statements
+        present = {row[0] for row in rows}
+        for queryid in _statement_texts.keys() - present:
+            del _statement_texts[queryid]
+        missing = shown - _statement_texts.keys()
+        if missing:
+            with timed("postgres", "statement_texts"):
+                async with clients.postgres() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(STATEMENT_TEXTS_QUERY, (list(missing),))
+                        for queryid, query in await cur.fetchall():
+                            _statement_texts[queryid] = query[:STATEMENT_TEXT_LIMIT]
+        for key in ("top_by_total_time", "top_by_mean_time", "top_by_recent_time"):
+            for s in result[key] or []:
+                s["query"] = _statement_texts.get(int(s["queryid"]))
+        return result
+
+    @staticmethod
+    async def create_database(db_name: str) -> Dict[str, Any]:
+        """Create a new blank PostgreSQL database."""
+        try:
+            # Validate database name
+            if not _valid_name(db_name):
+                return {"status": "error", "message": INVALID_NAME_MESSAGE}
+
+            # Use the default database's pool to create the new database
+            async with clients.postgres() as conn:
+                async with conn.cursor() as cur:
+                    # Check if database already exists
+                    await cur.execute(
+                        "SELECT 1 FROM pg_database WHERE datname = %s;", (db_name,)
+                    )
+                    if await cur.fetchone():
+                        return {
+                            "status": "error",
+                            "message": f"Database {db_name} already exists",
+                        }
+
+                    # Create the database
+                    await cur.execute(
+                        sql.SQL("CREATE DATABASE {};").format(sql.Identifier(db_name))
+                    )
 
             logger.info(f"Successfully created database: {db_name}")
             return {
@@ -158,7 +780,129 @@ class PostgresService:
             return {"status": "error", "message": str(e)}
 
     @staticmethod
-    def drop_database(db_name: str) -> Dict[str, Any]:
+    async def create_databases(
+        names: List[str],
+        template: Optional[str] = None,
+        strategy: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Create many databases at once, optionally cloned from a template.
+
+        Names are checked up front against the catalog in one query, then
+        created concurrently over the default database's pool. Each
+        database gets its own result; one failure doesn't stop the rest.
+        """
+        names = list(dict.fromkeys(names))
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for name in names:
+            if _valid_name(name):
+                pending.append(name)
+            else:
+                results[name] = {"status": "error", "message": INVALID_NAME_MESSAGE}
+
+        try:
+            if template is not None:
+                if not _valid_name(template):
+                    return {"status": "error", "message": "Invalid template name"}
+                if template == POSTGRES_DEFAULT_DB:
+                    # Our own pool keeps connections to it open
+                    return {
+                        "status": "error",
+                        "message": f"Cannot use {template} as a template",
+                    }
+
+            async with clients.postgres() as conn:
+                if strategy and conn.info.server_version < 150000:
+                    return {
+                        "status": "error",
+                        "message": "Choosing a strategy requires PostgreSQL 15+",
+                    }
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        EXISTING_DATABASES_QUERY,
+                        (pending + [template] if template else pending,),
+                    )
+                    existing = {row[0] for row in await cur.fetchall()}
+
+            if template is not None and template not in existing:
+                return {
+                    "status": "error",
+                    "message": f"Template database {template} not found",
+                }
+            for name in pending:
+                if name in existing:
+                    results[name] = {
+                        "status": "error",
+                        "message": f"Database {name} already exists",
+                    }
+            pending = [name for name in pending if name not in existing]
+
+            semaphore = asyncio.Semaphore(POSTGRES_PROVISION_CONCURRENCY)
+            creates = (
+                PostgresService._create_one(name, template, strategy, semaphore)
+                for name in pending
+            )
+            if template is None:
+                created = await asyncio.gather(*creates)
+            else:
+                # A template can't be cloned while anyone is connected to it;
+                # keep the collectors and other requests off it meanwhile
+                async with clients.reserve_postgres(template):
+                    created = await asyncio.gather(*creates)
+            results.update(zip(pending, created))
+        except Exception as e:
+            logger.error(f"Error creating databases: {e}")
+            return {"status": "error", "message": str(e)}
+
+        succeeded = sum(1 for r in results.values() if r["status"] == "success")
+        logger.info(f"Created {succeeded} of {len(names)} databases")
+        return {
+            "status": (
+                "success"
+                if succeeded == len(names)
+                else "partial" if succeeded else "error"
+            ),
+            "message": f"Created {succeeded} of {len(names)} databases",
+            "template": template,
+            "results": [{"name": name, **results[name]} for name in names],
+        }
+
+    @staticmethod
+    async def _create_one(
+        db_name: str,
+        template: Optional[str],
+        strategy: Optional[str],
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                with timed("postgres", "create_database", db_name):
+                    async with clients.postgres() as conn:
+                        await conn.execute(
+                            _create_statement(db_name, template, strategy)
+                        )
+            except Exception as e:
+                logger.error(f"Error creating database {db_name}: {e}")
+                return {"status": "error", "message": str(e)}
+            return {
+                "status": "success",
+                "message": f"Database {db_name} created successfully",
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+
+    @staticmethod
+    async def database_exists(db_name: str) -> bool:
+        """Whether a database exists (raises if the server is unreachable)."""
+        async with clients.postgres() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "SELECT 1 FROM pg_database WHERE datname = %s;", (db_name,)
+                )
+                return await cur.fetchone() is not None
+
+    @staticmethod
+    async def drop_database(db_name: str) -> Dict[str, Any]:
         """Drop a PostgreSQL database."""
         # Check if database is protected
         if db_name in POSTGRES_PROTECTED_DBS:
@@ -168,40 +912,39 @@ class PostgresService:
             }
 
         try:
-            # Connect to default database to drop the target database
-            conn = psycopg2.connect(
-                host=POSTGRES_HOST,
-                port=POSTGRES_PORT,
-                user=POSTGRES_USER,
-                password=POSTGRES_PASSWORD,
-                dbname=POSTGRES_DEFAULT_DB,
-            )
-            conn.autocommit = True
-            cur = conn.cursor()
-
-            # Check if database exists
-            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s;", (db_name,))
-            if not cur.fetchone():
-                cur.close()
-                conn.close()
-                return {"status": "error", "message": f"Database {db_name} not found"}
+            # Release our own pooled connections to the target database
+            await clients.release_postgres(db_name)
 
-            # Terminate all connections to the database
-            cur.execute(
-                """
-                SELECT pg_terminate_backend(pg_stat_activity.pid)
-                FROM pg_stat_activity
-                WHERE pg_stat_activity.datname = %s
-                AND pid <> pg_backend_pid();
-            """,
-                (db_name,),
-            )
+            # Use the default database's pool to drop the target database
+            async with clients.postgres() as conn:
+                async with conn.cursor() as cur:
+                    # Check if database exists
+                    await cur.execute(
+                        "SELECT 1 FROM pg_database WHERE datname = %s;", (db_name,)
+                    )
+                    if not await cur.fetchone():
+                        return {
+                            "status": "error",
+                            "message": f"Database {db_name} not found",
+                        }
 
-            # Drop the database
-            cur.execute(f'DROP DATABASE "{db_name}";')
+                    # Terminate all connections to the database
+                    await cur.execute(
+                        """
+                        SELECT pg_terminate_backend(pg_stat_activity.pid)
+                        FROM pg_stat_activity
+                        WHERE pg_stat_activity.datname = %s
+                        AND pid <> pg_backend_pid();
+                    """,
+                        (db_name,),
+                    )
+
+                    # Drop the database
+                    await cur.execute(
+                        sql.SQL("DROP DATABASE {};").format(sql.Identifier(db_name))
+                    )
 
-            cur.close()
-            conn.close()
+            _rates.forget(f"tables:{db_name}")
 
             logger.info(f"Successfully dropped database: {db_name}")
             return {
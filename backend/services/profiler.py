@@ -0,0 +1,99 @@
+"""On-demand sampling profiler for the whole process."""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+# Functions listed in a profile's `top`
+TOP_FUNCTIONS = 50
+
+
+def _label(code: Any, lineno: int) -> str:
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{lineno})"
+
+
+class SamplingProfiler:
+    """Samples the stack of every thread at a fixed interval.
+
+    Only one profile runs at a time. Sampling reads `sys._current_frames()`
+    from its own thread, so the event loop is observed without being
+    instrumented; the cost is a stack walk per thread per interval.
+    """
+
+    def __init__(self) -> None:
+        self._running = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._running.locked()
+
+    def profile(self, seconds: float, interval: float) -> Dict[str, Any]:
+        """Sample for `seconds` (blocking); raises RuntimeError if busy."""
+        if not self._running.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            return self._sample(seconds, interval)
+        finally:
+            self._running.release()
+
+    def _sample(self, seconds: float, interval: float) -> Dict[str, Any]:
+        me = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack: List[Tuple[Any, int]] = []
+                while frame is not None:
+                    stack.append((frame.f_code, frame.f_lineno))
+                    frame = frame.f_back
+                stack.reverse()
+                stacks[(names.get(ident, str(ident)), tuple(stack))] += 1
+            samples += 1
+            time.sleep(interval)
+        return self._report(stacks, samples, time.perf_counter() - start, interval)
+
+    def _report(
+        self, stacks: Counter, samples: int, elapsed: float, interval: float
+    ) -> Dict[str, Any]:
+        threads: Counter = Counter()
+        own: Counter = Counter()
+        cumulative: Counter = Counter()
+        folded: List[str] = []
+        for (thread, stack), count in stacks.most_common():
+            threads[thread] += count
+            if stack:
+                code, lineno = stack[-1]
+                own[_label(code, lineno)] += count
+            # A recursive function counts once per stack
+            for code in {code for code, _ in stack}:
+                cumulative[_label(code, code.co_firstlineno)] += count
+            frames = ";".join(_label(code, lineno) for code, lineno in stack)
+            folded.append(f"{thread};{frames} {count}")
+
+        return {
+            "seconds": round(elapsed, 3),
+            "interval_ms": round(interval * 1000, 3),
+            "samples": samples,
+            "threads": dict(threads.most_common()),
+            "top_self": [
+                {"function": label, "samples": count}
+                for label, count in own.most_common(TOP_FUNCTIONS)
+            ],
+            "top_cumulative": [
+                {"function": label, "samples": count}
+                for label, count in cumulative.most_common(TOP_FUNCTIONS)
+            ],
+            # Collapsed stacks, loadable by flamegraph.pl or speedscope
+            "folded": folded,
+        }
+
+
+profiler = SamplingProfiler()
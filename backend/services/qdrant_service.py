@@ -1,10 +1,22 @@
 """Qdrant service module."""
 
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from config import QDRANT_DASHBOARD_URL, QDRANT_GRPC_PORT, QDRANT_HOST, QDRANT_REST_PORT
-from qdrant_client import QdrantClient
+from config import (
+    QDRANT_COLLECTION_CONCURRENCY,
+    QDRANT_COLLECTION_TIMEOUT,
+    QDRANT_DASHBOARD_URL,
+    QDRANT_GRPC_PORT,
+    QDRANT_HOST,
+    QDRANT_PREFER_GRPC,
+    QDRANT_REST_PORT,
+)
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.models import CollectionInfo
+from services.clients import clients
+from services.instrumentation import timed
 
 logger = logging.getLogger(__name__)
 
@@ -13,41 +25,102 @@ class QdrantService:
     """Service class for Qdrant operations."""
 
     @staticmethod
-    def get_info() -> Dict[str, Any]:
+    async def get_info() -> Dict[str, Any]:
         """Get detailed info from Qdrant."""
         try:
-            client = QdrantClient(host=QDRANT_HOST, port=QDRANT_REST_PORT)
-            collections_response = client.get_collections()
-
-            collections_info = []
-            for collection in collections_response.collections:
-                try:
-                    col_info = client.get_collection(collection.name)
-                    collections_info.append(
-                        {
-                            "name": collection.name,
-                            "vectors_count": col_info.vectors_count,
-                            "points_count": col_info.points_count,
-                        }
-                    )
-                except Exception:
-                    collections_info.append(
-                        {
-                            "name": collection.name,
-                            "vectors_count": 0,
-                            "points_count": 0,
-                        }
-                    )
+            client = clients.qdrant()
+            with timed("qdrant", "get_collections"):
+                collections_response = await client.get_collections()
+
+            # Fetch collection details concurrently
+            semaphore = asyncio.Semaphore(QDRANT_COLLECTION_CONCURRENCY)
+            collections_info = await asyncio.gather(
+                *(
+                    QdrantService._collection_info(client, collection.name, semaphore)
+                    for collection in collections_response.collections
+                )
+            )
 
             return {
                 "status": "connected",
                 "host": QDRANT_HOST,
                 "rest_port": QDRANT_REST_PORT,
                 "grpc_port": QDRANT_GRPC_PORT,
+                "transport": "grpc" if QDRANT_PREFER_GRPC else "rest",
                 "dashboard_url": QDRANT_DASHBOARD_URL,
-                "collections": collections_info,
+                "collections": sorted(collections_info, key=lambda c: c["name"]),
                 "collection_count": len(collections_info),
             }
         except Exception as e:
             logger.error(f"Qdrant connection error: {e}")
             return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def _collection_info(
+        client: AsyncQdrantClient, name: str, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Details of one collection, or status `unknown` if they can't be read."""
+        try:
+            async with semaphore:
+                with timed("qdrant", "get_collection", name):
+                    info = await asyncio.wait_for(
+                        client.get_collection(name), QDRANT_COLLECTION_TIMEOUT
+                    )
+        except Exception as e:
+            logger.error(f"Error getting Qdrant collection {name}: {e}")
+            # Unknown, not zero: a failed call says nothing about the data
+            return {
+                "name": name,
+                "status": "unknown",
+                "vectors_count": None,
+                "points_count": None,
+                "error": str(e) or type(e).__name__,
+            }
+        return QdrantService._describe(name, info)
+
+    @staticmethod
+    def _describe(name: str, info: CollectionInfo) -> Dict[str, Any]:
+        """Flatten a CollectionInfo into the snapshot format."""
+        optimizer = info.optimizer_status
+        params = info.config.params
+        hnsw_on_disk = bool(info.config.hnsw_config.on_disk)
+
+        vectors = params.vectors
+        if vectors is None:
+            vectors = {}
+        elif not isinstance(vectors, dict):
+            # A single unnamed vector
+            vectors = {"": vectors}
+        vector_config: List[Dict[str, Any]] = []
+        for vector_name, vector in sorted(vectors.items()):
+            hnsw = vector.hnsw_config
+            vector_config.append(
+                {
+                    "name": vector_name,
+                    "size": vector.size,
+                    "distance": str(getattr(vector.distance, "value", vector.distance)),
+                    "on_disk": bool(vector.on_disk),
+                    "hnsw_on_disk": (
+                        bool(hnsw.on_disk)
+                        if hnsw is not None and hnsw.on_disk is not None
+                        else hnsw_on_disk
+                    ),
+                }
+            )
+
+        return {
+            "name": name,
+            "status": str(getattr(info.status, "value", info.status)),
+            # Servers before 1.13 still report vectors_count
+            "vectors_count": getattr(info, "vectors_count", None),
+            "indexed_vectors_count": info.indexed_vectors_count,
+            "points_count": info.points_count,
+            "segments_count": info.segments_count,
+            "optimizer_status": (
+                "ok"
+                if str(getattr(optimizer, "value", "")) == "ok"
+                else getattr(optimizer, "error", str(optimizer))
+            ),
+            "on_disk_payload": bool(params.on_disk_payload),
+            "vectors": vector_config,
+        }
@@ -0,0 +1,197 @@
+"""Sampled Redis keyspace analysis grouped by key prefix."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from config import (
+    REDIS_KEYSPACE_BATCH_SIZE,
+    REDIS_KEYSPACE_BUDGET,
+    REDIS_KEYSPACE_MAX_KEYS,
+    REDIS_KEYSPACE_PAUSE,
+    REDIS_KEYSPACE_TOP_PREFIXES,
+)
+from redis.exceptions import ResponseError
+from services.clients import clients
+from services.instrumentation import timed
+from services.units import format_bytes
+
+logger = logging.getLogger(__name__)
+
+NO_PREFIX = "(no prefix)"
+
+
+class _PrefixStats:
+    """Totals for the sampled keys sharing one prefix."""
+
+    def __init__(self) -> None:
+        self.keys = 0
+        self.memory_bytes = 0
+        self.memory_unknown = 0
+        self.types: Dict[str, int] = {}
+        self.with_ttl = 0
+        self.ttl_total = 0
+
+    def add(self, key_type: str, memory: Optional[int], ttl: Optional[int]) -> None:
+        self.keys += 1
+        self.types[key_type] = self.types.get(key_type, 0) + 1
+        if memory is None:
+            self.memory_unknown += 1
+        else:
+            self.memory_bytes += memory
+        if ttl is not None and ttl >= 0:
+            self.with_ttl += 1
+            self.ttl_total += ttl
+
+    def to_dict(self, prefix: str, scale: float) -> Dict[str, Any]:
+        # None rather than 0 when the server refused every MEMORY USAGE
+        estimated_memory = (
+            round(self.memory_bytes * scale)
+            if self.memory_unknown < self.keys
+            else None
+        )
+        return {
+            "prefix": prefix,
+            "sampled_keys": self.keys,
+            "estimated_keys": round(self.keys * scale),
+            "sampled_memory_bytes": self.memory_bytes,
+            "estimated_memory_bytes": estimated_memory,
+            "estimated_memory": (
+                format_bytes(estimated_memory) if estimated_memory is not None else None
+            ),
+            "types": self.types,
+            "with_ttl": self.with_ttl,
+            "avg_ttl_seconds": (
+                round(self.ttl_total / self.with_ttl) if self.with_ttl else None
+            ),
+        }
+
+
+class KeyspaceAnalyzer:
+    """Walks a Redis keyspace with SCAN and groups keys by prefix.
+
+    Keys are read in SCAN batches; `TYPE`, `MEMORY USAGE` and `TTL` for a
+    batch go out in one non-transactional pipeline, with a short pause
+    between batches so other clients are never starved. The walk stops at
+    the time or key budget, and the sampled totals are scaled up by the
+    DB size to estimate the whole keyspace.
+    """
+
+    def __init__(
+        self,
+        delimiter: str = ":",
+        depth: int = 1,
+        budget: float = REDIS_KEYSPACE_BUDGET,
+        max_keys: int = REDIS_KEYSPACE_MAX_KEYS,
+    ) -> None:
+        self._delimiter = delimiter
+        self._depth = depth
+        self._budget = budget
+        self._max_keys = max_keys
+
+    async def analyze(self, dbs: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Analyze the given logical DBs, or every DB in `INFO keyspace`."""
+        start = time.monotonic()
+        if dbs is None:
+            with timed("redis", "info"):
+                keyspace = await clients.redis().info("keyspace")
+            dbs = sorted(int(name[2:]) for name in keyspace if name.startswith("db"))
+
+        # Split the remaining budget evenly over the DBs still to walk
+        results = []
+        for i, db in enumerate(dbs):
+            remaining = len(dbs) - i
+            deadline = time.monotonic() + max(
+                0.0, (self._budget - (time.monotonic() - start)) / remaining
+            )
+            max_keys = self._max_keys // len(dbs)
+            results.append(await self._analyze_db(db, deadline, max_keys))
+
+        return {
+            "delimiter": self._delimiter,
+            "depth": self._depth,
+            "databases": results,
+            "duration_seconds": round(time.monotonic() - start, 3),
+        }
+
+    async def _analyze_db(
+        self, db: int, deadline: float, max_keys: int
+    ) -> Dict[str, Any]:
+        """Sample one logical DB until its deadline or key budget."""
+        prefixes: Dict[str, _PrefixStats] = {}
+        sampled = 0
+        cursor = 0
+        complete = False
+
+        async with clients.redis_db(db) as r:
+            with timed("redis", "dbsize"):
+                total_keys = await r.dbsize()
+            while time.monotonic() < deadline and sampled < max_keys:
+                count = min(REDIS_KEYSPACE_BATCH_SIZE, max_keys - sampled)
+                with timed("redis", "scan"):
+                    cursor, keys = await r.scan(cursor, count=count)
+                if keys:
+                    await self._inspect(r, keys, prefixes)
+                    sampled += len(keys)
+                if cursor == 0:
+                    complete = True
+                    break
+                await asyncio.sleep(REDIS_KEYSPACE_PAUSE)
+
+        # SCAN visits keys in hash-table order, so a partial walk is a
+        # reasonably unbiased sample to scale up from
+        scale = total_keys / sampled if sampled and not complete else 1.0
+        groups = sorted(
+            (stats.to_dict(prefix, scale) for prefix, stats in prefixes.items()),
+            key=lambda group: (
+                -(group["estimated_memory_bytes"] or 0),
+                -group["sampled_keys"],
+            ),
+        )
+        estimated_memory = sum(group["estimated_memory_bytes"] or 0 for group in groups)
+        return {
+            "db": db,
+            "keys": total_keys,
+            "sampled_keys": sampled,
+            "complete": complete,
+            "estimated_memory_bytes": estimated_memory,
+            "estimated_memory": format_bytes(estimated_memory),
+            "memory_unavailable": any(s.memory_unknown for s in prefixes.values()),
+            "prefix_count": len(groups),
+            "prefixes": groups[:REDIS_KEYSPACE_TOP_PREFIXES],
+        }
+
+    async def _inspect(
+        self, r, keys: List[bytes], prefixes: Dict[str, _PrefixStats]
+    ) -> None:
+        """Pipeline TYPE, MEMORY USAGE and TTL for a batch of keys."""
+        pipe = r.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.memory_usage(key)
+            pipe.ttl(key)
+        with timed("redis", "pipeline"):
+            replies = await pipe.execute(raise_on_error=False)
+
+        for i, key in enumerate(keys):
+            key_type, memory, ttl = replies[3 * i : 3 * i + 3]
+            if isinstance(key_type, ResponseError):
+                continue
+            if isinstance(key_type, bytes):
+                key_type = key_type.decode()
+            if key_type == "none":
+                # Expired or deleted since SCAN returned it
+                continue
+            prefix = self._prefix(key.decode("utf-8", errors="replace"))
+            prefixes.setdefault(prefix, _PrefixStats()).add(
+                key_type,
+                memory if isinstance(memory, int) else None,
+                ttl if isinstance(ttl, int) else None,
+            )
+
+    def _prefix(self, key: str) -> str:
+        parts = key.split(self._delimiter)
+        if len(parts) == 1:
+            return NO_PREFIX
+        return self._delimiter.join(parts[: min(self._depth, len(parts) - 1)])
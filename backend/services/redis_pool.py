@@ -0,0 +1,39 @@
+"""Redis connection pool instrumented for the pool stats endpoint."""
+
+import threading
+import time
+
+import redis.asyncio as aioredis
+from services.clients import WaitStats
+from services.tracing import record
+
+
+class TimedRedisPool(aioredis.BlockingConnectionPool):
+    """Blocking Redis pool that tracks its size and checkout wait times."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = WaitStats()
+        self._counter_lock = threading.Lock()
+        self.created = 0
+        self.in_use = 0
+
+    def make_connection(self):
+        connection = super().make_connection()
+        with self._counter_lock:
+            self.created += 1
+        return connection
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        self.wait_stats.record(time.perf_counter() - start)
+        record("redis.connect", start)
+        with self._counter_lock:
+            self.in_use += 1
+        return connection
+
+    async def release(self, connection):
+        with self._counter_lock:
+            self.in_use = max(0, self.in_use - 1)
+        await super().release(connection)
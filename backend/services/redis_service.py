@@ -1,10 +1,13 @@
 """Redis service module."""
 
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-import redis
 from config import REDIS_HOST, REDIS_PORT
+from services.clients import clients
+from services.instrumentation import timed
+from services.redis_keyspace import KeyspaceAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -12,22 +15,51 @@ logger = logging.getLogger(__name__)
 class RedisService:
     """Service class for Redis operations."""
 
+    # One keyspace walk at a time, however many clients ask for it
+    _keyspace_lock = asyncio.Lock()
+
     @staticmethod
-    def get_info() -> Dict[str, Any]:
+    async def get_info() -> Dict[str, Any]:
         """Get detailed info from Redis."""
         try:
-            r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
-            info = r.info()
+            r = clients.redis()
+            with timed("redis", "info"):
+                info = await r.info()
+            with timed("redis", "dbsize"):
+                keys = await r.dbsize()
             return {
                 "status": "connected",
                 "host": REDIS_HOST,
                 "port": REDIS_PORT,
                 "version": info.get("redis_version"),
                 "uptime_days": info.get("uptime_in_days"),
+                "used_memory": info.get("used_memory"),
                 "used_memory_human": info.get("used_memory_human"),
                 "connected_clients": info.get("connected_clients"),
-                "keys": r.dbsize(),
+                "keys": keys,
             }
         except Exception as e:
             logger.error(f"Redis connection error: {e}")
             return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def analyze_keyspace(
+        dbs: Optional[List[int]] = None,
+        delimiter: str = ":",
+        depth: int = 1,
+        budget: Optional[float] = None,
+        max_keys: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Estimate key counts and memory per key prefix from a sampled SCAN."""
+        options: Dict[str, Any] = {"delimiter": delimiter, "depth": depth}
+        if budget is not None:
+            options["budget"] = budget
+        if max_keys is not None:
+            options["max_keys"] = max_keys
+        try:
+            async with RedisService._keyspace_lock:
+                result = await KeyspaceAnalyzer(**options).analyze(dbs)
+            return {"status": "success", **result}
+        except Exception as e:
+            logger.error(f"Error analyzing Redis keyspace: {e}")
+            return {"status": "error", "message": str(e)}
@@ -0,0 +1,102 @@
+"""Registry of backend services whose modules load on first use."""
+
+import asyncio
+import importlib
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from config import ENABLED_SERVICES
+
+logger = logging.getLogger(__name__)
+
+# Service name -> "module:class". Importing a module pulls in its driver.
+SERVICES: Dict[str, str] = {
+    "redis": "services.redis_service:RedisService",
+    "postgres": "services.postgres_service:PostgresService",
+    "minio": "services.minio_service:MinioService",
+    "qdrant": "services.qdrant_service:QdrantService",
+    "mongodb": "services.mongodb_service:MongoDBService",
+}
+
+
+class ServiceDisabledError(LookupError):
+    """Raised when a service that is not enabled is requested."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Service {name} is not enabled")
+        self.name = name
+
+
+class ServiceRegistry:
+    """Enabled services, each imported the first time it is used.
+
+    Driver imports are heavy (boto3, qdrant_client and pymongo take
+    seconds together), so nothing is imported at startup and disabled
+    services are never imported at all. `load` imports on a worker thread
+    so the event loop keeps serving meanwhile.
+    """
+
+    def __init__(self, services: Dict[str, str], enabled: Iterable[str]) -> None:
+        self._services = dict(services)
+        enabled = list(enabled)
+        unknown = [name for name in enabled if name not in self._services]
+        if unknown:
+            logger.warning(f"Ignoring unknown services in ENABLED_SERVICES: {unknown}")
+        self._enabled = [name for name in enabled if name in self._services]
+        self._loaded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the enabled services."""
+        return list(self._enabled)
+
+    def enabled(self, name: str) -> bool:
+        return name in self._enabled
+
+    def loaded(self) -> List[str]:
+        """Names of the services imported so far."""
+        return list(self._loaded)
+
+    def register(self, name: str, path: str, enable: bool = True) -> None:
+        """Add a service implemented by the class at `path` ("module:class")."""
+        self._services[name] = path
+        if enable and name not in self._enabled:
+            self._enabled.append(name)
+
+    def get(self, name: str) -> Any:
+        """The service class, importing its module now if needed."""
+        service = self._loaded.get(name)
+        if service is not None:
+            return service
+        if name not in self._enabled:
+            raise ServiceDisabledError(name)
+        with self._lock:
+            service = self._loaded.get(name)
+            if service is None:
+                module, _, attr = self._services[name].partition(":")
+                service = getattr(importlib.import_module(module), attr)
+                self._loaded[name] = service
+                logger.info(f"Loaded service {name}")
+        return service
+
+    async def load(self, name: str) -> Any:
+        """Like `get`, but imports on a thread instead of blocking the loop."""
+        service = self._loaded.get(name)
+        if service is not None:
+            return service
+        if name not in self._enabled:
+            raise ServiceDisabledError(name)
+        return await asyncio.to_thread(self.get, name)
+
+    def collector(self, name: str) -> Callable[[], Awaitable[Dict[str, Any]]]:
+        """A snapshot collector that loads the service on its first run."""
+
+        async def collect() -> Dict[str, Any]:
+            return await (await self.load(name)).get_info()
+
+        return collect
+
+
+registry = ServiceRegistry(SERVICES, ENABLED_SERVICES)
@@ -0,0 +1,89 @@
+"""Response shaping: field projection, summary depth and opaque cursors."""
+
+import base64
+import json
+from typing import Any, Dict, List, Optional
+
+# Always kept by a projection, so clients can tell errors and freshness apart
+ALWAYS_INCLUDED = ("status", "message", "snapshot")
+
+DEPTHS = ("summary", "full")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[List[str]]]:
+    """Split `a,b.c` into dotted paths; None means every field."""
+    if not fields:
+        return None
+    return [field.strip().split(".") for field in fields.split(",") if field.strip()]
+
+
+def project(data: Any, paths: List[List[str]]) -> Any:
+    """Keep only the given dotted paths, applying them across lists.
+
+    `databases.name` keeps the `name` of every item of `databases`.
+    """
+    if isinstance(data, list):
+        return [project(item, paths) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    nested: Dict[str, List[List[str]]] = {}
+    for path in paths:
+        nested.setdefault(path[0], []).append(path[1:])
+
+    result: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key in nested:
+            rest = nested[key]
+            # A bare `databases` wins over `databases.name`
+            result[key] = value if [] in rest else project(value, rest)
+        elif key in ALWAYS_INCLUDED:
+            result[key] = value
+    return result
+
+
+def summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the lists nested inside top-level lists, keeping their counts.
+
+    `databases[].collections` goes while `databases[].collection_count`
+    stays, so cards get their numbers without every child object.
+    """
+    result: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, list):
+            value = [
+                (
+                    {k: v for k, v in item.items() if not isinstance(v, list)}
+                    if isinstance(item, dict)
+                    else item
+                )
+                for item in value
+            ]
+        result[key] = value
+    return result
+
+
+def shape(data: Dict[str, Any], fields: Optional[str], depth: str) -> Dict[str, Any]:
+    """Apply `?depth=` and then `?fields=` to a response payload."""
+    if depth == "summary":
+        data = summarize(data)
+    paths = parse_fields(fields)
+    return project(data, paths) if paths else data
+
+
+def encode_cursor(key: List[Any]) -> str:
+    """Opaque cursor for the sort key of the last item on a page."""
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Inverse of `encode_cursor`; raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
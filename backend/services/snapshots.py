@@ -0,0 +1,270 @@
+"""Background snapshot collector with a stale-while-revalidate cache."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+from config import SNAPSHOT_INTERVALS, SNAPSHOT_MUTATION_WAIT
+from services.breaker import OPEN, breakers
+from services.events import broker, diff_dicts
+from services.history import extract_metrics, history
+from services.http import make_etag
+from services.instrumentation import (
+    COLLECTOR_DURATION,
+    COLLECTOR_RUNS,
+    ERRORS,
+    SNAPSHOT_READS,
+)
+from services.registry import registry
+from services.tracing import trace
+
+logger = logging.getLogger(__name__)
+
+Collector = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class Snapshot:
+    """The result of one collector run."""
+
+    def __init__(self, data: Dict[str, Any], generation: int, duration: float):
+        self.data = data
+        self.generation = generation
+        self.duration = duration
+        self.collected_at = time.time()
+        self._collected_monotonic = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was collected."""
+        return time.monotonic() - self._collected_monotonic
+
+    @cached_property
+    def etag(self) -> str:
+        """Content hash of the collected data, excluding freshness metadata."""
+        return make_etag(
+            orjson.dumps(
+                self.data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        )
+
+
+class SnapshotCollector:
+    """Keeps an in-memory snapshot of every service, refreshed in the background.
+
+    Each service is refreshed on its own interval by a background task,
+    started on the service's first read rather than at startup: a service
+    nobody looks at is never collected, so its driver is never loaded.
+    Reads never wait on a backend: they return the latest snapshot with its
+    age and kick off a refresh if it is stale. Mutations bump the service's
+    generation, which marks its snapshot stale until a newer run completes.
+    """
+
+    def __init__(
+        self, collectors: Dict[str, Collector], intervals: Dict[str, float]
+    ) -> None:
+        self._collectors = collectors
+        self._intervals = intervals
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._generation: Dict[str, int] = {name: 0 for name in collectors}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._refresh_generation: Dict[str, int] = {}
+        self._loops: Dict[str, asyncio.Task] = {}
+        self._started = False
+
+    @property
+    def names(self):
+        """Names of the services with a collector."""
+        return list(self._collectors)
+
+    async def start(self) -> None:
+        """Allow refresh loops; each one starts on its service's first read."""
+        self._started = True
+        logger.info(f"Snapshot collector started for: {', '.join(self._collectors)}")
+
+    async def stop(self) -> None:
+        """Cancel the background loops and any in-flight refreshes."""
+        self._started = False
+        tasks = list(self._loops.values()) + list(self._refreshes.values())
+        self._loops.clear()
+        self._refreshes.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Snapshot collector stopped")
+
+    def _ensure_loop(self, name: str) -> None:
+        """Start the service's refresh loop if it isn't running yet."""
+        if self._started and name not in self._loops:
+            self._loops[name] = asyncio.create_task(
+                self._run(name), name=f"snapshot-{name}"
+            )
+            logger.info(f"Snapshot loop started for {name}")
+
+    def is_stale(self, name: str) -> bool:
+        """Whether the service's snapshot is missing, expired or invalidated."""
+        snapshot = self._snapshots.get(name)
+        return (
+            snapshot is None
+            or snapshot.generation < self._generation[name]
+            or snapshot.age >= self._intervals[name]
+        )
+
+    def refresh(self, name: str) -> asyncio.Task:
+        """Start a refresh unless an up-to-date one is already in flight."""
+        task = self._refreshes.get(name)
+        generation = self._generation[name]
+        if (
+            task is None
+            or task.done()
+            or self._refresh_generation.get(name, -1) < generation
+        ):
+            previous = task if task is not None and not task.done() else None
+            task = asyncio.create_task(self._collect(name, generation, previous))
+            self._refreshes[name] = task
+            self._refresh_generation[name] = generation
+        return task
+
+    def latest(self, name: str) -> Optional[Snapshot]:
+        """The latest snapshot as is, without triggering a refresh."""
+        return self._snapshots.get(name)
+
+    def get(self, name: str) -> Dict[str, Any]:
+        """Return the latest snapshot immediately, refreshing it if stale."""
+        self._ensure_loop(name)
+        stale = self.is_stale(name)
+        if stale:
+            self.refresh(name)
+        result = "miss" if name not in self._snapshots else "stale" if stale else "hit"
+        SNAPSHOT_READS.labels(name, result).inc()
+        return self._render(name, stale)
+
+    def _render(self, name: str, stale: bool) -> Dict[str, Any]:
+        """The latest snapshot's data with its freshness metadata."""
+        snapshot = self._snapshots.get(name)
+        meta: Dict[str, Any] = {
+            "collected_at": None,
+            "age_seconds": None,
+            "duration_seconds": None,
+            "stale": stale,
+            "refreshing": self.is_refreshing(name),
+        }
+        if snapshot is None:
+            return {
+                "status": "pending",
+                "message": f"First {name} snapshot is still being collected",
+                "snapshot": meta,
+            }
+
+        meta["collected_at"] = datetime.fromtimestamp(
+            snapshot.collected_at, timezone.utc
+        ).isoformat()
+        meta["age_seconds"] = round(snapshot.age, 3)
+        meta["duration_seconds"] = round(snapshot.duration, 3)
+        return {**snapshot.data, "snapshot": meta}
+
+    async def fetch(self, name: str, timeout: float) -> Dict[str, Any]:
+        """Return a fresh snapshot, waiting at most `timeout` seconds for one.
+
+        Unlike `get`, a stale snapshot is not served: if the refresh misses
+        the deadline the service is reported with status `timeout`.
+        """
+        self._ensure_loop(name)
+        if not self.is_stale(name):
+            return self.get(name)
+
+        done, _ = await asyncio.wait({self.refresh(name)}, timeout=timeout)
+        if done:
+            return self.get(name)
+
+        snapshot = self.get(name)
+        return {
+            "status": "timeout",
+            "message": f"No fresh {name} snapshot within {timeout}s",
+            "snapshot": snapshot["snapshot"],
+        }
+
+    def is_refreshing(self, name: str) -> bool:
+        """Whether a refresh is currently in flight for the service."""
+        task = self._refreshes.get(name)
+        return task is not None and not task.done()
+
+    async def invalidate(
+        self, name: str, wait: Optional[float] = SNAPSHOT_MUTATION_WAIT
+    ) -> None:
+        """Mark a service's snapshot stale after a mutation and refresh it.
+
+        Waits up to `wait` seconds for the new snapshot so the caller's next
+        read reflects its own change; the refresh keeps running past that.
+        """
+        self._ensure_loop(name)
+        self._generation[name] += 1
+        task = self.refresh(name)
+        if wait:
+            await asyncio.wait({task}, timeout=wait)
+
+    async def _run(self, name: str) -> None:
+        """Refresh a service whenever its snapshot reaches its interval."""
+        interval = self._intervals[name]
+        while True:
+            snapshot = self._snapshots.get(name)
+            delay = interval - snapshot.age if snapshot else 0
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self.refresh(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Snapshot loop for {name} failed: {e}")
+                await asyncio.sleep(interval)
+
+    async def _collect(
+        self, name: str, generation: int, previous: Optional[asyncio.Task]
+    ) -> None:
+        """Run the collector and store its result as the new snapshot."""
+        if previous is not None:
+            # Let the older run finish so it cannot overwrite this one
+            await asyncio.wait({previous})
+
+        start = time.perf_counter()
+        breaker = breakers.get(name)
+        try:
+            if breaker is not None and breaker.state == OPEN:
+                # Known to be down: answer without touching the backend
+                data = breaker.unavailable()
+            else:
+                # Collections over SLOW_COLLECTOR_THRESHOLD land in the slow log
+                with trace("collector", name):
+                    data = await self._collectors[name]()
+        except Exception as e:
+            logger.error(f"Snapshot collection for {name} failed: {e}")
+            ERRORS.labels(name, type(e).__name__).inc()
+            data = {"status": "error", "message": str(e)}
+        previous = self._snapshots.get(name)
+        snapshot = Snapshot(data, generation, time.perf_counter() - start)
+        self._snapshots[name] = snapshot
+        COLLECTOR_DURATION.labels(name).observe(snapshot.duration)
+        COLLECTOR_RUNS.labels(name, data.get("status", "unknown")).inc()
+        history.record(extract_metrics(name, data), snapshot.collected_at)
+        if previous is None or previous.data != data:
+            self._publish(name, previous.data if previous else {}, data)
+
+    def _publish(self, name: str, old: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Push the changed top-level fields of a snapshot to subscribers."""
+        broker.publish(
+            "snapshot",
+            name,
+            {"service": name, "patch": diff_dicts(old, new)},
+            full=("snapshot", {"service": name, "data": self._render(name, False)}),
+        )
+
+
+# Only enabled services are collected; each loads on its first collection
+snapshots = SnapshotCollector(
+    {name: registry.collector(name) for name in registry.names}, SNAPSHOT_INTERVALS
+)
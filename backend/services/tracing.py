@@ -0,0 +1,200 @@
+"""Lightweight tracing: per-request spans, Server-Timing and a slow log.
+
+A `Trace` is bound to the current context (a request or a snapshot
+collection) and every `span` entered under it is recorded there. Spans
+from `asyncio.gather` children and from `run_blocking` threads land in
+the same trace, since both copy the context.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from config import (
+    SLOW_COLLECTOR_THRESHOLD,
+    SLOW_LOG_SIZE,
+    SLOW_REQUEST_THRESHOLD,
+    TRACE_MAX_SPANS,
+)
+
+# Slowest spans kept per slow log entry
+SLOW_LOG_SPANS = 25
+
+_current: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+
+_TOKEN_UNSAFE = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+
+class Span:
+    """One timed step, e.g. `postgres.table_count` for database `orders`."""
+
+    __slots__ = ("name", "target", "offset", "duration")
+
+    def __init__(
+        self, name: str, target: Optional[str], offset: float, duration: float
+    ) -> None:
+        self.name = name
+        self.target = target
+        self.offset = offset
+        self.duration = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "target": self.target,
+            "offset_ms": round(self.offset * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+        }
+
+
+class Trace:
+    """The spans recorded while handling one request or collection."""
+
+    def __init__(self, kind: str, name: str) -> None:
+        self.kind = kind
+        self.name = name
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.spans: List[Span] = []
+        self.dropped = 0
+        # Cleared for traces that should never reach the slow log
+        self.loggable = True
+        self.status: Optional[int] = None
+
+    def add(self, name: str, start: float, target: Optional[str] = None) -> None:
+        """Record a span that began at perf_counter() `start` and ends now."""
+        if self.duration is not None:
+            # Late span from a task that outlived the request
+            return
+        if len(self.spans) >= TRACE_MAX_SPANS:
+            self.dropped += 1
+            return
+        end = time.perf_counter()
+        self.spans.append(Span(name, target, start - self.start, end - start))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def finish(self) -> float:
+        if self.duration is None:
+            self.duration = self.elapsed()
+        return self.duration
+
+    def totals(self) -> Dict[str, Dict[str, Any]]:
+        """Span count and summed duration per span name.
+
+        Concurrent spans overlap, so totals can exceed the wall time.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += span.duration
+        return totals
+
+    def server_timing(self) -> str:
+        """The trace as a `Server-Timing` header value."""
+        metrics = []
+        for name, entry in self.totals().items():
+            metric = f"{_TOKEN_UNSAFE.sub('_', name)};dur={entry['seconds'] * 1000:.1f}"
+            if entry["count"] > 1:
+                metric += f';desc="{entry["count"]} calls"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        slowest = sorted(self.spans, key=lambda s: s.duration, reverse=True)
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration_ms": round((self.duration or self.elapsed()) * 1000, 3),
+            "totals": {
+                name: {"count": e["count"], "ms": round(e["seconds"] * 1000, 3)}
+                for name, e in self.totals().items()
+            },
+            "span_count": len(self.spans) + self.dropped,
+            "slowest_spans": [s.to_dict() for s in slowest[:SLOW_LOG_SPANS]],
+        }
+
+
+class SlowLog:
+    """Bounded log of the traces that exceeded their kind's threshold."""
+
+    def __init__(self, thresholds: Dict[str, float], size: int) -> None:
+        self._thresholds = thresholds
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def consider(self, trace: Trace) -> None:
+        """Keep the trace if it is loggable and slow enough."""
+        threshold = self._thresholds.get(trace.kind)
+        if not trace.loggable or threshold is None or trace.finish() < threshold:
+            return
+        entry = trace.to_dict()
+        with self._lock:
+            self._entries.append(entry)
+
+    def list(self, kind: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Most recent entries first, optionally only one kind."""
+        with self._lock:
+            entries = list(self._entries)
+        entries.reverse()
+        if kind:
+            entries = [e for e in entries if e["kind"] == kind]
+        return entries[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_log = SlowLog(
+    {"request": SLOW_REQUEST_THRESHOLD, "collector": SLOW_COLLECTOR_THRESHOLD},
+    SLOW_LOG_SIZE,
+)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+@contextmanager
+def trace(kind: str, name: str) -> Iterator[Trace]:
+    """Bind a new trace to the current context for the duration of the block."""
+    t = Trace(kind, name)
+    token = _current.set(t)
+    try:
+        yield t
+    finally:
+        _current.reset(token)
+        t.finish()
+        slow_log.consider(t)
+
+
+@contextmanager
+def span(name: str, target: Optional[str] = None) -> Iterator[None]:
+    """Record the block as a span of the current trace, if there is one."""
+    t = _current.get()
+    if t is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        t.add(name, start, target)
+
+
+def record(name: str, start: float, target: Optional[str] = None) -> None:
+    """Record a span from perf_counter() `start` to now, if tracing."""
+    t = _current.get()
+    if t is not None:
+        t.add(name, start, target)
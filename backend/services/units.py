@@ -0,0 +1,10 @@
+"""Formatting helpers shared by the service collectors."""
+
+
+def format_bytes(size: float) -> str:
+    """Human readable size, e.g. 1.5 GB."""
+    for unit in ("bytes", "kB", "MB", "GB", "TB"):
+        if abs(size) < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
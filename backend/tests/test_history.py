@@ -0,0 +1,25 @@
+from services.history import MetricsHistory
+
+# Two tiers, the longest covering 10 minutes
+TIERS = [(60, 5), (300, 2)]
+
+
+def test_idle_series_evicted_after_longest_tier_window():
+    history = MetricsHistory(TIERS, max_series=10)
+    history.record({"postgres.db.old.size_bytes": 1.0, "redis.keys": 1.0}, 1000)
+    history.record({"redis.keys": 2.0}, 1000 + 600)
+    assert history.names() == ["postgres.db.old.size_bytes", "redis.keys"]
+
+    history.record({"redis.keys": 3.0}, 1000 + 601)
+    assert history.names() == ["redis.keys"]
+
+
+def test_least_recently_written_series_evicted_at_cap():
+    history = MetricsHistory(TIERS, max_series=2)
+    history.record({"container.a.cpu": 1.0, "container.b.cpu": 1.0}, 1000)
+    history.record({"container.a.cpu": 2.0}, 1060)
+    history.record({"container.c.cpu": 1.0}, 1120)
+    assert history.names() == ["container.a.cpu", "container.c.cpu"]
+
+    points = history.query(["container.c.cpu"], 300, now=1200)
+    assert points["container.c.cpu"]["points"] == [[1080, 1.0]]
@@ -13,10 +13,20 @@ import {
   AlertDialogTrigger,
 } from "@/components/ui/alert-dialog";
 import { Input } from "@/components/ui/input";
-import type { Service, RedisInfo, PostgresInfo, MinioInfo, QdrantInfo, MongoDBInfo } from "@/hooks/use-services";
+import { fetchMongoCollections, fetchPostgresTables } from "@/hooks/use-services";
+import type { Service, RedisInfo, PostgresInfo, MinioInfo, QdrantInfo, MongoDBInfo, Page, PostgresTable, MongoCollectionStats } from "@/hooks/use-services";
 import { Activity, CheckCircle2, AlertCircle, Database, HardDrive, Cpu, ExternalLink, ChevronDown, Copy, Check, Circle, Trash2, Loader2, Plus } from "lucide-react";
 import { useState } from "react";
 
+interface ChildList {
+  items: Array<PostgresTable | MongoCollectionStats>;
+  nextCursor: string | null;
+  loading: boolean;
+  error?: string;
+}
+
+type PageLoader = (dbName: string, cursor?: string | null) => Promise<Page<PostgresTable | MongoCollectionStats>>;
+
 interface ServiceCardProps {
   service: Service;
   detailedInfo?: RedisInfo | PostgresInfo | MinioInfo | QdrantInfo | MongoDBInfo | null;
@@ -32,6 +42,8 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
   const [isCreating, setIsCreating] = useState(false);
   const [newDbName, setNewDbName] = useState("");
   const [expandedDbs, setExpandedDbs] = useState<Set<string>>(new Set());
+  // Tables and collections are loaded when a database is first expanded
+  const [children, setChildren] = useState<Record<string, ChildList>>({});
   const isHealthy = service.health === "healthy";
   const isRunning = service.status === "running";
 
@@ -76,16 +88,61 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
     setTimeout(() => setCopied(false), 2000);
   };
 
-  const toggleDbExpansion = (dbName: string) => {
+  const loadChildren = async (key: string, dbName: string, loader: PageLoader, cursor?: string | null) => {
+    setChildren((prev) => ({
+      ...prev,
+      [key]: { items: prev[key]?.items ?? [], nextCursor: prev[key]?.nextCursor ?? null, loading: true },
+    }));
+    try {
+      const page = await loader(dbName, cursor);
+      setChildren((prev) => ({
+        ...prev,
+        [key]: {
+          items: cursor ? [...(prev[key]?.items ?? []), ...page.items] : page.items,
+          nextCursor: page.next_cursor,
+          loading: false,
+        },
+      }));
+    } catch (err) {
+      setChildren((prev) => ({
+        ...prev,
+        [key]: { ...prev[key], loading: false, error: err instanceof Error ? err.message : "Failed to load" },
+      }));
+    }
+  };
+
+  const toggleDbExpansion = (dbName: string, onExpand?: () => void) => {
     const newExpanded = new Set(expandedDbs);
     if (newExpanded.has(dbName)) {
       newExpanded.delete(dbName);
     } else {
       newExpanded.add(dbName);
+      // Reloaded on every expand so the list matches the latest counts
+      onExpand?.();
     }
     setExpandedDbs(newExpanded);
   };
 
+  const renderLoadMore = (key: string, dbName: string, loader: PageLoader) => {
+    const list = children[key];
+    if (!list) return null;
+    if (list.error) {
+      return <div className="text-[10px] text-muted-foreground italic pl-4">{list.error}</div>;
+    }
+    if (list.loading) {
+      return <Loader2 className="h-3 w-3 animate-spin ml-4 text-muted-foreground" />;
+    }
+    if (!list.nextCursor) return null;
+    return (
+      <button
+        onClick={() => loadChildren(key, dbName, loader, list.nextCursor)}
+        className="text-[10px] text-muted-foreground hover:text-foreground pl-4"
+      >
+        Load more
+      </button>
+    );
+  };
+
   const handleDrop = async (type: string, name: string, dropFn?: (n: string) => Promise<any>) => {
     if (!dropFn) return;
     setIsDeleting(`${type}-${name}`);
@@ -206,7 +263,7 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                           <Collapsible key={db.name} open={expandedDbs.has(`pg-${db.name}`)}>
                             <div className="flex items-center gap-1">
                               <CollapsibleTrigger
-                                onClick={() => toggleDbExpansion(`pg-${db.name}`)}
+                                onClick={() => toggleDbExpansion(`pg-${db.name}`, () => loadChildren(`pg-${db.name}`, db.name, fetchPostgresTables))}
                                 className="flex items-center justify-between flex-1 pl-2 py-1 bg-accent/50 rounded hover:bg-accent transition-colors text-left"
                               >
                                 <div className="flex items-center gap-2">
@@ -249,13 +306,22 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                               </AlertDialog>
                             </div>
                             <CollapsibleContent className="pl-4 mt-1 space-y-0.5">
-                              {db.tables.length > 0 ? (
-                                db.tables.map((table) => (
-                                  <div key={table} className="flex items-center gap-2 py-0.5 text-xs text-muted-foreground">
-                                    <Circle className="h-2 w-2" />
-                                    <span className="font-mono">{table}</span>
-                                  </div>
-                                ))
+                              {db.status === "timeout" || db.status === "error" ? (
+                                <div className="text-[10px] text-muted-foreground italic pl-4">
+                                  {db.status === "timeout" ? "Timed out fetching tables" : "Could not fetch tables"}
+                                </div>
+                              ) : db.table_count > 0 ? (
+                                <>
+                                  {((children[`pg-${db.name}`]?.items ?? []) as PostgresTable[]).map((table) => (
+                                    <div key={table.name} className="flex items-center gap-2 py-0.5 text-xs text-muted-foreground">
+                                      <Circle className="h-2 w-2" />
+                                      <span className="font-mono flex-1">{table.name}</span>
+                                      {table.rows_estimate !== null && <span>~{table.rows_estimate} rows</span>}
+                                      <span>{table.size}</span>
+                                    </div>
+                                  ))}
+                                  {renderLoadMore(`pg-${db.name}`, db.name, fetchPostgresTables)}
+                                </>
                               ) : (
                                 <div className="text-[10px] text-muted-foreground italic pl-4">No tables found</div>
                               )}
@@ -296,17 +362,31 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                       <span>Buckets:</span>
                       <span className="text-foreground font-mono">{info.bucket_count}</span>
                     </div>
+                    {info.total_size && (
+                      <div className="flex items-center justify-between">
+                        <span>Total Size:</span>
+                        <span className="text-foreground font-mono">{info.total_size}</span>
+                      </div>
+                    )}
                     {info.buckets && info.buckets.length > 0 && (
                       <div className="mt-2">
                         <span className="text-muted-foreground">Bucket List:</span>
                         <div className="mt-1 space-y-1">
                           {info.buckets.map((bucket) => {
                             const deleting = isDeleting === `minio-${bucket}`;
+                            const usage = info.usage?.[bucket];
                             return (
                               <div key={bucket} className="flex items-center gap-1">
                                 <div className="flex items-center gap-2 flex-1 pl-2 py-1 bg-accent/50 rounded">
                                   <HardDrive className="h-3 w-3 text-yellow-500" />
                                   <span className="font-mono text-xs text-foreground">{bucket}</span>
+                                  {usage && (
+                                    <span className="ml-auto pr-2 text-xs text-muted-foreground">
+                                      {usage.size !== null
+                                        ? `${usage.objects} objects · ${usage.size}`
+                                        : `scanning… ${usage.scanned_objects ?? 0} objects`}
+                                    </span>
+                                  )}
                                 </div>
                                 <AlertDialog>
                                   <AlertDialogTrigger asChild>
@@ -360,9 +440,16 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                         <span className="text-muted-foreground">Collection List:</span>
                         <div className="mt-1 space-y-1">
                           {info.collections.map((col) => (
-                            <div key={col.name} className="flex items-center justify-between pl-2 py-0.5 bg-accent/50 rounded">
+                            <div
+                              key={col.name}
+                              className="flex items-center justify-between pl-2 py-0.5 bg-accent/50 rounded"
+                              title={col.error ?? `${col.segments_count} segments · optimizer ${col.optimizer_status}`}
+                            >
                               <span className="font-mono text-xs text-foreground">{col.name}</span>
-                              <span className="text-xs text-muted-foreground">{col.points_count} pts</span>
+                              <span className="text-xs text-muted-foreground">
+                                {col.points_count === null ? "unknown" : `${col.points_count} pts`}
+                                {col.status && col.status !== "green" && col.status !== "unknown" && ` · ${col.status}`}
+                              </span>
                             </div>
                           ))}
                         </div>
@@ -390,7 +477,7 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                             <Collapsible key={db.name} open={expandedDbs.has(`mongo-${db.name}`)}>
                               <div className="flex items-center gap-1">
                                 <CollapsibleTrigger
-                                  onClick={() => toggleDbExpansion(`mongo-${db.name}`)}
+                                  onClick={() => toggleDbExpansion(`mongo-${db.name}`, () => loadChildren(`mongo-${db.name}`, db.name, fetchMongoCollections))}
                                   className="flex items-center justify-between flex-1 pl-2 py-1 bg-accent/50 rounded hover:bg-accent transition-colors text-left"
                                 >
                                   <div className="flex items-center gap-2">
@@ -398,7 +485,9 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                                     <span className="font-mono text-xs text-foreground">{db.name}</span>
                                   </div>
                                   <div className="flex items-center gap-2">
-                                    <span className="text-xs text-muted-foreground">{db.collection_count} cols</span>
+                                    <span className="text-xs text-muted-foreground">
+                                      {db.collection_count} cols{db.size ? ` · ${db.size}` : ""}
+                                    </span>
                                     <ChevronDown className={`h-3 w-3 transition-transform ${expandedDbs.has(`mongo-${db.name}`) ? 'rotate-180' : ''}`} />
                                   </div>
                                 </CollapsibleTrigger>
@@ -433,12 +522,18 @@ export function ServiceCard({ service, detailedInfo, onCreatePostgres, onDropPos
                                 </AlertDialog>
                               </div>
                               <CollapsibleContent className="pl-4 mt-1 space-y-0.5">
-                                {db.collections.map((col) => (
-                                  <div key={col} className="flex items-center gap-2 py-0.5 text-xs text-muted-foreground">
+                                {((children[`mongo-${db.name}`]?.items ?? []) as MongoCollectionStats[]).map((col) => (
+                                  <div key={col.name} className="flex items-center gap-2 py-0.5 text-xs text-muted-foreground">
                                     <Circle className="h-2 w-2" />
-                                    <span className="font-mono">{col}</span>
+                                    <span className="font-mono">{col.name}</span>
+                                    {col.size && (
+                                      <span className="ml-auto font-mono">
+                                        {col.count?.toLocaleString()} docs · {col.size}
+                                      </span>
+                                    )}
                                   </div>
                                 ))}
+                                {renderLoadMore(`mongo-${db.name}`, db.name, fetchMongoCollections)}
                               </CollapsibleContent>
                             </Collapsible>
                           );
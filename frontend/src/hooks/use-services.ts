@@ -16,25 +16,80 @@ export interface RedisInfo {
   port?: number;
   version?: string;
   uptime_days?: number;
+  used_memory?: number;
   used_memory_human?: string;
   connected_clients?: number;
   keys?: number;
   message?: string;
 }
 
+export interface PostgresTable {
+  name: string;
+  kind: string;
+  rows_estimate: number | null;
+  size_bytes: number;
+  size: string;
+}
+
 export interface PostgresInfo {
   status: string;
   host?: string;
   port?: number;
   databases?: Array<{
     name: string;
-    size: string;
-    tables: string[];
+    size: string | null;
+    size_bytes: number | null;
+    connections: number;
+    status: "ok" | "timeout" | "error" | "skipped";
     table_count: number;
+    message?: string;
   }>;
   database_count?: number;
   connections?: number;
+  partial?: boolean;
+  message?: string;
+}
+
+// One cursor-paginated page of a database's children (tables or collections)
+export interface Page<T> {
+  status: string;
   message?: string;
+  next_cursor: string | null;
+  items: T[];
+}
+
+async function fetchPage<T>(url: string, key: "tables" | "collections"): Promise<Page<T>> {
+  const res = await fetch(url);
+  if (!res.ok) throw new Error(`Failed to fetch ${key}`);
+  const data = await res.json();
+  if (data.status !== "success") throw new Error(data.message || `Failed to fetch ${key}`);
+  return { status: data.status, next_cursor: data.next_cursor, items: data[key] };
+}
+
+const cursorParam = (cursor?: string | null) => (cursor ? `?cursor=${encodeURIComponent(cursor)}` : "");
+
+// Table lists are not part of the snapshot; they are paged on demand
+export function fetchPostgresTables(dbName: string, cursor?: string | null) {
+  return fetchPage<PostgresTable>(
+    `${API_BASE}/services/postgres/databases/${encodeURIComponent(dbName)}${cursorParam(cursor)}`,
+    "tables",
+  );
+}
+
+export function fetchMongoCollections(dbName: string, cursor?: string | null) {
+  return fetchPage<MongoCollectionStats>(
+    `${API_BASE}/services/mongodb/databases/${encodeURIComponent(dbName)}/collections${cursorParam(cursor)}`,
+    "collections",
+  );
+}
+
+export interface BucketUsage {
+  objects: number | null;
+  size_bytes: number | null;
+  size: string | null;
+  scanned_at: string | null;
+  scanning: boolean;
+  scanned_objects?: number;
 }
 
 export interface MinioInfo {
@@ -43,6 +98,9 @@ export interface MinioInfo {
   console_url?: string;
   buckets?: string[];
   bucket_count?: number;
+  usage?: Record<string, BucketUsage>;
+  total_size_bytes?: number;
+  total_size?: string;
   message?: string;
 }
 
@@ -51,29 +109,135 @@ export interface QdrantInfo {
   host?: string;
   rest_port?: number;
   grpc_port?: number;
+  transport?: "rest" | "grpc";
   dashboard_url?: string;
   collections?: Array<{
     name: string;
-    vectors_count: number;
-    points_count: number;
+    // "unknown" when the collection could not be read
+    status: string;
+    vectors_count: number | null;
+    indexed_vectors_count?: number;
+    points_count: number | null;
+    segments_count?: number;
+    optimizer_status?: string;
+    on_disk_payload?: boolean;
+    vectors?: Array<{
+      name: string;
+      size: number;
+      distance: string;
+      on_disk: boolean;
+      hnsw_on_disk: boolean;
+    }>;
+    error?: string;
   }>;
   collection_count?: number;
   message?: string;
 }
 
+export interface MongoCollectionStats {
+  name: string;
+  count?: number;
+  data_size_bytes?: number;
+  storage_size_bytes?: number;
+  index_size_bytes?: number;
+  indexes?: number;
+  size?: string;
+  error?: string;
+}
+
 export interface MongoDBInfo {
   status: string;
   host?: string;
   port?: number;
   databases?: Array<{
     name: string;
-    collections: string[];
     collection_count: number;
+    objects?: number;
+    data_size_bytes?: number;
+    storage_size_bytes?: number;
+    index_size_bytes?: number;
+    size?: string;
+    error?: string;
   }>;
   database_count?: number;
+  total_size_bytes?: number;
   message?: string;
 }
 
+export interface ServicesOverview {
+  services: {
+    redis: RedisInfo;
+    postgres: PostgresInfo;
+    minio: MinioInfo;
+    qdrant: QdrantInfo;
+    mongodb: MongoDBInfo;
+  };
+  timed_out: string[];
+  duration_seconds: number;
+}
+
+export interface Job {
+  id: string;
+  kind: string;
+  backend: string;
+  target: string;
+  status: "queued" | "running" | "succeeded" | "failed" | "cancelled";
+  progress: Record<string, unknown>;
+  result: Record<string, unknown> | null;
+  error: string | null;
+  elapsed_seconds: number | null;
+}
+
+// Follows a background job's event stream until it finishes
+function waitForJob(jobId: string, onUpdate?: (job: Job) => void): Promise<Job> {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`${API_BASE}/jobs/${jobId}/stream`);
+    source.addEventListener("job", (e) => onUpdate?.(JSON.parse((e as MessageEvent).data)));
+    source.addEventListener("done", (e) => {
+      source.close();
+      const job: Job = JSON.parse((e as MessageEvent).data);
+      if (job.status === "succeeded") resolve(job);
+      else reject(new Error(job.error || `Job ${job.status}`));
+    });
+    source.onerror = () => {
+      // Closed streams are re-opened by EventSource; give up only if the job is gone
+      fetch(`${API_BASE}/jobs/${jobId}`).then((res) => {
+        if (res.status === 404) {
+          source.close();
+          reject(new Error("Job not found"));
+        }
+      });
+    };
+  });
+}
+
+async function runJob(url: string, errorMessage: string): Promise<Job> {
+  const res = await fetch(url, { method: "DELETE" });
+  if (!res.ok) throw new Error(errorMessage);
+  const { job_id } = await res.json();
+  return waitForJob(job_id);
+}
+
+// Payloads pushed by the /events Server-Sent Events stream
+interface ContainerEvent {
+  name: string;
+  container: Service | null;
+}
+
+interface SnapshotEvent {
+  service: keyof ServicesOverview["services"];
+  data?: Record<string, unknown>;
+  patch?: { set: Record<string, unknown>; unset: string[] };
+}
+
+function applySnapshotEvent<T>(prev: T | null, event: SnapshotEvent): T | null {
+  if (event.data) return event.data as T;
+  if (!event.patch || !prev) return prev;
+  const next: Record<string, unknown> = { ...(prev as Record<string, unknown>), ...event.patch.set };
+  for (const key of event.patch.unset) delete next[key];
+  return next as T;
+}
+
 export function useServices() {
   const [services, setServices] = useState<Service[]>([]);
   const [redisInfo, setRedisInfo] = useState<RedisInfo | null>(null);
@@ -98,25 +262,16 @@ export function useServices() {
   const fetchDetails = async () => {
     setLoading(true);
     try {
-      const [redisRes, postgresRes, minioRes, qdrantRes, mongodbRes] = await Promise.all([
-        fetch(`${API_BASE}/services/redis`),
-        fetch(`${API_BASE}/services/postgres`),
-        fetch(`${API_BASE}/services/minio`),
-        fetch(`${API_BASE}/services/qdrant`),
-        fetch(`${API_BASE}/services/mongodb`)
-      ]);
-
-      const redisData = await redisRes.json();
-      const postgresData = await postgresRes.json();
-      const minioData = await minioRes.json();
-      const qdrantData = await qdrantRes.json();
-      const mongodbData = await mongodbRes.json();
-
-      setRedisInfo(redisData);
-      setPostgresInfo(postgresData);
-      setMinioInfo(minioData);
-      setQdrantInfo(qdrantData);
-      setMongodbInfo(mongodbData);
+      // One aggregate request; slow services come back as "timeout" instead of holding the page
+      const res = await fetch(`${API_BASE}/services/overview`);
+      if (!res.ok) throw new Error("Failed to fetch service details");
+      const data: ServicesOverview = await res.json();
+
+      setRedisInfo(data.services.redis);
+      setPostgresInfo(data.services.postgres);
+      setMinioInfo(data.services.minio);
+      setQdrantInfo(data.services.qdrant);
+      setMongodbInfo(data.services.mongodb);
       setError(null);
     } catch (err) {
       setError(err instanceof Error ? err.message : "An error occurred fetching details");
@@ -127,12 +282,10 @@ export function useServices() {
 
   const dropPostgresDatabase = async (dbName: string) => {
     try {
-      const res = await fetch(`${API_BASE}/services/postgres/databases/${dbName}`, {
-        method: "DELETE",
-      });
-      if (!res.ok) throw new Error("Failed to drop database");
+      // Drops run as background jobs; wait for the job rather than the request
+      const job = await runJob(`${API_BASE}/services/postgres/databases/${dbName}`, "Failed to drop database");
       await fetchDetails();
-      return await res.json();
+      return job.result;
     } catch (err) {
       console.error("Error dropping PostgreSQL database:", err);
       throw err;
@@ -141,12 +294,10 @@ export function useServices() {
 
   const dropMinioBucket = async (bucketName: string) => {
     try {
-      const res = await fetch(`${API_BASE}/services/minio/buckets/${bucketName}`, {
-        method: "DELETE",
-      });
-      if (!res.ok) throw new Error("Failed to drop bucket");
+      // Drops run as background jobs; wait for the job rather than the request
+      const job = await runJob(`${API_BASE}/services/minio/buckets/${bucketName}`, "Failed to drop bucket");
       await fetchDetails();
-      return await res.json();
+      return job.result;
     } catch (err) {
       console.error("Error dropping MinIO bucket:", err);
       throw err;
@@ -155,12 +306,10 @@ export function useServices() {
 
   const dropMongoDatabase = async (dbName: string) => {
     try {
-      const res = await fetch(`${API_BASE}/services/mongodb/databases/${dbName}`, {
-        method: "DELETE",
-      });
-      if (!res.ok) throw new Error("Failed to drop database");
+      // Drops run as background jobs; wait for the job rather than the request
+      const job = await runJob(`${API_BASE}/services/mongodb/databases/${dbName}`, "Failed to drop database");
       await fetchDetails();
-      return await res.json();
+      return job.result;
     } catch (err) {
       console.error("Error dropping MongoDB database:", err);
       throw err;
@@ -185,13 +334,36 @@ export function useServices() {
     fetchHealth();
     fetchDetails();
 
-    const healthInterval = setInterval(fetchHealth, 5000); // Poll health every 5 seconds
-    const detailsInterval = setInterval(fetchDetails, 60000); // Refresh heavy details only every minute
+    // The server pushes container changes and snapshot diffs; EventSource reconnects on its own
+    const source = new EventSource(`${API_BASE}/events`);
+    const setters = {
+      redis: setRedisInfo,
+      postgres: setPostgresInfo,
+      minio: setMinioInfo,
+      qdrant: setQdrantInfo,
+      mongodb: setMongodbInfo,
+    } as const;
 
-    return () => {
-      clearInterval(healthInterval);
-      clearInterval(detailsInterval);
-    };
+    source.addEventListener("containers", (e) => {
+      setServices(JSON.parse((e as MessageEvent).data));
+    });
+    source.addEventListener("container", (e) => {
+      const { name, container }: ContainerEvent = JSON.parse((e as MessageEvent).data);
+      setServices((prev) => {
+        const current = Array.isArray(prev) ? prev : [];
+        if (!container) return current.filter((s) => s.name !== name);
+        const exists = current.some((s) => s.name === name);
+        return exists ? current.map((s) => (s.name === name ? container : s)) : [...current, container];
+      });
+    });
+    source.addEventListener("snapshot", (e) => {
+      const event: SnapshotEvent = JSON.parse((e as MessageEvent).data);
+      const setter = setters[event.service] as (update: (prev: unknown) => unknown) => void;
+      setter?.((prev) => applySnapshotEvent(prev, event));
+    });
+    source.onopen = () => setError(null);
+
+    return () => source.close();
   }, []);
 
   return {